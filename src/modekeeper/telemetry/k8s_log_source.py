@@ -20,6 +20,12 @@ _RFC3339_NANO_RE = re.compile(
 )
 _TELEMETRY_ANNOTATION = "modekeeper/telemetry"
 _STDOUT_JSONL_MODE = "stdout-jsonl"
+# Fixed stdout-jsonl schema, resolved once at import instead of per parsed line.
+_STDOUT_TS_KEYS = ("ts", "t", "timestamp")
+_STDOUT_STEP_KEYS = ("step",)
+_STDOUT_THROUGHPUT_KEYS = ("throughput", "samples_per_sec", "samples_sec")
+_STDOUT_LOSS_KEYS = ("loss",)
+_STDOUT_STEP_TIME_KEYS = ("step_time_ms", "step_time", "latency_ms")
 
 def _to_float(value: object) -> float | None:
     if value is None:
@@ -41,14 +47,16 @@ def _to_float(value: object) -> float | None:
 
 
 def _run_cmd(argv: list[str], timeout_s: float = 20.0) -> dict:
+    # stdout stays as bytes: json.loads parses bytes directly, so the (potentially large)
+    # log payload is only decoded where a text parser actually needs it.
     try:
-        cp = subprocess.run(argv, capture_output=True, text=True, timeout=timeout_s)
+        cp = subprocess.run(argv, capture_output=True, timeout=timeout_s)
         return {
             "argv": argv,
             "ok": cp.returncode == 0,
             "rc": cp.returncode,
             "stdout": cp.stdout,
-            "stderr": cp.stderr,
+            "stderr": _decode_text(cp.stderr),
             "error": None,
         }
     except FileNotFoundError as e:
@@ -56,7 +64,7 @@ def _run_cmd(argv: list[str], timeout_s: float = 20.0) -> dict:
             "argv": argv,
             "ok": False,
             "rc": 127,
-            "stdout": "",
+            "stdout": b"",
             "stderr": str(e),
             "error": "not_found",
         }
@@ -65,13 +73,24 @@ def _run_cmd(argv: list[str], timeout_s: float = 20.0) -> dict:
             "argv": argv,
             "ok": False,
             "rc": 124,
-            "stdout": e.stdout or "",
-            "stderr": e.stderr or "",
+            "stdout": e.stdout or b"",
+            "stderr": _decode_text(e.stderr),
             "error": "timeout",
         }
 
 
+def _decode_text(data: bytes | str | None) -> str:
+    if data is None:
+        return ""
+    if isinstance(data, str):
+        return data
+    return data.decode("utf-8", errors="replace")
+
+
 def _parse_kv_line(line: str) -> dict[str, str]:
+    # Every _KV_RE match contains "=", so most plain log lines never reach the regex engine.
+    if "=" not in line:
+        return {}
     return {m.group("key"): m.group("value") for m in _KV_RE.finditer(line)}
 
 
@@ -130,19 +149,21 @@ def _extract_duration_from_text(text: str) -> float | None:
     return None
 
 
-def _parse_payload(payload: str) -> dict | None:
+def _parse_payload(payload: str | bytes) -> dict | None:
     if not payload:
         return None
     try:
         record = json.loads(payload)
         if isinstance(record, dict):
             return record
-    except json.JSONDecodeError:
+    except (json.JSONDecodeError, UnicodeDecodeError):
         pass
+    if isinstance(payload, bytes):
+        payload = _decode_text(payload)
     kvs = _parse_kv_line(payload)
     return kvs or None
 
-def _pick(record: dict, keys: list[str]) -> object | None:
+def _pick(record: dict, keys: tuple[str, ...] | list[str]) -> object | None:
     for k in keys:
         if k in record:
             return record.get(k)
@@ -246,7 +267,7 @@ def parse_k8s_log_lines(lines: list[str]) -> list[TelemetrySample]:
     return samples
 
 
-def parse_k8s_stdout_jsonl(lines: list[str]) -> list[TelemetrySample]:
+def parse_k8s_stdout_jsonl(lines: list[str] | list[bytes]) -> list[TelemetrySample]:
     samples: list[TelemetrySample] = []
     for raw in lines:
         line = raw.strip()
@@ -255,9 +276,9 @@ def parse_k8s_stdout_jsonl(lines: list[str]) -> list[TelemetrySample]:
         record = _parse_payload(line)
         if not isinstance(record, dict):
             continue
-        ts_value = _pick(record, ["ts", "t", "timestamp"])
-        step_value = _pick(record, ["step"])
-        throughput_value = _pick(record, ["throughput", "samples_per_sec", "samples_sec"])
+        ts_value = _pick(record, _STDOUT_TS_KEYS)
+        step_value = _pick(record, _STDOUT_STEP_KEYS)
+        throughput_value = _pick(record, _STDOUT_THROUGHPUT_KEYS)
         if ts_value is None or step_value is None or throughput_value is None:
             continue
         try:
@@ -268,12 +289,12 @@ def parse_k8s_stdout_jsonl(lines: list[str]) -> list[TelemetrySample]:
             continue
         if throughput <= 0:
             continue
-        loss_raw = _pick(record, ["loss"])
+        loss_raw = _pick(record, _STDOUT_LOSS_KEYS)
         try:
             loss = float(loss_raw) if loss_raw is not None and str(loss_raw).strip() != "" else None
         except Exception:
             loss = None
-        step_time_value = _pick(record, ["step_time_ms", "step_time", "latency_ms"])
+        step_time_value = _pick(record, _STDOUT_STEP_TIME_KEYS)
         if step_time_value is None:
             latency_ms = 1000.0 / throughput
         else:
@@ -329,7 +350,7 @@ class K8sLogSource(TelemetrySource):
         if res.get("rc") != 0:
             return None
         try:
-            payload = json.loads(res.get("stdout") or "{}")
+            payload = json.loads(res.get("stdout") or b"{}")
         except Exception:
             return None
         metadata = payload.get("metadata")
@@ -361,7 +382,7 @@ class K8sLogSource(TelemetrySource):
         if res.get("rc") != 0:
             return None, None, None
         try:
-            payload = json.loads(res.get("stdout") or "{}")
+            payload = json.loads(res.get("stdout") or b"{}")
         except Exception:
             return None, None, None
         items = payload.get("items")
@@ -440,15 +461,16 @@ class K8sLogSource(TelemetrySource):
                 self.samples_parsed = 0
                 return []
 
-            raw_text = res.get("stdout") or ""
-            for line in raw_text.splitlines(keepends=True):
-                recorder.write_line(line)
-            lines = raw_text.splitlines()
+            raw = res.get("stdout") or b""
+            if self.record_raw_path is not None:
+                for line in raw.splitlines(keepends=True):
+                    recorder.write_line(_decode_text(line))
+            lines = raw.splitlines()
             self.rows_read = len(lines)
             if telemetry_mode == _STDOUT_JSONL_MODE:
                 samples = parse_k8s_stdout_jsonl(lines)
             else:
-                samples = parse_k8s_log_lines(lines)
+                samples = parse_k8s_log_lines([_decode_text(line) for line in lines])
             if selected_pod_node_name:
                 for sample in samples:
                     if sample.node is None:
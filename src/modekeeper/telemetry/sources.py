@@ -20,25 +20,29 @@ class SyntheticSource(TelemetrySource):
     sample_interval_ms: int = 1000
 
     def read(self) -> list[TelemetrySample]:
-        random.seed(self.seed)
+        # A private generator yields the same sequence as random.seed(self.seed) without
+        # touching global state; local bindings keep attribute lookups out of the loop.
+        uniform = random.Random(self.seed).uniform
+        sin = math.sin
+        cos = math.cos
         samples: list[TelemetrySample] = []
         steps = max(1, self.duration_ms // self.sample_interval_ms)
         for i in range(steps):
             t_ms = i * self.sample_interval_ms
-            base_loss = 1.0 + 0.05 * math.sin(i / 5.0)
-            base_latency = 120.0 + 10.0 * math.sin(i / 7.0)
-            base_throughput = 1000.0 + 30.0 * math.cos(i / 6.0)
+            base_loss = 1.0 + 0.05 * sin(i / 5.0)
+            base_latency = 120.0 + 10.0 * sin(i / 7.0)
+            base_throughput = 1000.0 + 30.0 * cos(i / 6.0)
 
-            loss = base_loss + random.uniform(-0.02, 0.02)
-            latency = base_latency + random.uniform(-5.0, 5.0)
-            throughput = base_throughput + random.uniform(-20.0, 20.0)
+            loss = base_loss + uniform(-0.02, 0.02)
+            latency = base_latency + uniform(-5.0, 5.0)
+            throughput = base_throughput + uniform(-20.0, 20.0)
 
             if self.scenario == "drift":
                 loss += (i / steps) * 0.3
             elif self.scenario == "replica_overprovisioning":
                 # Deterministic proof-only profile: low/flat demand with visible drift signal.
                 loss += (i / steps) * 0.6
-                throughput = 220.0 + 8.0 * math.cos(i / 8.0) + random.uniform(-4.0, 4.0)
+                throughput = 220.0 + 8.0 * cos(i / 8.0) + uniform(-4.0, 4.0)
             elif self.scenario == "cpu_pressure":
                 # Deterministic proof-only profile: sustained pressure window with latency spikes.
                 if i > steps * 0.58:
@@ -55,7 +59,7 @@ class SyntheticSource(TelemetrySource):
             elif self.scenario == "straggler":
                 pass
 
-            worker_latencies = [latency + random.uniform(-5.0, 5.0) for _ in range(4)]
+            worker_latencies = [latency + uniform(-5.0, 5.0) for _ in range(4)]
             if self.scenario == "straggler" and i > steps * 0.4:
                 worker_latencies[-1] *= 2.2
 
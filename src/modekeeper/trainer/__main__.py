@@ -5,7 +5,9 @@ from __future__ import annotations
 import json
 import math
 import os
+import sys
 import time
+from dataclasses import dataclass
 from datetime import datetime, timezone
 
 from .knobs import parse_downward_annotations
@@ -23,6 +25,39 @@ def _read_knobs(path: str) -> dict[str, str]:
     return parse_downward_annotations(text)
 
 
+@dataclass(frozen=True)
+class _KnobsSnapshot:
+    stat_key: tuple[int, int, int] | None
+    knobs: dict[str, str]
+    sorted_knobs: dict[str, str]
+    knobs_kv: str
+
+
+def _stat_key(path: str) -> tuple[int, int, int] | None:
+    # The downward API swaps the file in via a symlink, so the inode changes on update;
+    # size catches rewrites that land within the same mtime tick.
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return (st.st_ino, st.st_size, st.st_mtime_ns)
+
+
+def _load_knobs_snapshot(path: str, previous: _KnobsSnapshot | None = None) -> _KnobsSnapshot:
+    """Return the knobs snapshot for ``path``, re-parsing only when its stat changed."""
+
+    stat_key = _stat_key(path)
+    if previous is not None and previous.stat_key == stat_key:
+        return previous
+    knobs = _read_knobs(path)
+    return _KnobsSnapshot(
+        stat_key=stat_key,
+        knobs=knobs,
+        sorted_knobs=_sorted_knobs(knobs),
+        knobs_kv=_knobs_kv(knobs),
+    )
+
+
 def _to_positive_int(value: str | None, default: int = 1) -> int:
     if value is None:
         return default
@@ -88,10 +123,11 @@ def main() -> int:
         default=_DEFAULT_LOOP_INTERVAL_S,
     )
     step = 0
+    snapshot: _KnobsSnapshot | None = None
 
     while True:
-        knobs = _read_knobs(annotations_path)
-        sorted_knobs = _sorted_knobs(knobs)
+        snapshot = _load_knobs_snapshot(annotations_path, snapshot)
+        knobs = snapshot.knobs
         now_s = int(time.time())
         ts = datetime.fromtimestamp(now_s, tz=timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
         step_time_ms = _step_time_ms(knobs, now_s)
@@ -104,10 +140,11 @@ def main() -> int:
             "throughput": throughput,
             "step_time_ms": step_time_ms,
             "annotations_file": annotations_path,
-            "knobs": sorted_knobs,
-            "knobs_kv": _knobs_kv(knobs),
+            "knobs": snapshot.sorted_knobs,
+            "knobs_kv": snapshot.knobs_kv,
         }
-        print(json.dumps(payload, separators=(",", ":")), flush=True)
+        sys.stdout.write(json.dumps(payload, separators=(",", ":")) + "\n")
+        sys.stdout.flush()
 
         time.sleep(loop_interval_s)
         step += 1
@@ -5,6 +5,7 @@ from __future__ import annotations
 import json
 import os
 import ssl
+import sys
 import time
 import urllib.error
 import urllib.parse
@@ -128,12 +129,10 @@ def main() -> int:
         try:
             pod_name, namespace = _discover_pod_ref()
             pod_obj = _fetch_pod(pod_name=pod_name, namespace=namespace)
-            knob_lines = _knob_lines(pod_obj)
-            if knob_lines:
-                for line in knob_lines:
-                    print(line, flush=True)
-            else:
-                print("modekeeper/knob.none=true", flush=True)
+            knob_lines = _knob_lines(pod_obj) or ["modekeeper/knob.none=true"]
+            # One write + flush per tick instead of a flushed print per knob line.
+            sys.stdout.write("\n".join(knob_lines) + "\n")
+            sys.stdout.flush()
         except Exception as exc:
             print(
                 f"ERROR modekeeper trainer chart pod-read pod={pod_name} namespace={namespace}: {exc}",
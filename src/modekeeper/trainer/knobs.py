@@ -5,6 +5,25 @@ from __future__ import annotations
 import ast
 
 
+def _unquote(raw_value: str) -> str | None:
+    """Unquote a double-quoted annotation value.
+
+    Values without escapes are sliced directly; only escaped values go through
+    ``ast.literal_eval``.
+    """
+
+    inner = raw_value[1:-1]
+    if len(raw_value) >= 2 and "\\" not in inner and '"' not in inner:
+        return inner
+    try:
+        value = ast.literal_eval(raw_value)
+    except (ValueError, SyntaxError):
+        return None
+    if not isinstance(value, str):
+        return None
+    return value
+
+
 def parse_downward_annotations(text: str, prefix: str = "modekeeper/knob.") -> dict[str, str]:
     """Parse a Downward API annotations file into a knob map.
 
@@ -24,11 +43,8 @@ def parse_downward_annotations(text: str, prefix: str = "modekeeper/knob.") -> d
             continue
         if not raw_value.startswith('"') or not raw_value.endswith('"'):
             continue
-        try:
-            value = ast.literal_eval(raw_value)
-        except (ValueError, SyntaxError):
-            continue
-        if not isinstance(value, str):
+        value = _unquote(raw_value)
+        if value is None:
             continue
         knob_key = key[len(prefix) :]
         if knob_key:
@@ -0,0 +1,61 @@
+"""JSON/JSONL helpers shared by the test suite."""
+
+from __future__ import annotations
+
+import json
+import mmap
+from collections.abc import Iterator
+from pathlib import Path
+from typing import Any
+
+try:
+    import orjson
+except Exception:
+    orjson = None
+
+
+def loads(data: bytes | str) -> Any:
+    """Parse a JSON document, using orjson when it is installed."""
+
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps(payload: object, *, indent: bool = False, sort_keys: bool = False) -> bytes:
+    """Serialize ``payload`` to UTF-8 JSON bytes, using orjson when it is installed."""
+
+    if orjson is not None:
+        option = (orjson.OPT_INDENT_2 if indent else 0) | (orjson.OPT_SORT_KEYS if sort_keys else 0)
+        return orjson.dumps(payload, option=option)
+    text = json.dumps(
+        payload,
+        indent=2 if indent else None,
+        sort_keys=sort_keys,
+        ensure_ascii=False,
+        separators=None if indent else (",", ":"),
+    )
+    return text.encode("utf-8")
+
+
+def iter_lines(path: Path) -> Iterator[bytes]:
+    """Yield the non-blank lines of ``path`` as bytes, scanning a read-only memory map.
+
+    Lines are located with ``mmap.find`` so the file is never decoded or split into a
+    full list of lines up front.
+    """
+
+    with path.open("rb") as handle:
+        if handle.seek(0, 2) == 0:
+            return
+        with mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            size = len(mm)
+            start = 0
+            while start < size:
+                end = mm.find(b"\n", start)
+                if end == -1:
+                    end = size
+                line = mm[start:end]
+                if line.strip():
+                    yield line
+                start = end + 1
@@ -0,0 +1,35 @@
+"""Deterministic Ed25519 license signing helpers shared by the test suite."""
+
+from __future__ import annotations
+
+import base64
+from functools import lru_cache
+
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric.ed25519 import Ed25519PrivateKey
+
+from modekeeper.license.canonical import canonical_json_bytes
+
+
+@lru_cache(maxsize=1)
+def deterministic_private_key() -> Ed25519PrivateKey:
+    """Return the fixed test signing key (seed ``bytes(range(32))``)."""
+
+    return Ed25519PrivateKey.from_private_bytes(bytes(range(32)))
+
+
+def public_key_b64(private_key: Ed25519PrivateKey) -> str:
+    """Base64 of the raw public key, as stored in ``license_public_keys.json``."""
+
+    raw = private_key.public_key().public_bytes(
+        encoding=serialization.Encoding.Raw,
+        format=serialization.PublicFormat.Raw,
+    )
+    return base64.b64encode(raw).decode("ascii")
+
+
+def sign_license(payload: dict, private_key: Ed25519PrivateKey | None = None) -> str:
+    """Sign the canonical JSON of ``payload``; defaults to the deterministic test key."""
+
+    key = private_key if private_key is not None else deterministic_private_key()
+    return base64.b64encode(key.sign(canonical_json_bytes(payload))).decode("ascii")
@@ -0,0 +1,137 @@
+"""Persistent ``mk`` CLI worker used by the ``mk_run`` fixture in conftest.py.
+
+The worker imports ``modekeeper.cli`` once and then serves one JSON request per line on
+stdin (``{"argv": [...], "env": {...}, "cwd": "..."}``), answering with one JSON reply per
+line on stdout (``{"rc": ..., "stdout": "...", "stderr": "..."}``). Each request runs in a
+fork of the warm worker, so a test session pays interpreter startup and import cost once
+while every invocation still gets a fresh process.
+
+``run_cli`` is also used directly by the in-process ``mk_invoke`` fixture.
+"""
+
+from __future__ import annotations
+
+import io
+import json
+import os
+import signal
+import sys
+import tempfile
+import traceback
+
+from modekeeper.cli import main
+
+
+def _exit_code(code: object) -> int:
+    # Mirror how the interpreter turns ``raise SystemExit(code)`` into a process status.
+    if code is None:
+        return 0
+    if isinstance(code, int):
+        return code
+    print(code, file=sys.stderr)
+    return 1
+
+
+def _read_back(handle: io.BufferedIOBase) -> str:
+    handle.seek(0)
+    return handle.read().decode("utf-8", errors="replace")
+
+
+def run_cli(request: dict) -> dict:
+    """Run one ``mk`` invocation in this process and return its rc and captured output."""
+
+    argv = [str(arg) for arg in request.get("argv") or []]
+    env = request.get("env")
+    cwd = request.get("cwd")
+    capture_stdout = request.get("capture_stdout", True)
+
+    saved_env = dict(os.environ)
+    saved_cwd = os.getcwd()
+    saved_argv = sys.argv
+    saved_streams = (sys.stdout, sys.stderr)
+    saved_signals = {sig: signal.getsignal(sig) for sig in (signal.SIGINT, signal.SIGTERM)}
+    saved_fds = (os.dup(1), os.dup(2))
+
+    out_file = tempfile.TemporaryFile() if capture_stdout else open(os.devnull, "wb")
+    with out_file, tempfile.TemporaryFile() as err_file:
+        # Redirect at the fd level so output of child processes is captured as well.
+        os.dup2(out_file.fileno(), 1)
+        os.dup2(err_file.fileno(), 2)
+        sys.stdout = open(1, "w", encoding="utf-8", closefd=False)
+        sys.stderr = open(2, "w", encoding="utf-8", closefd=False)
+        try:
+            if env is not None:
+                os.environ.clear()
+                os.environ.update({str(k): str(v) for k, v in env.items()})
+            if cwd is not None:
+                os.chdir(cwd)
+            sys.argv = ["mk", *argv]
+            try:
+                rc = _exit_code(main(argv))
+            except SystemExit as exc:
+                rc = _exit_code(exc.code)
+            except BaseException:
+                traceback.print_exc()
+                rc = 1
+        finally:
+            sys.stdout.flush()
+            sys.stderr.flush()
+            sys.stdout, sys.stderr = saved_streams
+            os.dup2(saved_fds[0], 1)
+            os.dup2(saved_fds[1], 2)
+            os.close(saved_fds[0])
+            os.close(saved_fds[1])
+            for sig, handler in saved_signals.items():
+                signal.signal(sig, handler)
+            sys.argv = saved_argv
+            os.chdir(saved_cwd)
+            os.environ.clear()
+            os.environ.update(saved_env)
+        stdout = _read_back(out_file) if capture_stdout else ""
+        return {"rc": rc, "stdout": stdout, "stderr": _read_back(err_file)}
+
+
+def _run_forked(request: dict) -> dict:
+    # Serve each request from a fresh fork of this pre-imported process (forkserver style):
+    # startup stays warm while no CLI state can leak from one invocation into the next.
+    read_fd, write_fd = os.pipe()
+    pid = os.fork()
+    if pid == 0:
+        os.close(read_fd)
+        try:
+            with os.fdopen(write_fd, "wb") as reply:
+                reply.write(json.dumps(run_cli(request)).encode("utf-8"))
+        finally:
+            os._exit(0)
+    os.close(write_fd)
+    with os.fdopen(read_fd, "rb") as reply:
+        data = reply.read()
+    os.waitpid(pid, 0)
+    if not data:
+        return {"rc": 1, "stdout": "", "stderr": "mk worker child exited without a reply\n"}
+    return json.loads(data)
+
+
+def serve() -> int:
+    # Keep the protocol on private fds; fds 0/1 point at /dev/null so neither the CLI nor
+    # any process it spawns can read requests or interleave bytes into replies.
+    requests = os.fdopen(os.dup(0), "rb")
+    replies = os.fdopen(os.dup(1), "wb")
+    devnull = os.open(os.devnull, os.O_RDWR)
+    os.dup2(devnull, 0)
+    os.dup2(devnull, 1)
+    os.close(devnull)
+    sys.stdin = open(0, "r", encoding="utf-8", closefd=False)
+    sys.stdout = open(1, "w", encoding="utf-8", closefd=False)
+
+    for line in requests:
+        if not line.strip():
+            continue
+        reply = _run_forked(json.loads(line))
+        replies.write(json.dumps(reply).encode("utf-8") + b"\n")
+        replies.flush()
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(serve())
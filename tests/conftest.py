@@ -9,16 +9,71 @@ if _SRC.is_dir():
         _sys.path.insert(0, _p)
 # --- end bootstrap ---
 
+import hashlib
+import json
+import os
+import shutil
+import subprocess
 import sys
 import tempfile
+from collections.abc import Callable, Iterator, Mapping
 from pathlib import Path
+from types import MappingProxyType
 
 import pytest
+from _license_keys import deterministic_private_key, public_key_b64, sign_license
+from _mk_worker import run_cli
 
+_REPO_ROOT = Path(__file__).resolve().parents[1]
+_QUICKSTART_OBSERVE = (
+    _REPO_ROOT / "docs" / "evidence" / "mk092_quickstart" / "observe_mixed_env.jsonl"
+)
+_KUBECTL_DATA = Path(__file__).resolve().parent / "data" / "kubectl"
+_MK_WORKER = Path(__file__).resolve().parent / "_mk_worker.py"
+# Python rather than bash: parameters arrive through the environment, so one script file
+# serves every test instead of templating a new one per scenario.
+_FAKE_KUBECTL = f"""#!{sys.executable} -IS
+import os
+import sys
+
+args = sys.argv[1:]
+env = os.environ
+if env.get("FAKE_KUBECTL_LOG"):
+    with open(env["FAKE_KUBECTL_LOG"], "a", encoding="utf-8") as log:
+        log.write(" ".join(args) + "\\n")
+
+if env.get("FAKE_KUBECTL_ROUTES"):
+    import json
+
+    with open(env["FAKE_KUBECTL_ROUTES"], encoding="utf-8") as fh:
+        routes = json.load(fh)
+    line = " ".join(args)
+    exact = env.get("FAKE_KUBECTL_EXACT") == "1"
+    for prefix, (rc, out, err) in routes.items():
+        if line == prefix or (not exact and line.startswith(prefix + " ")):
+            sys.stdout.write(out + "\\n" if out else "")
+            sys.stderr.write(err + "\\n" if err else "")
+            sys.exit(rc)
+
+if args[:1] == ["logs"] and "FAKE_KUBECTL_LOGS" in env:
+    sys.stdout.write(env["FAKE_KUBECTL_LOGS"] + "\\n")
+    sys.exit(0)
+
+deployment = env.get("FAKE_KUBECTL_DEPLOYMENT")
+if deployment and "FAKE_KUBECTL_DEPLOY_JSON" in env:
+    namespace = env.get("FAKE_KUBECTL_NAMESPACE", "default")
+    if args == ["-n", namespace, "get", "deployment/" + deployment, "-o", "json"]:
+        sys.stdout.write(env["FAKE_KUBECTL_DEPLOY_JSON"] + "\\n")
+        sys.exit(0)
+
+sys.stderr.write("unexpected args: " + " ".join(args) + "\\n")
+sys.exit(1)
+"""
 
-@pytest.fixture
+
+@pytest.fixture(scope="session")
 def mk_path() -> Path:
-    repo_root = Path(__file__).resolve().parents[1]
+    repo_root = _REPO_ROOT
     local = repo_root / ".venv" / "bin" / "mk"
     if local.exists():
         return local
@@ -36,3 +91,253 @@ exec \"{sys.executable}\" -c 'import sys; from modekeeper.cli import main; raise
     )
     shim.chmod(0o755)
     return shim
+
+
+@pytest.fixture(scope="session")
+def mk(mk_path: Path) -> str:
+    """``mk`` entrypoint as a ready-to-use argv string."""
+    return str(mk_path)
+
+
+@pytest.fixture(scope="session")
+def base_env() -> Mapping[str, str]:
+    """Read-only snapshot of the session environment; overlay with ``base_env | {...}``."""
+    return MappingProxyType(dict(os.environ))
+
+
+def _completed(argv: list[str], reply: dict) -> subprocess.CompletedProcess[str]:
+    return subprocess.CompletedProcess(["mk", *argv], reply["rc"], reply["stdout"], reply["stderr"])
+
+
+class _MkWorker:
+    """Client for a long-lived ``_mk_worker.py`` process that runs ``mk`` invocations."""
+
+    def __init__(self) -> None:
+        self._proc: subprocess.Popen[bytes] | None = None
+
+    def _start(self) -> subprocess.Popen[bytes]:
+        env = dict(os.environ)
+        env["PYTHONPATH"] = os.pathsep.join(
+            part for part in (str(_REPO_ROOT / "src"), env.get("PYTHONPATH")) if part
+        )
+        return subprocess.Popen(
+            [sys.executable, str(_MK_WORKER)],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            env=env,
+            bufsize=0,
+        )
+
+    def run(
+        self,
+        args: list[str],
+        *,
+        env: dict[str, str] | None = None,
+        cwd: Path | str | None = None,
+        capture_stdout: bool = True,
+    ) -> subprocess.CompletedProcess[str]:
+        if self._proc is None or self._proc.poll() is not None:
+            self._proc = self._start()
+        assert self._proc.stdin is not None and self._proc.stdout is not None
+        argv = [str(arg) for arg in args]
+        request = {
+            "argv": argv,
+            "env": dict(os.environ) if env is None else env,
+            "cwd": str(cwd) if cwd is not None else os.getcwd(),
+            "capture_stdout": capture_stdout,
+        }
+        self._proc.stdin.write(json.dumps(request).encode("utf-8") + b"\n")
+        line = self._proc.stdout.readline()
+        if not line:
+            self._proc = None
+            raise RuntimeError(f"mk worker exited while running: mk {' '.join(argv)}")
+        return _completed(argv, json.loads(line))
+
+    def close(self) -> None:
+        if self._proc is None:
+            return
+        assert self._proc.stdin is not None
+        self._proc.stdin.close()
+        try:
+            self._proc.wait(timeout=10)
+        except subprocess.TimeoutExpired:
+            self._proc.kill()
+        self._proc = None
+
+
+@pytest.fixture(scope="session")
+def mk_worker() -> Iterator[_MkWorker]:
+    worker = _MkWorker()
+    yield worker
+    worker.close()
+
+
+@pytest.fixture(scope="session")
+def mk_run(mk: str, mk_worker: _MkWorker):
+    """Run ``mk <args>`` and return a ``CompletedProcess[str]`` with captured output.
+
+    Invocations go through the session's persistent CLI worker. Set
+    ``MODEKEEPER_TEST_INPROC=0`` to spawn a fresh ``mk`` process per call instead.
+    Pass ``capture_stdout=False`` when a test never reads stdout; it is discarded and
+    ``cp.stdout`` is empty.
+    """
+
+    def _run(
+        args: list[str],
+        *,
+        env: dict[str, str] | None = None,
+        cwd: Path | str | None = None,
+        capture_stdout: bool = True,
+    ) -> subprocess.CompletedProcess[str]:
+        if os.environ.get("MODEKEEPER_TEST_INPROC", "1") == "0":
+            # Python fds are non-inheritable by default, so close_fds=False leaks nothing; it
+            # lets subprocess use posix_spawn instead of fork/exec when no cwd is given.
+            cp = subprocess.run(
+                [mk, *args],
+                text=True,
+                stdin=subprocess.DEVNULL,
+                stdout=subprocess.PIPE if capture_stdout else subprocess.DEVNULL,
+                stderr=subprocess.PIPE,
+                cwd=str(cwd) if cwd is not None else None,
+                env=env,
+                close_fds=False,
+            )
+            if not capture_stdout:
+                cp.stdout = ""
+            return cp
+        return mk_worker.run(args, env=env, cwd=cwd, capture_stdout=capture_stdout)
+
+    return _run
+
+
+@pytest.fixture(scope="session")
+def mk_invoke():
+    """Run ``mk <args>`` inside the test process via ``modekeeper.cli.main``.
+
+    Suitable for commands that do not depend on external executables; env, cwd and signal
+    handlers are restored after each call. ``capture_stdout=False`` discards stdout as in
+    ``mk_run``.
+    """
+
+    def _invoke(
+        args: list[str],
+        *,
+        env: dict[str, str] | None = None,
+        cwd: Path | str | None = None,
+        capture_stdout: bool = True,
+    ) -> subprocess.CompletedProcess[str]:
+        argv = [str(arg) for arg in args]
+        reply = run_cli(
+            {
+                "argv": argv,
+                "env": env,
+                "cwd": str(cwd) if cwd is not None else None,
+                "capture_stdout": capture_stdout,
+            }
+        )
+        return _completed(argv, reply)
+
+    return _invoke
+
+
+@pytest.fixture(scope="session")
+def signed_license_bundle() -> dict[str, str]:
+    """Signed ``license.json`` and matching ``license_public_keys.json`` texts (kid ``dev-kid``)."""
+
+    payload = {
+        "schema_version": "license.v1",
+        "org": "Acme",
+        "issued_at": 1700000000,
+        "expires_at": 4102444800,
+        "entitlements": ["observe", "apply"],
+        "kid": "dev-kid",
+    }
+    signature = sign_license(payload)
+    public_keys = {"dev-kid": public_key_b64(deterministic_private_key())}
+    return {
+        "license_json_str": json.dumps(
+            {**payload, "signature": signature}, indent=2, sort_keys=True, ensure_ascii=False
+        )
+        + "\n",
+        "pubkeys_json_str": json.dumps(public_keys, indent=2, sort_keys=True) + "\n",
+    }
+
+
+@pytest.fixture(scope="session")
+def fake_kubectl(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Session-wide fake kubectl configured through ``FAKE_KUBECTL_*`` variables.
+
+    - ``FAKE_KUBECTL_LOG``: append each invocation's argv to this file.
+    - ``FAKE_KUBECTL_ROUTES``: JSON file mapping an argv prefix to ``[rc, stdout, stderr]``;
+      see ``fake_kubectl_factory``.
+    - ``FAKE_KUBECTL_EXACT=1``: a route must match the whole argv, not just a prefix.
+    - ``FAKE_KUBECTL_LOGS``: text printed for ``kubectl logs ...``.
+    - ``FAKE_KUBECTL_NAMESPACE`` / ``FAKE_KUBECTL_DEPLOYMENT`` / ``FAKE_KUBECTL_DEPLOY_JSON``:
+      JSON printed for ``kubectl -n <ns> get deployment/<name> -o json``.
+
+    Any other call is rejected with exit code 1.
+    """
+
+    path = tmp_path_factory.mktemp("fake-kubectl") / "kubectl"
+    path.write_text(_FAKE_KUBECTL, encoding="utf-8")
+    path.chmod(0o755)
+    return path
+
+
+@pytest.fixture(scope="session")
+def fake_kubectl_factory(
+    fake_kubectl: Path, tmp_path_factory: pytest.TempPathFactory
+) -> Callable[..., dict[str, str]]:
+    """Build env overlays that point ``KUBECTL`` at the shared fake with a route table.
+
+    Routes map a space-joined argv prefix to ``(rc, stdout, stderr)``; pass ``exact=True``
+    to require each call's full argv to equal a route key. Each distinct table is written
+    once per session, keyed by its content hash.
+    """
+
+    routes_dir = tmp_path_factory.mktemp("fake-kubectl-routes")
+
+    def factory(
+        routes: Mapping[str, tuple[int, str, str]], *, exact: bool = False
+    ) -> dict[str, str]:
+        data = json.dumps(routes).encode("utf-8")
+        path = routes_dir / f"{hashlib.sha256(data).hexdigest()[:16]}.json"
+        if not path.exists():
+            path.write_bytes(data)
+        env = {"KUBECTL": str(fake_kubectl), "FAKE_KUBECTL_ROUTES": str(path)}
+        if exact:
+            env["FAKE_KUBECTL_EXACT"] = "1"
+        return env
+
+    return factory
+
+
+@pytest.fixture(scope="session")
+def fake_kubectl_multi_object() -> Path:
+    """Committed fake kubectl that passes verify checks for ns1/dep1 and ns2/dep2."""
+    return _KUBECTL_DATA / "multi_object.sh"
+
+
+@pytest.fixture(scope="session")
+def tiny_plan(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Read-only single-target plan (ns1/dep1, replicas 2) shared by apply-gate tests."""
+    path = tmp_path_factory.mktemp("plans") / "plan.json"
+    path.write_bytes(b'[{"namespace":"ns1","name":"dep1","patch":{"spec":{"replicas":2}}}]\n')
+    return path
+
+
+@pytest.fixture(scope="session")
+def quickstart_observe(tmp_path_factory: pytest.TempPathFactory) -> Iterator[Path]:
+    """Session copy of the mk092 quickstart observe JSONL, on tmpfs when available."""
+
+    shm = Path("/dev/shm")
+    if shm.is_dir() and os.access(shm, os.W_OK):
+        with tempfile.TemporaryDirectory(prefix="mk-observe-", dir=shm) as tmp:
+            path = Path(tmp) / _QUICKSTART_OBSERVE.name
+            shutil.copyfile(_QUICKSTART_OBSERVE, path)
+            yield path
+        return
+
+    path = tmp_path_factory.mktemp("quickstart-observe") / _QUICKSTART_OBSERVE.name
+    shutil.copyfile(_QUICKSTART_OBSERVE, path)
+    yield path
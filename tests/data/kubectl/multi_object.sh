@@ -0,0 +1,58 @@
+#!/usr/bin/env bash
+set -Eeuo pipefail
+
+case "$*" in
+  "config current-context"*)
+    echo "fake-context"
+    ;;
+  "version --client -o json"*)
+    echo '{"clientVersion":{"gitVersion":"v1.30.0"}}'
+    ;;
+  "version -o json"*)
+    echo '{"serverVersion":{"gitVersion":"v1.29.0"}}'
+    ;;
+  "get namespace/ns1 -o name"*)
+    echo "namespace/ns1"
+    ;;
+  "get namespace/ns2 -o name"*)
+    echo "namespace/ns2"
+    ;;
+  "-n ns1 get deployment/dep1 -o name"*)
+    echo "deployment.apps/dep1"
+    ;;
+  "-n ns2 get deployment/dep2 -o name"*)
+    echo "deployment.apps/dep2"
+    ;;
+  "-n "*" auth can-i "*)
+    echo "yes"
+    ;;
+  "-n "*" patch "*)
+    case "$*" in
+      *"--dry-run=server"*)
+        echo '{"kind":"Deployment","metadata":{"name":"dry-run"}}'
+        exit 0
+        ;;
+    esac
+
+    if [[ -n "${PATCH_COUNTER_PATH:-}" ]]; then
+      count=0
+      if [[ -f "${PATCH_COUNTER_PATH}" ]]; then
+        count="$(cat "${PATCH_COUNTER_PATH}")"
+      fi
+      count=$((count + 1))
+      echo "${count}" > "${PATCH_COUNTER_PATH}"
+
+      fail_on="${FAIL_PATCH_CALL:-0}"
+      if [[ "${fail_on}" != "0" && "${count}" -eq "${fail_on}" ]]; then
+        echo "forced apply failure on call ${count}" >&2
+        exit 7
+      fi
+    fi
+
+    echo "patched"
+    ;;
+  *)
+    echo "unexpected args: $*" >&2
+    exit 1
+    ;;
+esac
@@ -5,11 +5,11 @@ from pathlib import Path
 from modekeeper.cli import _build_assessment_fields
 
 
-def _run(mk: Path, args: list[str]) -> subprocess.CompletedProcess[str]:
-    return subprocess.run([str(mk), *args], text=True, capture_output=True, check=False)
+def _run(mk: str, args: list[str]) -> subprocess.CompletedProcess[str]:
+    return subprocess.run([mk, *args], text=True, capture_output=True, check=False)
 
 
-def test_eval_file_reports_insufficient_evidence_for_low_samples(tmp_path: Path, mk_path: Path) -> None:
+def test_eval_file_reports_insufficient_evidence_for_low_samples(tmp_path: Path, mk: str) -> None:
     observe_path = tmp_path / "observe.jsonl"
     observe_path.write_text(
         "\n".join(
@@ -24,7 +24,7 @@ def test_eval_file_reports_insufficient_evidence_for_low_samples(tmp_path: Path,
     out_dir = tmp_path / "eval_out"
 
     cp = _run(
-        mk_path,
+        mk,
         [
             "eval",
             "file",
@@ -51,7 +51,7 @@ def test_eval_file_reports_insufficient_evidence_for_low_samples(tmp_path: Path,
     assert "coverage_ok: False" in summary
 
 
-def test_closed_loop_watch_surfaces_assessment_fields(tmp_path: Path, mk_path: Path) -> None:
+def test_closed_loop_watch_surfaces_assessment_fields(tmp_path: Path, mk: str) -> None:
     observe_path = tmp_path / "observe.jsonl"
     observe_path.write_text(
         "\n".join(
@@ -68,7 +68,7 @@ def test_closed_loop_watch_surfaces_assessment_fields(tmp_path: Path, mk_path: P
     out_dir = tmp_path / "watch_out"
 
     cp = _run(
-        mk_path,
+        mk,
         [
             "closed-loop",
             "watch",
@@ -102,7 +102,7 @@ def test_closed_loop_watch_surfaces_assessment_fields(tmp_path: Path, mk_path: P
     assert "coverage_ok: True" in summary
 
 
-def test_handoff_pack_includes_assessment_fields(tmp_path: Path, mk_path: Path) -> None:
+def test_handoff_pack_includes_assessment_fields(tmp_path: Path, mk: str) -> None:
     in_dir = tmp_path / "in"
     (in_dir / "preflight").mkdir(parents=True)
     (in_dir / "eval").mkdir(parents=True)
@@ -138,7 +138,7 @@ def test_handoff_pack_includes_assessment_fields(tmp_path: Path, mk_path: Path)
     )
 
     out_dir = tmp_path / "out"
-    cp = _run(mk_path, ["export", "handoff-pack", "--in", str(in_dir), "--out", str(out_dir)])
+    cp = _run(mk, ["export", "handoff-pack", "--in", str(in_dir), "--out", str(out_dir)])
     assert cp.returncode == 0, cp.stderr
 
     manifest = json.loads((out_dir / "handoff_manifest.json").read_text(encoding="utf-8"))
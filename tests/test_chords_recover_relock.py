@@ -1,6 +1,7 @@
-import json
 from pathlib import Path
 
+from _jsonl import iter_lines, loads
+
 from modekeeper.knobs import ActuatorRegistry, Knob
 from modekeeper.policy.actions import Action
 from modekeeper.policy.rules import ChordPlannerState, propose_actions
@@ -9,11 +10,7 @@ from modekeeper.safety.guards import Guardrails
 
 
 def _read_events(path: Path) -> list[dict]:
-    return [
-        json.loads(line)
-        for line in path.read_text(encoding="utf-8").splitlines()
-        if line.strip()
-    ]
+    return [loads(line) for line in iter_lines(path)]
 
 
 def _registry() -> ActuatorRegistry:
@@ -1,37 +1,23 @@
-import json
-import os
-import subprocess
+from collections.abc import Mapping
 from pathlib import Path
 
+from _jsonl import loads
 
-def _write_fake_kubectl(path: Path, log_path: Path) -> None:
-    script = f"""#!/usr/bin/env bash
-set -Eeuo pipefail
 
-echo "$*" >> "{log_path}"
-
-echo "unexpected args: $*" >&2
-exit 1
-"""
-    path.write_text(script, encoding="utf-8")
-    path.chmod(0o755)
-
-
-def test_closed_loop_report_artifacts_apply_paths_are_pro_gated(tmp_path: Path, mk_path: Path) -> None:
+def test_closed_loop_report_artifacts_apply_paths_are_pro_gated(
+    tmp_path: Path, mk_run, fake_kubectl: Path, base_env: Mapping[str, str]
+) -> None:
     out_dir = tmp_path / "closed_loop_out"
     kubectl_log = tmp_path / "kubectl.log"
-    kubectl = tmp_path / "kubectl"
-    _write_fake_kubectl(kubectl, kubectl_log)
-    env = {
-        **os.environ,
+    env = base_env | {
         "MODEKEEPER_KILL_SWITCH": "1",
         "MODEKEEPER_PAID": "1",
         "MODEKEEPER_INTERNAL_OVERRIDE": "1",
-        "KUBECTL": str(kubectl),
+        "KUBECTL": str(fake_kubectl),
+        "FAKE_KUBECTL_LOG": str(kubectl_log),
     }
-    cp = subprocess.run(
+    cp = mk_run(
         [
-            str(mk_path),
             "closed-loop",
             "run",
             "--apply",
@@ -42,29 +28,25 @@ def test_closed_loop_report_artifacts_apply_paths_are_pro_gated(tmp_path: Path,
             "--out",
             str(out_dir),
         ],
-        check=False,
-        capture_output=True,
-        text=True,
         env=env,
     )
     assert cp.returncode == 2
     assert cp.stderr.strip() == "ERROR: MODEKEEPER_KILL_SWITCH=1 blocks apply/mutate operations"
 
-    latest = json.loads((out_dir / "closed_loop_latest.json").read_text(encoding="utf-8"))
+    latest = loads((out_dir / "closed_loop_latest.json").read_bytes())
     assert latest.get("apply_requested") is True
     assert latest.get("apply_blocked_reason") == "kill_switch_active"
-    apply_latest = json.loads((out_dir / "k8s_apply_latest.json").read_text(encoding="utf-8"))
+    apply_latest = loads((out_dir / "k8s_apply_latest.json").read_bytes())
     assert apply_latest.get("block_reason") == "kill_switch_active"
 
     if kubectl_log.exists():
         assert "--patch" not in kubectl_log.read_text(encoding="utf-8")
 
 
-def test_closed_loop_writes_k8s_plan(tmp_path: Path, mk_path: Path) -> None:
+def test_closed_loop_writes_k8s_plan(tmp_path: Path, mk_run) -> None:
     out_dir = tmp_path / "closed_loop_out"
-    subprocess.run(
+    cp = mk_run(
         [
-            str(mk_path),
             "closed-loop",
             "run",
             "--scenario",
@@ -76,13 +58,12 @@ def test_closed_loop_writes_k8s_plan(tmp_path: Path, mk_path: Path) -> None:
             "--out",
             str(out_dir),
         ],
-        check=True,
-        capture_output=True,
-        text=True,
+        capture_stdout=False,
     )
+    assert cp.returncode == 0, cp.stderr
 
     plan_path = out_dir / "k8s_plan.json"
     assert plan_path.exists()
-    plan = json.loads(plan_path.read_text(encoding="utf-8"))
+    plan = loads(plan_path.read_bytes())
     assert isinstance(plan, list)
     assert len(plan) >= 1
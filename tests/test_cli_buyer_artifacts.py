@@ -1,25 +1,22 @@
-import json
-import subprocess
+import os
+import re
 from pathlib import Path
 
+from _jsonl import dumps, loads
+
+_TIMESTAMPED_JSON_RE = re.compile(r"\d{8}_\d{6}\.json")
 
-def _run(mk: Path, args: list[str]) -> subprocess.CompletedProcess[str]:
-    return subprocess.run(
-        [str(mk), *args],
-        text=True,
-        capture_output=True,
-    )
+
+def _dir_entries(path: Path) -> set[str]:
+    return {entry.name for entry in os.scandir(path)}
 
 
 def _write_json(path: Path, payload: dict) -> None:
     path.parent.mkdir(parents=True, exist_ok=True)
-    path.write_text(
-        json.dumps(payload, indent=2, ensure_ascii=False, sort_keys=True) + "\n",
-        encoding="utf-8",
-    )
+    path.write_bytes(dumps(payload, indent=True, sort_keys=True) + b"\n")
 
 
-def test_cli_buyer_reports_top_level_commands(tmp_path: Path, mk_path: Path) -> None:
+def test_cli_buyer_reports_top_level_commands(tmp_path: Path, mk_invoke) -> None:
     root = tmp_path / "buyer_pack"
     plan_path = root / "plan" / "closed_loop_latest.json"
     verify_path = root / "verify" / "k8s_verify_latest.json"
@@ -39,29 +36,32 @@ def test_cli_buyer_reports_top_level_commands(tmp_path: Path, mk_path: Path) ->
     )
     _write_json(verify_path, {"ok": True, "verify_blocker": None})
 
-    cp = _run(mk_path, ["preflight", "--out", str(root / "preflight"), "--inputs-root", str(root)])
+    cp = mk_invoke(["preflight", "--out", str(root / "preflight"), "--inputs-root", str(root)])
     assert cp.returncode == 0, cp.stderr
-    cp = _run(mk_path, ["eval", "--out", str(root / "eval"), "--inputs-root", str(root)])
+    cp = mk_invoke(["eval", "--out", str(root / "eval"), "--inputs-root", str(root)])
     assert cp.returncode == 0, cp.stderr
-    cp = _run(mk_path, ["watch", "--out", str(root / "watch"), "--duration", "15", "--inputs-root", str(root)])
+    cp = mk_invoke(["watch", "--out", str(root / "watch"), "--duration", "15", "--inputs-root", str(root)])
     assert cp.returncode == 0, cp.stderr
-    cp = _run(mk_path, ["roi", "--out", str(root / "roi"), "--inputs-root", str(root)])
+    cp = mk_invoke(["roi", "--out", str(root / "roi"), "--inputs-root", str(root)])
     assert cp.returncode == 0, cp.stderr
 
     for name in ("preflight", "eval", "watch", "roi"):
-        latest = root / name / f"{name}_latest.json"
-        assert latest.exists()
-        assert (root / name / "summary.md").exists()
-        ts_matches = list((root / name).glob(f"{name}_????????_??????.json"))
-        assert ts_matches
+        entries = _dir_entries(root / name)
+        assert f"{name}_latest.json" in entries
+        assert "summary.md" in entries
+        prefix = f"{name}_"
+        assert any(
+            entry.startswith(prefix) and _TIMESTAMPED_JSON_RE.fullmatch(entry, len(prefix))
+            for entry in entries
+        )
 
-    roi_latest = json.loads((root / "roi" / "roi_latest.json").read_text(encoding="utf-8"))
+    roi_latest = loads((root / "roi" / "roi_latest.json").read_bytes())
     assert roi_latest.get("inputs_root") == str(root.resolve())
     assert "ok" in roi_latest
     assert "notes" in roi_latest
 
 
-def test_cli_buyer_read_only_patch_denied_not_top_blocker(tmp_path: Path, mk_path: Path) -> None:
+def test_cli_buyer_read_only_patch_denied_not_top_blocker(tmp_path: Path, mk_invoke) -> None:
     root = tmp_path / "buyer_pack"
     plan_path = root / "plan" / "closed_loop_latest.json"
     verify_path = root / "verify" / "k8s_verify_latest.json"
@@ -92,24 +92,24 @@ def test_cli_buyer_read_only_patch_denied_not_top_blocker(tmp_path: Path, mk_pat
         },
     )
 
-    cp = _run(mk_path, ["preflight", "--out", str(root / "preflight"), "--inputs-root", str(root)])
+    cp = mk_invoke(["preflight", "--out", str(root / "preflight"), "--inputs-root", str(root)])
     assert cp.returncode == 0, cp.stderr
-    cp = _run(mk_path, ["eval", "--out", str(root / "eval"), "--inputs-root", str(root)])
+    cp = mk_invoke(["eval", "--out", str(root / "eval"), "--inputs-root", str(root)])
     assert cp.returncode == 0, cp.stderr
-    cp = _run(mk_path, ["watch", "--out", str(root / "watch"), "--duration", "15", "--inputs-root", str(root)])
+    cp = mk_invoke(["watch", "--out", str(root / "watch"), "--duration", "15", "--inputs-root", str(root)])
     assert cp.returncode == 0, cp.stderr
-    cp = _run(mk_path, ["roi", "--out", str(root / "roi"), "--inputs-root", str(root)])
+    cp = mk_invoke(["roi", "--out", str(root / "roi"), "--inputs-root", str(root)])
     assert cp.returncode == 0, cp.stderr
 
-    preflight_latest = json.loads((root / "preflight" / "preflight_latest.json").read_text(encoding="utf-8"))
+    preflight_latest = loads((root / "preflight" / "preflight_latest.json").read_bytes())
     assert preflight_latest.get("top_blocker") is None
     assert preflight_latest.get("ok") is True
     assert "verify_read_only_patch_not_permitted" in (preflight_latest.get("notes") or [])
 
-    eval_latest = json.loads((root / "eval" / "eval_latest.json").read_text(encoding="utf-8"))
+    eval_latest = loads((root / "eval" / "eval_latest.json").read_bytes())
     assert eval_latest.get("top_blocker") is None
     assert eval_latest.get("ok") is True
     assert "verify_read_only_patch_not_permitted" in (eval_latest.get("notes") or [])
 
-    roi_latest = json.loads((root / "roi" / "roi_latest.json").read_text(encoding="utf-8"))
+    roi_latest = loads((root / "roi" / "roi_latest.json").read_bytes())
     assert roi_latest.get("top_blocker") is None
@@ -4,11 +4,11 @@ import tarfile
 from pathlib import Path
 
 
-def _run(mk: Path, args: list[str]) -> subprocess.CompletedProcess[str]:
-    return subprocess.run([str(mk), *args], text=True, capture_output=True, check=False)
+def _run(mk: str, args: list[str]) -> subprocess.CompletedProcess[str]:
+    return subprocess.run([mk, *args], text=True, capture_output=True, check=False)
 
 
-def test_export_handoff_pack_builds_expected_outputs(tmp_path: Path, mk_path: Path) -> None:
+def test_export_handoff_pack_builds_expected_outputs(tmp_path: Path, mk: str) -> None:
     in_dir = tmp_path / "in"
     (in_dir / "preflight").mkdir(parents=True)
     (in_dir / "eval").mkdir(parents=True)
@@ -30,7 +30,7 @@ def test_export_handoff_pack_builds_expected_outputs(tmp_path: Path, mk_path: Pa
     )
 
     out_dir = tmp_path / "out"
-    cp = _run(mk_path, ["export", "handoff-pack", "--in", str(in_dir), "--out", str(out_dir)])
+    cp = _run(mk, ["export", "handoff-pack", "--in", str(in_dir), "--out", str(out_dir)])
     assert cp.returncode == 0, cp.stderr
 
     expected = [
@@ -65,7 +65,7 @@ def test_export_handoff_pack_builds_expected_outputs(tmp_path: Path, mk_path: Pa
 
 
 def test_export_handoff_pack_manifest_includes_closed_loop_and_k8s_verify_latest(
-    tmp_path: Path, mk_path: Path
+    tmp_path: Path, mk: str
 ) -> None:
     in_dir = tmp_path / "in"
     (in_dir / "plan").mkdir(parents=True)
@@ -81,7 +81,7 @@ def test_export_handoff_pack_manifest_includes_closed_loop_and_k8s_verify_latest
     )
 
     out_dir = tmp_path / "out"
-    cp = _run(mk_path, ["export", "handoff-pack", "--in", str(in_dir), "--out", str(out_dir)])
+    cp = _run(mk, ["export", "handoff-pack", "--in", str(in_dir), "--out", str(out_dir)])
     assert cp.returncode == 0, cp.stderr
 
     manifest = json.loads((out_dir / "handoff_manifest.json").read_text(encoding="utf-8"))
@@ -91,7 +91,7 @@ def test_export_handoff_pack_manifest_includes_closed_loop_and_k8s_verify_latest
     assert "verify/k8s_verify_latest.json" in rel_paths
 
 
-def test_export_handoff_pack_verify_script_runs_and_writes_transcript(tmp_path: Path, mk_path: Path) -> None:
+def test_export_handoff_pack_verify_script_runs_and_writes_transcript(tmp_path: Path, mk: str) -> None:
     in_dir = tmp_path / "in"
     (in_dir / "preflight").mkdir(parents=True)
     (in_dir / "eval").mkdir(parents=True)
@@ -113,7 +113,7 @@ def test_export_handoff_pack_verify_script_runs_and_writes_transcript(tmp_path:
     )
 
     out_dir = tmp_path / "out"
-    cp = _run(mk_path, ["export", "handoff-pack", "--in", str(in_dir), "--out", str(out_dir)])
+    cp = _run(mk, ["export", "handoff-pack", "--in", str(in_dir), "--out", str(out_dir)])
     assert cp.returncode == 0, cp.stderr
 
     verify_cp = subprocess.run(
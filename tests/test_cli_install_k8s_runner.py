@@ -2,17 +2,17 @@ import subprocess
 from pathlib import Path
 
 
-def _run(mk: Path, args: list[str]) -> subprocess.CompletedProcess[str]:
+def _run(mk: str, args: list[str]) -> subprocess.CompletedProcess[str]:
     return subprocess.run(
-        [str(mk), *args],
+        [mk, *args],
         text=True,
         capture_output=True,
     )
 
 
-def test_cli_install_k8s_runner_generates_expected_bundle(tmp_path: Path, mk_path: Path) -> None:
+def test_cli_install_k8s_runner_generates_expected_bundle(tmp_path: Path, mk: str) -> None:
     out_dir = tmp_path / "out"
-    cp = _run(mk_path, ["install", "k8s-runner", "--out", str(out_dir)])
+    cp = _run(mk, ["install", "k8s-runner", "--out", str(out_dir)])
     assert cp.returncode == 0, cp.stderr
 
     expected_files = (
@@ -58,10 +58,10 @@ def test_cli_install_k8s_runner_generates_expected_bundle(tmp_path: Path, mk_pat
     assert "kubectl delete -f 00_namespace.yaml" in rollback_sh
 
 
-def test_cli_install_k8s_runner_sets_image_pull_policy_never(tmp_path: Path, mk_path: Path) -> None:
+def test_cli_install_k8s_runner_sets_image_pull_policy_never(tmp_path: Path, mk: str) -> None:
     out_dir = tmp_path / "out_never"
     cp = _run(
-        mk_path,
+        mk,
         [
             "install",
             "k8s-runner",
@@ -5,66 +5,51 @@ import subprocess
 from pathlib import Path
 
 
-def _run(mk: Path, args: list[str], env: dict[str, str] | None = None) -> subprocess.CompletedProcess[str]:
+def _run(mk: str, args: list[str], env: dict[str, str] | None = None) -> subprocess.CompletedProcess[str]:
     merged_env = os.environ.copy()
     if env:
         merged_env.update(env)
-    return subprocess.run([str(mk), *args], text=True, capture_output=True, check=False, env=merged_env)
+    return subprocess.run([mk, *args], text=True, capture_output=True, check=False, env=merged_env)
 
 
 def _write_fake_kubectl_verify_ok(path: Path, *, namespace: str, deployment: str) -> None:
     script = f"""#!/usr/bin/env bash
 set -Eeuo pipefail
 
-if [[ $# -ge 2 && "$1" == "config" && "$2" == "current-context" ]]; then
-  echo "test-context"
-  exit 0
-fi
-
-if [[ $# -ge 4 && "$1" == "version" && "$2" == "--client" && "$3" == "-o" && "$4" == "json" ]]; then
-  echo '{{"clientVersion":{{"gitVersion":"v1.29.0"}}}}'
-  exit 0
-fi
-
-if [[ $# -ge 3 && "$1" == "version" && "$2" == "-o" && "$3" == "json" ]]; then
-  echo '{{"serverVersion":{{"gitVersion":"v1.28.0"}}}}'
-  exit 0
-fi
-
-if [[ $# -ge 4 && "$1" == "get" && "$2" == "namespace/{namespace}" && "$3" == "-o" && "$4" == "name" ]]; then
-  echo "namespace/{namespace}"
-  exit 0
-fi
-
-if [[ $# -ge 6 && "$1" == "-n" && "$2" == "{namespace}" && "$3" == "get" && "$4" == "deployment/{deployment}" && "$5" == "-o" && "$6" == "name" ]]; then
-  echo "deployment.apps/{deployment}"
-  exit 0
-fi
-
-if [[ $# -ge 5 && "$1" == "-n" && "$2" == "{namespace}" && "$3" == "patch" && "$4" == "deployment/{deployment}" ]]; then
-  echo '{{"kind":"Deployment","metadata":{{"name":"{deployment}"}}}}'
-  exit 0
-fi
-
-if [[ $# -ge 6 && "$1" == "-n" && "$2" == "{namespace}" && "$3" == "auth" && "$4" == "can-i" && "$5" == "patch" && "$6" == "deployments" ]]; then
-  echo "yes"
-  exit 0
-fi
-
-if [[ $# -ge 6 && "$1" == "-n" && "$2" == "{namespace}" && "$3" == "auth" && "$4" == "can-i" && "$5" == "get" && "$6" == "deployments" ]]; then
-  echo "yes"
-  exit 0
-fi
-
-echo "unexpected args: $*" >&2
-exit 1
+case "$*" in
+  "config current-context"*)
+    echo "test-context"
+    ;;
+  "version --client -o json"*)
+    echo '{{"clientVersion":{{"gitVersion":"v1.29.0"}}}}'
+    ;;
+  "version -o json"*)
+    echo '{{"serverVersion":{{"gitVersion":"v1.28.0"}}}}'
+    ;;
+  "get namespace/{namespace} -o name"*)
+    echo "namespace/{namespace}"
+    ;;
+  "-n {namespace} get deployment/{deployment} -o name"*)
+    echo "deployment.apps/{deployment}"
+    ;;
+  "-n {namespace} patch deployment/{deployment} "*)
+    echo '{{"kind":"Deployment","metadata":{{"name":"{deployment}"}}}}'
+    ;;
+  "-n {namespace} auth can-i patch deployments"* | "-n {namespace} auth can-i get deployments"*)
+    echo "yes"
+    ;;
+  *)
+    echo "unexpected args: $*" >&2
+    exit 1
+    ;;
+esac
 """
     path.write_text(script, encoding="utf-8")
     path.chmod(0o755)
 
 
 def test_public_happy_path_contract_observe_plan_verify_export_handoff_pack(
-    tmp_path: Path, mk_path: Path
+    tmp_path: Path, mk: str
 ) -> None:
     observe_fixture = Path("tests/data/observe/stable.jsonl")
     assert observe_fixture.exists()
@@ -76,7 +61,7 @@ def test_public_happy_path_contract_observe_plan_verify_export_handoff_pack(
     handoff_out = tmp_path / "handoff_out"
 
     observe_cp = _run(
-        mk_path,
+        mk,
         [
             "observe",
             "--duration",
@@ -94,7 +79,7 @@ def test_public_happy_path_contract_observe_plan_verify_export_handoff_pack(
     assert observe_latest.get("sample_count") == 4
 
     plan_cp = _run(
-        mk_path,
+        mk,
         [
             "closed-loop",
             "run",
@@ -118,7 +103,7 @@ def test_public_happy_path_contract_observe_plan_verify_export_handoff_pack(
     kubectl = tmp_path / "kubectl"
     _write_fake_kubectl_verify_ok(kubectl, namespace="ns1", deployment="dep1")
     verify_cp = _run(
-        mk_path,
+        mk,
         ["k8s", "verify", "--plan", str(plan_path), "--out", str(verify_out)],
         env={"KUBECTL": str(kubectl)},
     )
@@ -135,7 +120,7 @@ def test_public_happy_path_contract_observe_plan_verify_export_handoff_pack(
     shutil.copy2(verify_latest_path, handoff_in / "verify" / "k8s_verify_latest.json")
 
     export_cp = _run(
-        mk_path,
+        mk,
         ["export", "handoff-pack", "--in", str(handoff_in), "--out", str(handoff_out)],
     )
     assert export_cp.returncode == 0, export_cp.stderr
@@ -1,23 +1,27 @@
-import json
+import os
 import subprocess
 from pathlib import Path
 
+from _jsonl import loads
 
-def test_cli_quickstart_file_source(tmp_path: Path, mk_path: Path) -> None:
+
+def _dir_entries(path: Path) -> set[str]:
+    return {entry.name for entry in os.scandir(path)}
+
+
+def test_cli_quickstart_file_source(tmp_path: Path, mk: str, quickstart_observe: Path) -> None:
     out_dir = tmp_path / "quickstart"
-    observe_path = Path("docs/evidence/mk092_quickstart/observe_mixed_env.jsonl")
-    assert observe_path.exists()
 
     cp = subprocess.run(
         [
-            str(mk_path),
+            mk,
             "quickstart",
             "--out",
             str(out_dir),
             "--observe-source",
             "file",
             "--observe-path",
-            str(observe_path),
+            str(quickstart_observe),
         ],
         check=False,
         capture_output=True,
@@ -25,28 +29,28 @@ def test_cli_quickstart_file_source(tmp_path: Path, mk_path: Path) -> None:
     )
     assert cp.returncode == 0, cp.stderr
 
-    assert (out_dir / "summary.md").exists()
+    root_entries = _dir_entries(out_dir)
+    assert "summary.md" in root_entries
+
+    entries = {
+        name: _dir_entries(out_dir / name)
+        for name in ("plan", "verify", "preflight", "eval", "watch", "roi", "export")
+    }
 
-    plan_latest = out_dir / "plan" / "closed_loop_latest.json"
-    assert plan_latest.exists()
-    plan_report = json.loads(plan_latest.read_text(encoding="utf-8"))
+    assert "closed_loop_latest.json" in entries["plan"]
+    plan_report = loads((out_dir / "plan" / "closed_loop_latest.json").read_bytes())
     assert isinstance(plan_report.get("k8s_plan_path"), str)
     assert plan_report.get("k8s_plan_path")
 
-    assert (out_dir / "verify" / "k8s_verify_latest.json").exists()
-    assert (out_dir / "preflight" / "preflight_latest.json").exists()
-    assert (out_dir / "preflight" / "summary.md").exists()
-    assert (out_dir / "eval" / "eval_latest.json").exists()
-    assert (out_dir / "eval" / "summary.md").exists()
-    assert (out_dir / "watch" / "watch_latest.json").exists()
-    assert (out_dir / "watch" / "summary.md").exists()
-    assert (out_dir / "roi" / "roi_latest.json").exists()
-    assert (out_dir / "roi" / "summary.md").exists()
+    assert "k8s_verify_latest.json" in entries["verify"]
+    for name in ("preflight", "eval", "watch", "roi"):
+        assert f"{name}_latest.json" in entries[name]
+        assert "summary.md" in entries[name]
 
     export_dir = out_dir / "export"
-    assert (export_dir / "bundle_manifest.json").exists()
-    assert (export_dir / "bundle.tar.gz").exists()
-    manifest = json.loads((export_dir / "bundle_manifest.json").read_text(encoding="utf-8"))
+    assert "bundle_manifest.json" in entries["export"]
+    assert "bundle.tar.gz" in entries["export"]
+    manifest = loads((export_dir / "bundle_manifest.json").read_bytes())
     files = manifest.get("files")
     rel_paths = {item.get("rel_path") for item in files} if isinstance(files, list) else set()
     assert "plan/closed_loop_latest.json" in rel_paths
@@ -3,11 +3,11 @@ import tarfile
 from pathlib import Path
 
 
-def _run(mk: Path, args: list[str]) -> subprocess.CompletedProcess[str]:
-    return subprocess.run([str(mk), *args], text=True, capture_output=True, check=False)
+def _run(mk: str, args: list[str]) -> subprocess.CompletedProcess[str]:
+    return subprocess.run([mk, *args], text=True, capture_output=True, check=False)
 
 
-def test_support_bundle_redacts_secrets_in_json(tmp_path: Path, mk_path: Path) -> None:
+def test_support_bundle_redacts_secrets_in_json(tmp_path: Path, mk: str) -> None:
     in_dir = tmp_path / "in"
     (in_dir / "eval").mkdir(parents=True)
     secret = "Bearer SUPERSECRET_TOKEN_1234567890"
@@ -17,7 +17,7 @@ def test_support_bundle_redacts_secrets_in_json(tmp_path: Path, mk_path: Path) -
     )
 
     out_dir = tmp_path / "out"
-    cp = _run(mk_path, ["support-bundle", "--in", str(in_dir), "--out", str(out_dir)])
+    cp = _run(mk, ["support-bundle", "--in", str(in_dir), "--out", str(out_dir)])
     assert cp.returncode == 0, cp.stderr
 
     manifest = out_dir / "support_bundle_manifest.json"
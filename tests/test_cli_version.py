@@ -1,8 +1,7 @@
 import subprocess
-from pathlib import Path
 
 
-def test_cli_version_flag(mk_path: Path) -> None:
-    p = subprocess.run([str(mk_path), "--version"], capture_output=True, text=True)
+def test_cli_version_flag(mk: str) -> None:
+    p = subprocess.run([mk, "--version"], capture_output=True)
     assert p.returncode == 0
-    assert "modekeeper" in (p.stdout or "")
+    assert b"modekeeper" in p.stdout
@@ -1,36 +1,19 @@
-import json
-import os
-import subprocess
+from collections import deque
+from collections.abc import Iterator, Mapping
 from pathlib import Path
 
+import pytest
+from _jsonl import dumps, iter_lines, loads
 
-def _write_fake_kubectl(path: Path, log_output: str) -> None:
-    script = f"""#!/usr/bin/env bash
-set -Eeuo pipefail
 
-if [[ "$1" == "logs" ]]; then
-  cat <<'EOF'
-{log_output}
-EOF
-  exit 0
-fi
-
-echo "unexpected args: $*" >&2
-exit 1
-"""
-    path.write_text(script, encoding="utf-8")
-    path.chmod(0o755)
-
-
-def _write_fake_kubectl_for_drift_annotations(
-    path: Path,
+def _drift_kubectl_env(
     *,
     namespace: str,
     deployment: str,
     grad_accum_steps: int,
     microbatch_size: int,
-) -> None:
-    deploy_json = json.dumps(
+) -> dict[str, str]:
+    deploy_json = dumps(
         {
             "spec": {
                 "template": {
@@ -43,52 +26,45 @@ def _write_fake_kubectl_for_drift_annotations(
                 }
             }
         }
-    )
-    script = f"""#!/usr/bin/env bash
-set -Eeuo pipefail
-
-if [[ $# -ge 6 && "$1" == "-n" && "$2" == "{namespace}" && "$3" == "get" && "$4" == "deployment/{deployment}" && "$5" == "-o" && "$6" == "json" ]]; then
-  cat <<'EOF'
-{deploy_json}
-EOF
-  exit 0
-fi
-
-echo "unexpected args: $*" >&2
-exit 1
-"""
-    path.write_text(script, encoding="utf-8")
-    path.chmod(0o755)
-
-
-def _explain_event_payloads(path: Path, event_name: str) -> list[dict]:
-    payloads: list[dict] = []
-    for line in path.read_text(encoding="utf-8").splitlines():
-        if not line.strip():
+    ).decode("utf-8")
+    return {
+        "FAKE_KUBECTL_NAMESPACE": namespace,
+        "FAKE_KUBECTL_DEPLOYMENT": deployment,
+        "FAKE_KUBECTL_DEPLOY_JSON": deploy_json,
+    }
+
+
+def _iter_explain_payloads(path: Path, event_name: str) -> Iterator[dict]:
+    needle = dumps(event_name)
+    for line in iter_lines(path):
+        if needle not in line:
             continue
-        record = json.loads(line)
+        record = loads(line)
         if record.get("event") == event_name:
             payload = record.get("payload")
             if isinstance(payload, dict):
-                payloads.append(payload)
-    return payloads
+                yield payload
+
+
+def _last_explain_payload(path: Path, event_name: str) -> dict | None:
+    last = deque(_iter_explain_payloads(path, event_name), maxlen=1)
+    return last[0] if last else None
 
 
-def test_closed_loop_run_k8s_observe(tmp_path: Path, mk_path: Path) -> None:
-    kubectl = tmp_path / "kubectl"
+def test_closed_loop_run_k8s_observe(
+    tmp_path: Path, mk_run, fake_kubectl: Path, base_env: Mapping[str, str]
+) -> None:
     log_output = "\n".join(
         [
             '{"ts":"2026-01-01T00:00:00Z","step_time_ms":120,"loss":1.0}',
             '{"ts":"2026-01-01T00:00:01Z","step_time_ms":130}',
         ]
     )
-    _write_fake_kubectl(kubectl, log_output)
 
     out_dir = tmp_path / "closed_loop_out"
-    env = {**os.environ, "KUBECTL": str(kubectl)}
-    subprocess.run(
+    env = base_env | {"KUBECTL": str(fake_kubectl), "FAKE_KUBECTL_LOGS": log_output}
+    cp = mk_run(
         [
-            str(mk_path),
             "closed-loop",
             "run",
             "--scenario",
@@ -107,75 +83,44 @@ def test_closed_loop_run_k8s_observe(tmp_path: Path, mk_path: Path) -> None:
             "--out",
             str(out_dir),
         ],
-        check=True,
-        capture_output=True,
-        text=True,
         env=env,
+        capture_stdout=False,
     )
+    assert cp.returncode == 0, cp.stderr
 
-    latest = json.loads((out_dir / "closed_loop_latest.json").read_text(encoding="utf-8"))
-    assert latest.get("proposed") == []
-
-
-def test_closed_loop_run_drift_k8s_mode_equal_targets_no_actions(tmp_path: Path, mk_path: Path) -> None:
-    kubectl = tmp_path / "kubectl"
-    _write_fake_kubectl_for_drift_annotations(
-        kubectl,
-        namespace="ns1",
-        deployment="dep1",
-        grad_accum_steps=8,
-        microbatch_size=32,
-    )
-    out_dir = tmp_path / "closed_loop_out"
-    env = {**os.environ, "KUBECTL": str(kubectl)}
-    subprocess.run(
-        [
-            str(mk_path),
-            "closed-loop",
-            "run",
-            "--scenario",
-            "drift",
-            "--dry-run",
-            "--k8s-namespace",
-            "ns1",
-            "--k8s-deployment",
-            "dep1",
-            "--out",
-            str(out_dir),
-        ],
-        check=True,
-        capture_output=True,
-        text=True,
-        env=env,
-    )
-    latest = json.loads((out_dir / "closed_loop_latest.json").read_text(encoding="utf-8"))
-    assert latest.get("signals", {}).get("drift") is False
+    latest = loads((out_dir / "closed_loop_latest.json").read_bytes())
     assert latest.get("proposed") == []
-    assert latest.get("k8s_plan_items") == 0
-
-    explain_path = out_dir / "explain.jsonl"
-    observe_payloads = _explain_event_payloads(explain_path, "closed_loop_observe_source")
-    assert observe_payloads
-    assert observe_payloads[-1].get("source") == "k8s"
-    drift_payloads = _explain_event_payloads(explain_path, "closed_loop_drift_observed_knobs")
-    assert drift_payloads
-    assert drift_payloads[-1].get("k8s_drift_triggered") is False
 
 
-def test_closed_loop_run_drift_k8s_mode_coalesces_patch(tmp_path: Path, mk_path: Path) -> None:
-    kubectl = tmp_path / "kubectl"
-    _write_fake_kubectl_for_drift_annotations(
-        kubectl,
-        namespace="ns1",
-        deployment="dep1",
-        grad_accum_steps=4,
-        microbatch_size=16,
-    )
+@pytest.mark.parametrize(
+    ("grad_accum_steps", "microbatch_size", "expect_drift", "expect_plan_items"),
+    [
+        pytest.param(8, 32, False, 0, id="equal_targets_no_actions"),
+        pytest.param(4, 16, True, 1, id="coalesces_patch"),
+    ],
+)
+def test_closed_loop_run_drift_k8s_mode(
+    tmp_path: Path,
+    mk_run,
+    fake_kubectl: Path,
+    base_env: Mapping[str, str],
+    grad_accum_steps: int,
+    microbatch_size: int,
+    expect_drift: bool,
+    expect_plan_items: int,
+) -> None:
     out_dir = tmp_path / "closed_loop_out"
-    env = {**os.environ, "KUBECTL": str(kubectl)}
-    subprocess.run(
+    env = base_env | {
+        "KUBECTL": str(fake_kubectl),
+        **_drift_kubectl_env(
+            namespace="ns1",
+            deployment="dep1",
+            grad_accum_steps=grad_accum_steps,
+            microbatch_size=microbatch_size,
+        ),
+    }
+    cp = mk_run(
         [
-            str(mk_path),
             "closed-loop",
             "run",
             "--scenario",
@@ -188,53 +133,54 @@ def test_closed_loop_run_drift_k8s_mode_coalesces_patch(tmp_path: Path, mk_path:
             "--out",
             str(out_dir),
         ],
-        check=True,
-        capture_output=True,
-        text=True,
         env=env,
+        capture_stdout=False,
     )
-
-    latest = json.loads((out_dir / "closed_loop_latest.json").read_text(encoding="utf-8"))
-    assert latest.get("signals", {}).get("drift") is True
-    assert latest.get("k8s_plan_items") == 1
-
-    plan = json.loads((out_dir / "k8s_plan.json").read_text(encoding="utf-8"))
-    assert isinstance(plan, list)
-    assert len(plan) == 1
-    annotations = (
-        plan[0]
-        .get("patch", {})
-        .get("spec", {})
-        .get("template", {})
-        .get("metadata", {})
-        .get("annotations", {})
-    )
-    assert annotations.get("modekeeper/knob.grad_accum_steps") == "8"
-    assert annotations.get("modekeeper/knob.microbatch_size") == "32"
-
-    script_text = (out_dir / "k8s_plan.kubectl.sh").read_text(encoding="utf-8")
-    assert script_text.count("kubectl -n ns1 patch deployment/dep1 --type merge -p") == 1
-    assert "modekeeper/knob.grad_accum_steps" in script_text
-    assert "modekeeper/knob.microbatch_size" in script_text
+    assert cp.returncode == 0, cp.stderr
+
+    latest = loads((out_dir / "closed_loop_latest.json").read_bytes())
+    assert latest.get("signals", {}).get("drift") is expect_drift
+    assert latest.get("k8s_plan_items") == expect_plan_items
+
+    if expect_drift:
+        plan = loads((out_dir / "k8s_plan.json").read_bytes())
+        assert isinstance(plan, list)
+        assert len(plan) == 1
+        annotations = (
+            plan[0]
+            .get("patch", {})
+            .get("spec", {})
+            .get("template", {})
+            .get("metadata", {})
+            .get("annotations", {})
+        )
+        assert annotations.get("modekeeper/knob.grad_accum_steps") == "8"
+        assert annotations.get("modekeeper/knob.microbatch_size") == "32"
+
+        script_text = (out_dir / "k8s_plan.kubectl.sh").read_text(encoding="utf-8")
+        assert script_text.count("kubectl -n ns1 patch deployment/dep1 --type merge -p") == 1
+        assert "modekeeper/knob.grad_accum_steps" in script_text
+        assert "modekeeper/knob.microbatch_size" in script_text
+    else:
+        assert latest.get("proposed") == []
 
     explain_path = out_dir / "explain.jsonl"
-    observe_payloads = _explain_event_payloads(explain_path, "closed_loop_observe_source")
-    assert observe_payloads
-    assert observe_payloads[-1].get("source") == "k8s"
-    drift_payloads = _explain_event_payloads(explain_path, "closed_loop_drift_observed_knobs")
-    assert drift_payloads
-    assert drift_payloads[-1].get("k8s_drift_triggered") is True
+    observe_payload = _last_explain_payload(explain_path, "closed_loop_observe_source")
+    assert observe_payload is not None
+    assert observe_payload.get("source") == "k8s"
+    drift_payload = _last_explain_payload(explain_path, "closed_loop_drift_observed_knobs")
+    assert drift_payload is not None
+    assert drift_payload.get("k8s_drift_triggered") is expect_drift
 
 
 def test_closed_loop_run_drift_k8s_mode_falls_back_to_synthetic_without_kubectl_env(
-    tmp_path: Path, mk_path: Path
+    tmp_path: Path, mk_run, base_env: Mapping[str, str]
 ) -> None:
     out_dir = tmp_path / "closed_loop_out"
-    env = dict(os.environ)
+    env = dict(base_env)
     env.pop("KUBECTL", None)
-    subprocess.run(
+    cp = mk_run(
         [
-            str(mk_path),
             "closed-loop",
             "run",
             "--scenario",
@@ -247,18 +193,17 @@ def test_closed_loop_run_drift_k8s_mode_falls_back_to_synthetic_without_kubectl_
             "--out",
             str(out_dir),
         ],
-        check=True,
-        capture_output=True,
-        text=True,
         env=env,
+        capture_stdout=False,
     )
+    assert cp.returncode == 0, cp.stderr
 
-    latest = json.loads((out_dir / "closed_loop_latest.json").read_text(encoding="utf-8"))
+    latest = loads((out_dir / "closed_loop_latest.json").read_bytes())
     knobs = {item.get("knob") for item in (latest.get("proposed") or [])}
     assert "grad_accum_steps" in knobs
     assert "microbatch_size" in knobs
 
     explain_path = out_dir / "explain.jsonl"
-    observe_payloads = _explain_event_payloads(explain_path, "closed_loop_observe_source")
-    assert observe_payloads
-    assert observe_payloads[-1].get("source") == "synthetic"
+    observe_payload = _last_explain_payload(explain_path, "closed_loop_observe_source")
+    assert observe_payload is not None
+    assert observe_payload.get("source") == "synthetic"
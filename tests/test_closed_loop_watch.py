@@ -1,15 +1,30 @@
-import json
-import subprocess
 from pathlib import Path
 
+import pytest
+from _jsonl import loads
 
-def test_closed_loop_watch_dry_run(tmp_path: Path, mk_path: Path) -> None:
+
+def _write_observe_jsonl(path: Path) -> None:
+    rows = [
+        b'{"ts":"2026-01-01T00:00:00Z","step_time_ms":100,"loss":1.0}',
+        b'{"ts":"2026-01-01T00:00:01Z","step_time_ms":100,"loss":1.0}',
+        b'{"ts":"2026-01-01T00:00:02Z","step_time_ms":100,"loss":1.0}',
+        b'{"ts":"2026-01-01T00:00:03Z","step_time_ms":100,"loss":1.0}',
+    ]
+    path.write_bytes(b"\n".join(rows) + b"\n")
+
+
+@pytest.fixture(scope="session")
+def observe_jsonl(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    path = tmp_path_factory.mktemp("watch_observe") / "observe.jsonl"
+    _write_observe_jsonl(path)
+    return path
+
+
+def test_closed_loop_watch_dry_run(tmp_path: Path, mk_invoke, observe_jsonl: Path) -> None:
     out_dir = tmp_path / "watch_out"
-    observe_path = tmp_path / "observe.jsonl"
-    _write_observe_jsonl(observe_path)
-    cp = subprocess.run(
+    cp = mk_invoke(
         [
-            str(mk_path),
             "closed-loop",
             "watch",
             "--scenario",
@@ -18,7 +33,7 @@ def test_closed_loop_watch_dry_run(tmp_path: Path, mk_path: Path) -> None:
             "--observe-source",
             "file",
             "--observe-path",
-            str(observe_path),
+            str(observe_jsonl),
             "--out",
             str(out_dir),
             "--max-iterations",
@@ -26,8 +41,6 @@ def test_closed_loop_watch_dry_run(tmp_path: Path, mk_path: Path) -> None:
             "--interval",
             "0s",
         ],
-        text=True,
-        capture_output=True,
     )
     assert cp.returncode == 0
 
@@ -37,24 +50,13 @@ def test_closed_loop_watch_dry_run(tmp_path: Path, mk_path: Path) -> None:
     assert iter_2.exists()
 
 
-def _write_observe_jsonl(path: Path) -> None:
-    rows = [
-        '{"ts":"2026-01-01T00:00:00Z","step_time_ms":100,"loss":1.0}',
-        '{"ts":"2026-01-01T00:00:01Z","step_time_ms":100,"loss":1.0}',
-        '{"ts":"2026-01-01T00:00:02Z","step_time_ms":100,"loss":1.0}',
-        '{"ts":"2026-01-01T00:00:03Z","step_time_ms":100,"loss":1.0}',
-    ]
-    path.write_text("\n".join(rows) + "\n", encoding="utf-8")
-
-
-def test_closed_loop_watch_apply_requires_pro(tmp_path: Path, mk_path: Path) -> None:
+def test_closed_loop_watch_apply_requires_pro(
+    tmp_path: Path, mk_invoke, observe_jsonl: Path
+) -> None:
     out_dir = tmp_path / "watch_out"
-    observe_path = tmp_path / "observe.jsonl"
-    _write_observe_jsonl(observe_path)
 
-    cp = subprocess.run(
+    cp = mk_invoke(
         [
-            str(mk_path),
             "closed-loop",
             "watch",
             "--scenario",
@@ -63,7 +65,7 @@ def test_closed_loop_watch_apply_requires_pro(tmp_path: Path, mk_path: Path) ->
             "--observe-source",
             "file",
             "--observe-path",
-            str(observe_path),
+            str(observe_jsonl),
             "--out",
             str(out_dir),
             "--max-iterations",
@@ -71,13 +73,11 @@ def test_closed_loop_watch_apply_requires_pro(tmp_path: Path, mk_path: Path) ->
             "--interval",
             "0s",
         ],
-        text=True,
-        capture_output=True,
     )
     assert cp.returncode == 2
     assert cp.stderr.strip() == "PRO REQUIRED: closed-loop watch --apply"
     assert not (out_dir / "iter_0001").exists()
 
-    watch = json.loads((out_dir / "watch_latest.json").read_text(encoding="utf-8"))
+    watch = loads((out_dir / "watch_latest.json").read_bytes())
     assert watch.get("iterations_done") == 0
     assert watch.get("apply_blocked_reason") == "pro_required"
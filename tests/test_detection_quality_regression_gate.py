@@ -5,11 +5,11 @@ from pathlib import Path
 from modekeeper._proof_matrix_expectations import PROOF_MATRIX_EXPECTATIONS, PROOF_SCENARIO_ORDER
 
 
-def _run_scenario(mk_path: Path, tmp_path: Path, scenario: str) -> tuple[dict, dict, str]:
+def _run_scenario(mk: str, tmp_path: Path, scenario: str) -> tuple[dict, dict, str]:
     out_dir = tmp_path / f"proof_gate_{scenario}"
     cp = subprocess.run(
         [
-            str(mk_path),
+            mk,
             "closed-loop",
             "run",
             "--scenario",
@@ -32,13 +32,13 @@ def _run_scenario(mk_path: Path, tmp_path: Path, scenario: str) -> tuple[dict, d
 
 
 def test_detection_quality_regression_gate_across_proof_scenarios(
-    tmp_path: Path, mk_path: Path
+    tmp_path: Path, mk: str
 ) -> None:
     # Keep gate scope pinned to post-v0.1.33 proof scenarios.
     assert tuple(PROOF_MATRIX_EXPECTATIONS) == PROOF_SCENARIO_ORDER
 
     for scenario, expected in PROOF_MATRIX_EXPECTATIONS.items():
-        latest, first_trace, summary = _run_scenario(mk_path, tmp_path, scenario)
+        latest, first_trace, summary = _run_scenario(mk, tmp_path, scenario)
 
         assert latest.get("assessment_result_class") == "signal_found"
         assert latest.get("coverage_ok") is True
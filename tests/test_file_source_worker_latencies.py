@@ -1,27 +1,19 @@
-import json
-import subprocess
 from pathlib import Path
 
+from _jsonl import loads
 
-def test_file_source_worker_latencies_enable_straggler_signal(tmp_path: Path, mk_path: Path) -> None:
+_ROW_TEMPLATE = b'{"ts":%d,"step_time_ms":2000,"worker_latencies_ms":[2000,2000,2000,120000]}\n'
+
+
+def test_file_source_worker_latencies_enable_straggler_signal(tmp_path: Path, mk_invoke) -> None:
     observe_path = tmp_path / "worker_latencies.jsonl"
     out_dir = tmp_path / "closed_loop_out"
 
-    rows = []
     base_ts_ms = 1_700_000_000_000
-    for i in range(200):
-        rows.append(
-            {
-                "ts": base_ts_ms + i * 1000,
-                "step_time_ms": 2000,
-                "worker_latencies_ms": [2000, 2000, 2000, 120000],
-            }
-        )
-    observe_path.write_text("\n".join(json.dumps(row) for row in rows) + "\n", encoding="utf-8")
-
-    cp = subprocess.run(
+    observe_path.write_bytes(b"".join(_ROW_TEMPLATE % (base_ts_ms + i * 1000) for i in range(200)))
+
+    cp = mk_invoke(
         [
-            str(mk_path),
             "closed-loop",
             "run",
             "--scenario",
@@ -34,17 +26,16 @@ def test_file_source_worker_latencies_enable_straggler_signal(tmp_path: Path, mk
             "--out",
             str(out_dir),
         ],
-        text=True,
-        capture_output=True,
     )
     assert cp.returncode == 0, cp.stderr
 
     trace_path = out_dir / "decision_trace_latest.jsonl"
     assert trace_path.exists()
-    lines = trace_path.read_text(encoding="utf-8").splitlines()
-    assert lines
+    with trace_path.open("rb") as f:
+        first_line = f.readline()
+    assert first_line.strip()
 
-    event = json.loads(lines[0])
+    event = loads(first_line)
     signals = event.get("signals") or {}
     assert signals.get("straggler") is True
 
@@ -1,16 +1,8 @@
 import json
-import subprocess
 from pathlib import Path
 
-
-def _run(mk: Path, args: list[str], env: dict | None = None) -> subprocess.CompletedProcess[str]:
-    e = None
-    if env is not None:
-        import os
-
-        e = os.environ.copy()
-        e.update(env)
-    return subprocess.run([str(mk), *args], text=True, capture_output=True, env=e)
+import pytest
+from _jsonl import loads
 
 
 def _write_plan(plan_path: Path) -> None:
@@ -25,16 +17,12 @@ def _write_plan(plan_path: Path) -> None:
 
 
 def _read_jsonl(path: Path) -> list[dict]:
-    return [
-        json.loads(line)
-        for line in path.read_text(encoding="utf-8").splitlines()
-        if line.strip()
-    ]
+    return [loads(line) for line in path.read_bytes().splitlines() if line.strip()]
 
 
 def _assert_pro_required(out_dir: Path, stderr: str) -> None:
     assert stderr.strip() == "PRO REQUIRED: k8s apply"
-    report = json.loads((out_dir / "k8s_apply_latest.json").read_text(encoding="utf-8"))
+    report = loads((out_dir / "k8s_apply_latest.json").read_bytes())
     assert report.get("would_apply") is False
     assert report.get("block_reason") == "pro_required"
     assert report.get("reason") == "pro_required"
@@ -44,25 +32,25 @@ def _assert_pro_required(out_dir: Path, stderr: str) -> None:
     assert (blocked[-1].get("payload") or {}).get("reason") == "pro_required"
 
 
-def test_k8s_apply_blocked_public_default(tmp_path: Path, mk_path: Path) -> None:
+def test_k8s_apply_blocked_public_default(tmp_path: Path, mk_invoke) -> None:
     plan = tmp_path / "plan.json"
     _write_plan(plan)
     out_dir = tmp_path / "out"
 
-    cp = _run(mk_path, ["k8s", "apply", "--plan", str(plan), "--out", str(out_dir)])
+    cp = mk_invoke(["k8s", "apply", "--plan", str(plan), "--out", str(out_dir)])
     assert cp.returncode == 2
     _assert_pro_required(out_dir, cp.stderr)
 
 
-def test_k8s_apply_blocked_even_with_internal_override(tmp_path: Path, mk_path: Path) -> None:
+def test_k8s_apply_blocked_even_with_internal_override(
+    tmp_path: Path, mk_invoke, monkeypatch: pytest.MonkeyPatch
+) -> None:
     plan = tmp_path / "plan.json"
     _write_plan(plan)
     out_dir = tmp_path / "out"
 
-    cp = _run(
-        mk_path,
-        ["k8s", "apply", "--plan", str(plan), "--out", str(out_dir)],
-        env={"MODEKEEPER_PAID": "1", "MODEKEEPER_INTERNAL_OVERRIDE": "1"},
-    )
+    monkeypatch.setenv("MODEKEEPER_PAID", "1")
+    monkeypatch.setenv("MODEKEEPER_INTERNAL_OVERRIDE", "1")
+    cp = mk_invoke(["k8s", "apply", "--plan", str(plan), "--out", str(out_dir)])
     assert cp.returncode == 2
     _assert_pro_required(out_dir, cp.stderr)
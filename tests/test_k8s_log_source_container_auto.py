@@ -1,77 +1,41 @@
 from types import SimpleNamespace
 
+import modekeeper.telemetry.k8s_log_source as m
 from modekeeper.telemetry.k8s_log_source import K8sLogSource
 
 
-def test_k8s_log_source_container_auto_omits_dash_c(monkeypatch) -> None:
+def _read_argv(monkeypatch, **kwargs) -> list[str]:
     seen = {}
 
-    def fake_run(argv, capture_output, text, timeout):
+    def fake_run(argv, capture_output, timeout):
         seen["argv"] = argv
-        return SimpleNamespace(returncode=0, stdout='{"ts": 1700000000000, "step_time_ms": 10}\n', stderr="")
-
-    import modekeeper.telemetry.k8s_log_source as m
+        return SimpleNamespace(
+            returncode=0,
+            stdout=b'{"ts": 1700000000000, "step_time_ms": 10}\n',
+            stderr=b"",
+        )
 
     monkeypatch.setattr(m.subprocess, "run", fake_run)
 
-    src = K8sLogSource(
-        namespace="default",
-        deployment="trainer",
-        container="auto",
-        duration_ms=1000,
-    )
+    src = K8sLogSource(namespace="default", deployment="trainer", duration_ms=1000, **kwargs)
     _ = src.read()
+    return seen["argv"]
+
 
-    argv = seen["argv"]
+def test_k8s_log_source_container_auto_omits_dash_c(monkeypatch) -> None:
+    argv = _read_argv(monkeypatch, container="auto")
     assert "-c" not in argv
     assert "--timestamps" in argv
 
 
 def test_k8s_log_source_container_explicit_includes_dash_c(monkeypatch) -> None:
-    seen = {}
-
-    def fake_run(argv, capture_output, text, timeout):
-        seen["argv"] = argv
-        return SimpleNamespace(returncode=0, stdout='{"ts": 1700000000000, "step_time_ms": 10}\n', stderr="")
-
-    import modekeeper.telemetry.k8s_log_source as m
-
-    monkeypatch.setattr(m.subprocess, "run", fake_run)
-
-    src = K8sLogSource(
-        namespace="default",
-        deployment="trainer",
-        container="nginx",
-        duration_ms=1000,
-    )
-    _ = src.read()
-
-    argv = seen["argv"]
+    argv = _read_argv(monkeypatch, container="nginx")
     assert "-c" in argv
     assert argv[argv.index("-c") + 1] == "nginx"
 
 
 def test_k8s_log_source_explicit_pod_targets_named_pod(monkeypatch) -> None:
-    seen = {}
-
-    def fake_run(argv, capture_output, text, timeout):
-        seen["argv"] = argv
-        return SimpleNamespace(returncode=0, stdout='{"ts": 1700000000000, "step_time_ms": 10}\n', stderr="")
-
-    import modekeeper.telemetry.k8s_log_source as m
-
-    monkeypatch.setattr(m.subprocess, "run", fake_run)
-
-    src = K8sLogSource(
-        namespace="default",
-        deployment="trainer",
-        container="trainer",
-        duration_ms=1000,
-        k8s_pod="trainer-7f44f44b8f-abcd1",
-    )
-    _ = src.read()
-
-    argv = seen["argv"]
+    argv = _read_argv(monkeypatch, container="trainer", k8s_pod="trainer-7f44f44b8f-abcd1")
     assert argv[1] == "logs"
     assert "trainer-7f44f44b8f-abcd1" in argv
     assert "deployment/trainer" not in argv
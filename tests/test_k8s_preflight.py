@@ -2,33 +2,96 @@ import argparse
 import json
 from pathlib import Path
 
+import pytest
+from _jsonl import loads
+
 from modekeeper.cli import cmd_k8s_preflight
 
+_NODES_JSON = json.dumps(
+    {"items": [{"status": {"capacity": {"cpu": "16"}, "allocatable": {"cpu": "16"}}}]}
+)
+_DEPLOY_JSON = json.dumps(
+    {
+        "spec": {
+            "template": {
+                "spec": {
+                    "containers": [
+                        {
+                            "name": "trainer",
+                            "resources": {"limits": {"cpu": "1"}, "requests": {"memory": "1Gi"}},
+                        }
+                    ]
+                }
+            }
+        }
+    }
+)
+_BASE_RESPONSES = {
+    ("config", "current-context"): {"rc": 0, "stdout": "kind-test\n", "stderr": "", "error": None},
+    ("cluster-info",): {
+        "rc": 0,
+        "stdout": "Kubernetes control plane is running\n",
+        "stderr": "",
+        "error": None,
+    },
+    ("get", "ns"): {"rc": 0, "stdout": "default\nkube-system\n", "stderr": "", "error": None},
+    ("-n", "default", "get", "deploy", "trainer", "-o", "wide"): {
+        "rc": 0,
+        "stdout": "trainer 1/1 1 1 1m\n",
+        "stderr": "",
+        "error": None,
+    },
+    ("auth", "can-i", "get", "pods", "-n", "default"): {
+        "rc": 0,
+        "stdout": "yes\n",
+        "stderr": "",
+        "error": None,
+    },
+}
+_UNEXPECTED = {"rc": 1, "stdout": "", "stderr": "unexpected", "error": None}
+
 
 def _read_jsonl(path: Path) -> list[dict]:
-    return [json.loads(line) for line in path.read_text(encoding="utf-8").splitlines() if line.strip()]
+    return [loads(line) for line in path.read_bytes().splitlines() if line.strip()]
+
+
+def _fake_kubectl(responses: dict[tuple[str, ...], dict]):
+    table = {" ".join(key): value for key, value in responses.items()}
+
+    def fake_kubectl(args: list[str], timeout_s: float = 20.0) -> dict:
+        del timeout_s
+        return table.get(" ".join(args), _UNEXPECTED)
 
+    return fake_kubectl
 
-def test_k8s_preflight_read_only_report_with_blocker(monkeypatch, tmp_path: Path, capsys) -> None:
+
+@pytest.fixture
+def run_preflight(monkeypatch, tmp_path: Path):
+    """Run ``cmd_k8s_preflight`` for default/trainer against canned kubectl responses."""
+
+    out_dir = tmp_path / "out"
+
+    def _run(responses: dict[tuple[str, ...], dict]) -> tuple[int, Path]:
+        monkeypatch.setattr("modekeeper.cli._kubectl", _fake_kubectl(responses))
+        args = argparse.Namespace(
+            k8s_namespace="default", k8s_deployment="trainer", out=str(out_dir)
+        )
+        return cmd_k8s_preflight(args), out_dir
+
+    return _run
+
+
+def test_k8s_preflight_read_only_report_with_blocker(run_preflight, capsys) -> None:
     pods_stdout = "\n".join([f"pod-{i} 1/1 Running 0 1m node-a" for i in range(30)])
 
     responses = {
-        ("config", "current-context"): {"rc": 0, "stdout": "kind-test\n", "stderr": "", "error": None},
-        ("cluster-info",): {"rc": 0, "stdout": "Kubernetes control plane is running\n", "stderr": "", "error": None},
-        ("get", "ns"): {"rc": 0, "stdout": "default\nkube-system\n", "stderr": "", "error": None},
-        ("-n", "default", "get", "deploy", "trainer", "-o", "wide"): {
-            "rc": 0,
-            "stdout": "trainer 1/1 1 1 1m\n",
-            "stderr": "",
-            "error": None,
-        },
+        **_BASE_RESPONSES,
         ("-n", "default", "get", "pods", "-o", "wide"): {
             "rc": 0,
             "stdout": pods_stdout,
             "stderr": "",
             "error": None,
         },
-        ("auth", "can-i", "get", "pods", "-n", "default"): {"rc": 0, "stdout": "yes\n", "stderr": "", "error": None},
         ("auth", "can-i", "get", "deployments.apps", "-n", "default"): {
             "rc": 1,
             "stdout": "no\n",
@@ -37,15 +100,7 @@ def test_k8s_preflight_read_only_report_with_blocker(monkeypatch, tmp_path: Path
         },
     }
 
-    def fake_kubectl(args: list[str], timeout_s: float = 20.0) -> dict:
-        del timeout_s
-        return responses.get(tuple(args), {"rc": 1, "stdout": "", "stderr": "unexpected", "error": None})
-
-    monkeypatch.setattr("modekeeper.cli._kubectl", fake_kubectl)
-
-    out_dir = tmp_path / "out"
-    args = argparse.Namespace(k8s_namespace="default", k8s_deployment="trainer", out=str(out_dir))
-    rc = cmd_k8s_preflight(args)
+    rc, out_dir = run_preflight(responses)
     assert rc == 1
 
     latest = out_dir / "preflight_latest.json"
@@ -55,7 +110,7 @@ def test_k8s_preflight_read_only_report_with_blocker(monkeypatch, tmp_path: Path
     assert summary.exists()
     assert explain.exists()
 
-    data = json.loads(latest.read_text(encoding="utf-8"))
+    data = loads(latest.read_bytes())
     assert data["schema_version"] == "preflight.v0"
     assert data["ok"] is False
     assert data["top_blocker"] == "can_i_get_deployments_apps failed"
@@ -74,9 +129,8 @@ def test_k8s_preflight_read_only_report_with_blocker(monkeypatch, tmp_path: Path
     assert str(explain) in artifact_paths
 
     events = _read_jsonl(explain)
-    names = [event.get("event") for event in events]
-    assert "k8s_preflight_start" in names
-    assert "k8s_preflight_report" in names
+    names = {event.get("event") for event in events}
+    assert {"k8s_preflight_start", "k8s_preflight_report"} <= names
 
     printed = capsys.readouterr().out.strip()
     assert "ok=false" in printed
@@ -85,24 +139,15 @@ def test_k8s_preflight_read_only_report_with_blocker(monkeypatch, tmp_path: Path
     assert f"summary={summary}" in printed
 
 
-def test_k8s_preflight_gpu_visibility_notes(monkeypatch, tmp_path: Path, capsys) -> None:
+def test_k8s_preflight_gpu_visibility_notes(run_preflight, capsys) -> None:
     responses = {
-        ("config", "current-context"): {"rc": 0, "stdout": "kind-test\n", "stderr": "", "error": None},
-        ("cluster-info",): {"rc": 0, "stdout": "Kubernetes control plane is running\n", "stderr": "", "error": None},
-        ("get", "ns"): {"rc": 0, "stdout": "default\nkube-system\n", "stderr": "", "error": None},
-        ("-n", "default", "get", "deploy", "trainer", "-o", "wide"): {
-            "rc": 0,
-            "stdout": "trainer 1/1 1 1 1m\n",
-            "stderr": "",
-            "error": None,
-        },
+        **_BASE_RESPONSES,
         ("-n", "default", "get", "pods", "-o", "wide"): {
             "rc": 0,
             "stdout": "trainer-abc 1/1 Running 0 1m node-a\n",
             "stderr": "",
             "error": None,
         },
-        ("auth", "can-i", "get", "pods", "-n", "default"): {"rc": 0, "stdout": "yes\n", "stderr": "", "error": None},
         ("auth", "can-i", "get", "deployments.apps", "-n", "default"): {
             "rc": 0,
             "stdout": "yes\n",
@@ -111,9 +156,7 @@ def test_k8s_preflight_gpu_visibility_notes(monkeypatch, tmp_path: Path, capsys)
         },
         ("get", "nodes", "-o", "json"): {
             "rc": 0,
-            "stdout": json.dumps(
-                {"items": [{"status": {"capacity": {"cpu": "16"}, "allocatable": {"cpu": "16"}}}]}
-            ),
+            "stdout": _NODES_JSON,
             "stderr": "",
             "error": None,
         },
@@ -131,41 +174,18 @@ def test_k8s_preflight_gpu_visibility_notes(monkeypatch, tmp_path: Path, capsys)
         },
         ("-n", "default", "get", "deploy", "trainer", "-o", "json"): {
             "rc": 0,
-            "stdout": json.dumps(
-                {
-                    "spec": {
-                        "template": {
-                            "spec": {
-                                "containers": [
-                                    {
-                                        "name": "trainer",
-                                        "resources": {"limits": {"cpu": "1"}, "requests": {"memory": "1Gi"}},
-                                    }
-                                ]
-                            }
-                        }
-                    }
-                }
-            ),
+            "stdout": _DEPLOY_JSON,
             "stderr": "",
             "error": None,
         },
     }
 
-    def fake_kubectl(args: list[str], timeout_s: float = 20.0) -> dict:
-        del timeout_s
-        return responses.get(tuple(args), {"rc": 1, "stdout": "", "stderr": "unexpected", "error": None})
-
-    monkeypatch.setattr("modekeeper.cli._kubectl", fake_kubectl)
-
-    out_dir = tmp_path / "out"
-    args = argparse.Namespace(k8s_namespace="default", k8s_deployment="trainer", out=str(out_dir))
-    rc = cmd_k8s_preflight(args)
+    rc, out_dir = run_preflight(responses)
     assert rc == 0
 
     latest = out_dir / "preflight_latest.json"
     summary = out_dir / "preflight_summary.md"
-    data = json.loads(latest.read_text(encoding="utf-8"))
+    data = loads(latest.read_bytes())
     assert data["ok"] is True
     assert data["top_blocker"] is None
     assert data["gpu_capacity_present"] is False
@@ -1,63 +1,47 @@
 import json
 import os
-import subprocess
 from pathlib import Path
 
+from _jsonl import iter_lines, loads
 
-def test_k8s_render_writes_kubectl_plan(tmp_path: Path, mk_path: Path) -> None:
-    plan = [
-        {
-            "namespace": "ns1",
-            "name": "dep1",
-            "patch": {
-                "metadata": {
-                    "annotations": {
-                        "modekeeper/knob.grad_accum_steps": "4",
-                    }
-                },
-                "spec": {
-                    "template": {
-                        "metadata": {
-                            "annotations": {
-                                "modekeeper/knob.grad_accum_steps": "4",
-                            }
-                        }
-                    }
-                },
-            },
+
+def _knob_item(knob: str, value: str) -> dict:
+    annotations = {f"modekeeper/knob.{knob}": value}
+    return {
+        "namespace": "ns1",
+        "name": "dep1",
+        "patch": {
+            "metadata": {"annotations": annotations},
+            "spec": {"template": {"metadata": {"annotations": annotations}}},
         },
+    }
+
+
+_KNOB_PLAN = json.dumps(
+    [_knob_item("grad_accum_steps", "4"), _knob_item("microbatch_size", "32")], indent=2
+).encode("utf-8")
+_QUOTED_NOTE_PLAN = json.dumps(
+    [
         {
             "namespace": "ns1",
             "name": "dep1",
-            "patch": {
-                "metadata": {
-                    "annotations": {
-                        "modekeeper/knob.microbatch_size": "32",
-                    }
-                },
-                "spec": {
-                    "template": {
-                        "metadata": {
-                            "annotations": {
-                                "modekeeper/knob.microbatch_size": "32",
-                            }
-                        }
-                    }
-                },
-            },
-        },
-    ]
+            "patch": {"metadata": {"annotations": {"modekeeper/note": "O'Reilly"}}},
+        }
+    ],
+    indent=2,
+    ensure_ascii=False,
+).encode("utf-8")
+
+
+def test_k8s_render_writes_kubectl_plan(tmp_path: Path, mk_invoke) -> None:
     plan_path = tmp_path / "plan.json"
-    plan_path.write_text(json.dumps(plan, indent=2), encoding="utf-8")
+    plan_path.write_bytes(_KNOB_PLAN)
 
     out_dir = tmp_path / "out"
-    mk = mk_path
-    subprocess.run(
-        [str(mk), "k8s", "render", "--plan", str(plan_path), "--out", str(out_dir)],
-        check=True,
-        capture_output=True,
-        text=True,
+    cp = mk_invoke(
+        ["k8s", "render", "--plan", str(plan_path), "--out", str(out_dir)], capture_stdout=False
     )
+    assert cp.returncode == 0, cp.stderr
 
     kubectl_path = out_dir / "k8s_plan.kubectl.sh"
     assert kubectl_path.exists()
@@ -69,11 +53,7 @@ def test_k8s_render_writes_kubectl_plan(tmp_path: Path, mk_path: Path) -> None:
 
     explain_path = out_dir / "explain.jsonl"
     assert explain_path.exists()
-    explain_events = [
-        json.loads(line).get("event")
-        for line in explain_path.read_text(encoding="utf-8").splitlines()
-        if line.strip()
-    ]
+    explain_events = [loads(line).get("event") for line in iter_lines(explain_path)]
     assert "k8s_render_start" in explain_events
     assert "k8s_kubectl_plan_written" in explain_events
 
@@ -88,52 +68,30 @@ def test_k8s_render_writes_kubectl_plan(tmp_path: Path, mk_path: Path) -> None:
     assert Path(latest_kubectl_path).exists()
 
 
-def test_k8s_render_escapes_single_quotes_in_patch_json(tmp_path: Path, mk_path: Path) -> None:
-    plan = [
-        {
-            "namespace": "ns1",
-            "name": "dep1",
-            "patch": {
-                "metadata": {
-                    "annotations": {
-                        "modekeeper/note": "O'Reilly",
-                    }
-                }
-            },
-        }
-    ]
+def test_k8s_render_escapes_single_quotes_in_patch_json(tmp_path: Path, mk_invoke) -> None:
     plan_path = tmp_path / "plan.json"
-    plan_path.write_text(
-        json.dumps(plan, indent=2, ensure_ascii=False),
-        encoding="utf-8",
-    )
+    plan_path.write_bytes(_QUOTED_NOTE_PLAN)
 
     out_dir = tmp_path / "out"
-    mk = mk_path
-    subprocess.run(
-        [str(mk), "k8s", "render", "--plan", str(plan_path), "--out", str(out_dir)],
-        check=True,
-        capture_output=True,
-        text=True,
+    cp = mk_invoke(
+        ["k8s", "render", "--plan", str(plan_path), "--out", str(out_dir)], capture_stdout=False
     )
+    assert cp.returncode == 0, cp.stderr
 
     script_text = (out_dir / "k8s_plan.kubectl.sh").read_text(encoding="utf-8")
     # bash-safe single-quote escaping inside single-quoted JSON: ' -> '\'' (so we expect O'\''Reilly)
     assert "O'\\''Reilly" in script_text
 
 
-def test_k8s_render_empty_plan_writes_kubectl_free_script(tmp_path: Path, mk_path: Path) -> None:
+def test_k8s_render_empty_plan_writes_kubectl_free_script(tmp_path: Path, mk_invoke) -> None:
     plan_path = tmp_path / "plan.json"
     plan_path.write_text("[]\n", encoding="utf-8")
 
     out_dir = tmp_path / "out"
-    mk = mk_path
-    subprocess.run(
-        [str(mk), "k8s", "render", "--plan", str(plan_path), "--out", str(out_dir)],
-        check=True,
-        capture_output=True,
-        text=True,
+    cp = mk_invoke(
+        ["k8s", "render", "--plan", str(plan_path), "--out", str(out_dir)], capture_stdout=False
     )
+    assert cp.returncode == 0, cp.stderr
 
     kubectl_path = out_dir / "k8s_plan.kubectl.sh"
     assert kubectl_path.exists()
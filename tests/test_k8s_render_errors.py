@@ -1,14 +1,14 @@
-import json
-import subprocess
+import os
 from pathlib import Path
 
+from _jsonl import iter_lines, loads
+
+_PLAN_NOT_A_LIST = b'{"hello": "world"}'
+_PLAN_INVALID_ITEM = b'[{"namespace": "ns1", "patch": "nope"}]'
+
 
 def _read_jsonl(path: Path) -> list[dict]:
-    return [
-        json.loads(line)
-        for line in path.read_text(encoding="utf-8").splitlines()
-        if line.strip()
-    ]
+    return [loads(line) for line in iter_lines(path)]
 
 
 def _assert_error_out_dir(out_dir: Path, *, expected_kind: str) -> None:
@@ -26,63 +26,44 @@ def _assert_error_out_dir(out_dir: Path, *, expected_kind: str) -> None:
     assert payload.get("kind") == expected_kind
 
     # На ошибке не должно быть частичных артефактов
-    assert not (out_dir / "k8s_plan.kubectl.sh").exists()
-    assert not (out_dir / "k8s_render_latest.json").exists()
-    assert not any(out_dir.glob("k8s_render_*.json"))
+    names = {entry.name for entry in os.scandir(out_dir)}
+    assert "k8s_plan.kubectl.sh" not in names
+    assert "k8s_render_latest.json" not in names
+    assert not any(n.startswith("k8s_render_") and n.endswith(".json") for n in names)
 
 
-def test_k8s_render_missing_plan_still_writes_explain(tmp_path: Path, mk_path: Path) -> None:
+def test_k8s_render_missing_plan_still_writes_explain(tmp_path: Path, mk_invoke) -> None:
     out_dir = tmp_path / "out_missing"
-    mk = mk_path
-    r = subprocess.run(
-        [str(mk), "k8s", "render", "--plan", str(tmp_path / "nope.json"), "--out", str(out_dir)],
-        capture_output=True,
-        text=True,
-    )
+    r = mk_invoke(["k8s", "render", "--plan", str(tmp_path / "nope.json"), "--out", str(out_dir)])
     assert r.returncode == 2
     _assert_error_out_dir(out_dir, expected_kind="not_found")
 
 
-def test_k8s_render_invalid_json(tmp_path: Path, mk_path: Path) -> None:
+def test_k8s_render_invalid_json(tmp_path: Path, mk_invoke) -> None:
     plan = tmp_path / "bad.json"
-    plan.write_text("{not json", encoding="utf-8")
+    plan.write_bytes(b"{not json")
 
     out_dir = tmp_path / "out_bad"
-    mk = mk_path
-    r = subprocess.run(
-        [str(mk), "k8s", "render", "--plan", str(plan), "--out", str(out_dir)],
-        capture_output=True,
-        text=True,
-    )
+    r = mk_invoke(["k8s", "render", "--plan", str(plan), "--out", str(out_dir)])
     assert r.returncode == 2
     _assert_error_out_dir(out_dir, expected_kind="invalid_json")
 
 
-def test_k8s_render_non_list_plan(tmp_path: Path, mk_path: Path) -> None:
+def test_k8s_render_non_list_plan(tmp_path: Path, mk_invoke) -> None:
     plan = tmp_path / "obj.json"
-    plan.write_text(json.dumps({"hello": "world"}), encoding="utf-8")
+    plan.write_bytes(_PLAN_NOT_A_LIST)
 
     out_dir = tmp_path / "out_obj"
-    mk = mk_path
-    r = subprocess.run(
-        [str(mk), "k8s", "render", "--plan", str(plan), "--out", str(out_dir)],
-        capture_output=True,
-        text=True,
-    )
+    r = mk_invoke(["k8s", "render", "--plan", str(plan), "--out", str(out_dir)])
     assert r.returncode == 2
     _assert_error_out_dir(out_dir, expected_kind="invalid_shape")
 
 
-def test_k8s_render_invalid_item(tmp_path: Path, mk_path: Path) -> None:
+def test_k8s_render_invalid_item(tmp_path: Path, mk_invoke) -> None:
     plan = tmp_path / "bad_item.json"
-    plan.write_text(json.dumps([{"namespace": "ns1", "patch": "nope"}]), encoding="utf-8")
+    plan.write_bytes(_PLAN_INVALID_ITEM)
 
     out_dir = tmp_path / "out_bad_item"
-    mk = mk_path
-    r = subprocess.run(
-        [str(mk), "k8s", "render", "--plan", str(plan), "--out", str(out_dir)],
-        capture_output=True,
-        text=True,
-    )
+    r = mk_invoke(["k8s", "render", "--plan", str(plan), "--out", str(out_dir)])
     assert r.returncode == 2
     _assert_error_out_dir(out_dir, expected_kind="invalid_item")
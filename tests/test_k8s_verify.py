@@ -3,12 +3,53 @@ import os
 import subprocess
 from pathlib import Path
 
+import pytest
+from _jsonl import iter_lines, loads
+
+_CONTEXT = {"config current-context": (0, "test-context", "")}
+_VERSIONS = {
+    "version --client -o json": (0, '{"clientVersion":{"gitVersion":"v1.29.0"}}', ""),
+    "version -o json": (0, '{"serverVersion":{"gitVersion":"v1.28.0"}}', ""),
+}
+_PATCH_FORBIDDEN = (
+    'Error from server (Forbidden): deployments.apps "dep1" is forbidden: '
+    'User "system:serviceaccount:ns1:sa" cannot patch resource "deployments" '
+    'in API group "apps" in the namespace "ns1"'
+)
+_PATCH_NOT_FOUND = 'Error from server (NotFound): deployments.apps "dep1" not found'
+
+
+def _plan(*targets: tuple[str, str, int]) -> bytes:
+    items = [
+        {"namespace": ns, "name": name, "patch": {"spec": {"replicas": replicas}}}
+        for ns, name, replicas in targets
+    ]
+    return json.dumps(items).encode("utf-8")
+
+
+_PLAN_NS1 = _plan(("ns1", "dep1", 1))
+_PLAN_NS1_REPLICAS_3 = _plan(("ns1", "dep1", 3))
+_PLAN_NS1_NS2 = _plan(("ns1", "dep1", 1), ("ns2", "dep2", 2))
+_PLAN_MIXED_NAMESPACES = _plan(("ns1", "dep1", 1), ("ns2", "dep1", 2))
+
+
+def _healthy_routes(namespace: str, name: str) -> dict[str, tuple[int, str, str]]:
+    # kubectl routes under which one plan item passes every verify check.
+    patched = json.dumps({"kind": "Deployment", "metadata": {"name": name}})
+    return {
+        f"get namespace/{namespace} -o name": (0, f"namespace/{namespace}", ""),
+        f"-n {namespace} get deployment/{name} -o name": (0, f"deployment.apps/{name}", ""),
+        f"-n {namespace} patch deployment/{name}": (0, patched, ""),
+        f"-n {namespace} auth can-i patch deployments": (0, "yes", ""),
+        f"-n {namespace} auth can-i get deployments": (0, "yes", ""),
+    }
+
 
-def _run(mk: Path, args: list[str], env: dict | None = None) -> subprocess.CompletedProcess[str]:
+def _run(mk_run, args: list[str], env: dict | None = None) -> subprocess.CompletedProcess[str]:
     e = os.environ.copy()
     if env:
         e.update(env)
-    return subprocess.run([str(mk), *args], text=True, capture_output=True, env=e)
+    return mk_run(args, env=e)
 
 
 def _assert_diagnostics_keys(data: dict) -> None:
@@ -26,25 +67,27 @@ def _assert_verify_blocker_present(data: dict) -> None:
     assert "verify_blocker" in data
 
 
+def _verify_report(out_dir: Path) -> dict:
+    latest = out_dir / "k8s_verify_latest.json"
+    assert latest.exists()
+    return loads(latest.read_bytes())
+
+
 def _load_explain_events(path: Path) -> list[dict]:
-    return [json.loads(line) for line in path.read_text(encoding="utf-8").splitlines() if line.strip()]
+    return [loads(line) for line in iter_lines(path)]
 
 
-def test_k8s_verify_no_kubectl_still_writes_report_ok_false(mk_path: Path, tmp_path: Path) -> None:
+def test_k8s_verify_no_kubectl_still_writes_report_ok_false(mk_run, tmp_path: Path) -> None:
     out_dir = tmp_path / "out"
     plan = tmp_path / "plan.json"
-    plan.write_text(
-        json.dumps([{"namespace": "ns1", "name": "dep1", "patch": {"spec": {"replicas": 1}}}]),
-        encoding="utf-8",
-    )
+    plan.write_bytes(_PLAN_NS1)
 
     fake = tmp_path / "nope" / "kubectl"
-    cp = _run(mk_path, ["k8s", "verify", "--plan", str(plan), "--out", str(out_dir)], env={"KUBECTL": str(fake)})
+    env = {"KUBECTL": str(fake)}
+    cp = _run(mk_run, ["k8s", "verify", "--plan", str(plan), "--out", str(out_dir)], env=env)
     assert cp.returncode == 0
 
-    latest = out_dir / "k8s_verify_latest.json"
-    assert latest.exists()
-    data = json.loads(latest.read_text(encoding="utf-8"))
+    data = _verify_report(out_dir)
     assert data["ok"] is False
     assert data["checks"]["kubectl_present"] is False
     _assert_verify_blocker_present(data)
@@ -53,62 +96,19 @@ def test_k8s_verify_no_kubectl_still_writes_report_ok_false(mk_path: Path, tmp_p
     _assert_diagnostics_keys(data)
 
 
-def test_k8s_verify_with_fake_kubectl_ok_true(mk_path: Path, tmp_path: Path) -> None:
+def test_k8s_verify_with_fake_kubectl_ok_true(
+    mk_run, fake_kubectl_factory, tmp_path: Path
+) -> None:
     out_dir = tmp_path / "out"
     plan = tmp_path / "plan.json"
-    plan.write_text(
-        json.dumps([{"namespace": "ns1", "name": "dep1", "patch": {"spec": {"replicas": 1}}}]),
-        encoding="utf-8",
-    )
+    plan.write_bytes(_PLAN_NS1)
 
-    kubectl = tmp_path / "kubectl"
-    kubectl.write_text(
-        """#!/usr/bin/env bash
-set -Eeuo pipefail
-
-if [[ $# -ge 2 && "$1" == "config" && "$2" == "current-context" ]]; then
-  echo "test-context"
-  exit 0
-fi
-
-if [[ $# -ge 4 && "$1" == "get" && "$2" == "namespace/ns1" && "$3" == "-o" && "$4" == "name" ]]; then
-  echo "namespace/ns1"
-  exit 0
-fi
-
-if [[ $# -ge 6 && "$1" == "-n" && "$2" == "ns1" && "$3" == "get" && "$4" == "deployment/dep1" && "$5" == "-o" && "$6" == "name" ]]; then
-  echo "deployment.apps/dep1"
-  exit 0
-fi
-
-if [[ $# -ge 5 && "$1" == "-n" && "$2" == "ns1" && "$3" == "patch" && "$4" == "deployment/dep1" ]]; then
-  echo '{"kind":"Deployment","metadata":{"name":"dep1"}}'
-  exit 0
-fi
-
-if [[ $# -ge 6 && "$1" == "-n" && "$2" == "ns1" && "$3" == "auth" && "$4" == "can-i" && "$5" == "patch" && "$6" == "deployments" ]]; then
-  echo "yes"
-  exit 0
-fi
-
-if [[ $# -ge 6 && "$1" == "-n" && "$2" == "ns1" && "$3" == "auth" && "$4" == "can-i" && "$5" == "get" && "$6" == "deployments" ]]; then
-  echo "yes"
-  exit 0
-fi
-
-echo "unexpected args: $*" >&2
-exit 1
-""",
-        encoding="utf-8",
-    )
-    kubectl.chmod(0o755)
+    env = fake_kubectl_factory(_CONTEXT | _healthy_routes("ns1", "dep1"))
 
-    cp = _run(mk_path, ["k8s", "verify", "--plan", str(plan), "--out", str(out_dir)], env={"KUBECTL": str(kubectl)})
+    cp = _run(mk_run, ["k8s", "verify", "--plan", str(plan), "--out", str(out_dir)], env=env)
     assert cp.returncode == 0
 
-    latest = out_dir / "k8s_verify_latest.json"
-    assert latest.exists()
-    data = json.loads(latest.read_text(encoding="utf-8"))
+    data = _verify_report(out_dir)
 
     assert data["kubectl_context"] == "test-context"
     assert data["ok"] is True
@@ -124,165 +124,87 @@ exit 1
     _assert_diagnostics_keys(data)
 
 
-def test_k8s_verify_namespace_missing_sets_blocker(mk_path: Path, tmp_path: Path) -> None:
+@pytest.mark.parametrize(
+    ("plan_bytes", "routes", "expected_kind", "dry_run_mode"),
+    [
+        pytest.param(
+            _PLAN_NS1_NS2,
+            _CONTEXT
+            | _VERSIONS
+            | {
+                "get namespace/ns1 -o name": (1, "", "namespace/ns1 not found"),
+                "-n ns1 get deployment/dep1 -o name": (1, "", "deployment.apps/dep1 not found"),
+            }
+            | _healthy_routes("ns2", "dep2"),
+            "namespace_missing",
+            None,
+            id="namespace_missing",
+        ),
+        pytest.param(
+            _PLAN_NS1_REPLICAS_3,
+            _CONTEXT
+            | _VERSIONS
+            | _healthy_routes("ns1", "dep1")
+            | {"-n ns1 patch deployment/dep1": (1, "", _PATCH_NOT_FOUND)},
+            "deployment_missing",
+            "server",
+            id="patch_not_found",
+        ),
+    ],
+)
+def test_k8s_verify_missing_target_sets_blocker(
+    mk_run,
+    fake_kubectl_factory,
+    tmp_path: Path,
+    plan_bytes: bytes,
+    routes: dict,
+    expected_kind: str,
+    dry_run_mode: str | None,
+) -> None:
     out_dir = tmp_path / "out"
     plan = tmp_path / "plan.json"
-    plan.write_text(
-        json.dumps(
-            [
-                {"namespace": "ns1", "name": "dep1", "patch": {"spec": {"replicas": 1}}},
-                {"namespace": "ns2", "name": "dep2", "patch": {"spec": {"replicas": 2}}},
-            ]
-        ),
-        encoding="utf-8",
-    )
-
-    kubectl = tmp_path / "kubectl"
-    kubectl.write_text(
-        """#!/usr/bin/env bash
-set -Eeuo pipefail
-
-if [[ $# -ge 2 && "$1" == "config" && "$2" == "current-context" ]]; then
-  echo "test-context"
-  exit 0
-fi
-
-if [[ $# -ge 4 && "$1" == "version" && "$2" == "--client" && "$3" == "-o" && "$4" == "json" ]]; then
-  echo '{"clientVersion":{"gitVersion":"v1.29.0"}}'
-  exit 0
-fi
-
-if [[ $# -ge 3 && "$1" == "version" && "$2" == "-o" && "$3" == "json" ]]; then
-  echo '{"serverVersion":{"gitVersion":"v1.28.0"}}'
-  exit 0
-fi
-
-if [[ $# -ge 4 && "$1" == "get" && "$2" == "namespace/ns1" && "$3" == "-o" && "$4" == "name" ]]; then
-  echo "namespace/ns1 not found" >&2
-  exit 1
-fi
-
-if [[ $# -ge 4 && "$1" == "get" && "$2" == "namespace/ns2" && "$3" == "-o" && "$4" == "name" ]]; then
-  echo "namespace/ns2"
-  exit 0
-fi
-
-if [[ $# -ge 6 && "$1" == "-n" && "$2" == "ns1" && "$3" == "get" && "$4" == "deployment/dep1" && "$5" == "-o" && "$6" == "name" ]]; then
-  echo "deployment.apps/dep1 not found" >&2
-  exit 1
-fi
-
-if [[ $# -ge 6 && "$1" == "-n" && "$2" == "ns2" && "$3" == "get" && "$4" == "deployment/dep2" && "$5" == "-o" && "$6" == "name" ]]; then
-  echo "deployment.apps/dep2"
-  exit 0
-fi
-
-if [[ $# -ge 5 && "$1" == "-n" && "$2" == "ns2" && "$3" == "patch" && "$4" == "deployment/dep2" ]]; then
-  echo '{"kind":"Deployment","metadata":{"name":"dep2"}}'
-  exit 0
-fi
-
-if [[ $# -ge 6 && "$1" == "-n" && "$2" == "ns2" && "$3" == "auth" && "$4" == "can-i" && "$5" == "patch" && "$6" == "deployments" ]]; then
-  echo "yes"
-  exit 0
-fi
-
-if [[ $# -ge 6 && "$1" == "-n" && "$2" == "ns2" && "$3" == "auth" && "$4" == "can-i" && "$5" == "get" && "$6" == "deployments" ]]; then
-  echo "yes"
-  exit 0
-fi
-
-echo "unexpected args: $*" >&2
-exit 1
-""",
-        encoding="utf-8",
-    )
-    kubectl.chmod(0o755)
+    plan.write_bytes(plan_bytes)
 
-    cp = _run(mk_path, ["k8s", "verify", "--plan", str(plan), "--out", str(out_dir)], env={"KUBECTL": str(kubectl)})
+    env = fake_kubectl_factory(routes)
+    cp = _run(mk_run, ["k8s", "verify", "--plan", str(plan), "--out", str(out_dir)], env=env)
     assert cp.returncode == 0
 
-    latest = out_dir / "k8s_verify_latest.json"
-    assert latest.exists()
-    data = json.loads(latest.read_text(encoding="utf-8"))
+    data = _verify_report(out_dir)
     assert data["ok"] is False
     _assert_verify_blocker_present(data)
-    assert data["verify_blocker"]["kind"] == "namespace_missing"
+    assert data["verify_blocker"]["kind"] == expected_kind
     assert data["verify_blocker"]["index"] == 0
     assert data["verify_blocker"]["namespace"] == "ns1"
     assert data["verify_blocker"]["name"] == "dep1"
+    assert data["checks"]["items"][0]["dry_run"]["mode"] == dry_run_mode
     _assert_diagnostics_keys(data)
 
 
-def test_k8s_verify_patch_forbidden_sets_rbac_denied_blocker(mk_path: Path, tmp_path: Path) -> None:
+def test_k8s_verify_patch_forbidden_sets_rbac_denied_blocker(
+    mk_run, fake_kubectl_factory, tmp_path: Path
+) -> None:
     out_dir = tmp_path / "out"
     plan = tmp_path / "plan.json"
-    plan.write_text(
-        json.dumps([{"namespace": "ns1", "name": "dep1", "patch": {"spec": {"replicas": 3}}}]),
-        encoding="utf-8",
-    )
-
-    kubectl = tmp_path / "kubectl"
-    kubectl.write_text(
-        """#!/usr/bin/env bash
-set -Eeuo pipefail
-
-if [[ $# -ge 2 && "$1" == "config" && "$2" == "current-context" ]]; then
-  echo "test-context"
-  exit 0
-fi
-
-if [[ $# -ge 4 && "$1" == "version" && "$2" == "--client" && "$3" == "-o" && "$4" == "json" ]]; then
-  echo '{"clientVersion":{"gitVersion":"v1.29.0"}}'
-  exit 0
-fi
-
-if [[ $# -ge 3 && "$1" == "version" && "$2" == "-o" && "$3" == "json" ]]; then
-  echo '{"serverVersion":{"gitVersion":"v1.28.0"}}'
-  exit 0
-fi
-
-if [[ $# -ge 4 && "$1" == "get" && "$2" == "namespace/ns1" && "$3" == "-o" && "$4" == "name" ]]; then
-  echo "namespace/ns1"
-  exit 0
-fi
-
-if [[ $# -ge 6 && "$1" == "-n" && "$2" == "ns1" && "$3" == "get" && "$4" == "deployment/dep1" && "$5" == "-o" && "$6" == "name" ]]; then
-  echo "deployment.apps/dep1"
-  exit 0
-fi
-
-if [[ $# -ge 5 && "$1" == "-n" && "$2" == "ns1" && "$3" == "patch" && "$4" == "deployment/dep1" ]]; then
-  echo 'Error from server (Forbidden): deployments.apps "dep1" is forbidden: User "system:serviceaccount:ns1:sa" cannot patch resource "deployments" in API group "apps" in the namespace "ns1"' >&2
-  exit 1
-fi
-
-if [[ $# -ge 6 && "$1" == "-n" && "$2" == "ns1" && "$3" == "auth" && "$4" == "can-i" && "$5" == "patch" && "$6" == "deployments" ]]; then
-  echo "no"
-  exit 1
-fi
-
-if [[ $# -ge 6 && "$1" == "-n" && "$2" == "ns1" && "$3" == "auth" && "$4" == "can-i" && "$5" == "get" && "$6" == "deployments" ]]; then
-  echo "yes"
-  exit 0
-fi
-
-echo "unexpected args: $*" >&2
-exit 1
-""",
-        encoding="utf-8",
+    plan.write_bytes(_PLAN_NS1_REPLICAS_3)
+
+    env = fake_kubectl_factory(
+        _CONTEXT
+        | _VERSIONS
+        | _healthy_routes("ns1", "dep1")
+        | {
+            "-n ns1 patch deployment/dep1": (1, "", _PATCH_FORBIDDEN),
+            "-n ns1 auth can-i patch deployments": (1, "no", ""),
+        }
     )
-    kubectl.chmod(0o755)
 
-    cp = _run(mk_path, ["k8s", "verify", "--plan", str(plan), "--out", str(out_dir)], env={"KUBECTL": str(kubectl)})
+    cp = _run(mk_run, ["k8s", "verify", "--plan", str(plan), "--out", str(out_dir)], env=env)
     assert cp.returncode == 0
 
-    latest = out_dir / "k8s_verify_latest.json"
-    data = json.loads(latest.read_text(encoding="utf-8"))
+    data = _verify_report(out_dir)
     assert data["ok"] is False
     assert data["checks"]["items"][0]["dry_run"]["mode"] == "server"
     assert data["verify_blocker"]["kind"] == "rbac_denied"
-    rbac = data.get("details", {}).get("rbac")
+    rbac = data["details"]["rbac"]
     assert isinstance(rbac, dict)
     assert rbac["user"] == "system:serviceaccount:ns1:sa"
     assert rbac["verb"] == "patch"
@@ -295,181 +217,30 @@ exit 1
     assert data["diagnostics"]["auth_can_i_get_deployments"] is True
 
 
-def test_k8s_verify_patch_not_found_sets_deployment_missing_blocker(mk_path: Path, tmp_path: Path) -> None:
-    out_dir = tmp_path / "out"
-    plan = tmp_path / "plan.json"
-    plan.write_text(
-        json.dumps([{"namespace": "ns1", "name": "dep1", "patch": {"spec": {"replicas": 3}}}]),
-        encoding="utf-8",
-    )
-
-    kubectl = tmp_path / "kubectl"
-    kubectl.write_text(
-        """#!/usr/bin/env bash
-set -Eeuo pipefail
-
-if [[ $# -ge 2 && "$1" == "config" && "$2" == "current-context" ]]; then
-  echo "test-context"
-  exit 0
-fi
-
-if [[ $# -ge 4 && "$1" == "version" && "$2" == "--client" && "$3" == "-o" && "$4" == "json" ]]; then
-  echo '{"clientVersion":{"gitVersion":"v1.29.0"}}'
-  exit 0
-fi
-
-if [[ $# -ge 3 && "$1" == "version" && "$2" == "-o" && "$3" == "json" ]]; then
-  echo '{"serverVersion":{"gitVersion":"v1.28.0"}}'
-  exit 0
-fi
-
-if [[ $# -ge 4 && "$1" == "get" && "$2" == "namespace/ns1" && "$3" == "-o" && "$4" == "name" ]]; then
-  echo "namespace/ns1"
-  exit 0
-fi
-
-if [[ $# -ge 6 && "$1" == "-n" && "$2" == "ns1" && "$3" == "get" && "$4" == "deployment/dep1" && "$5" == "-o" && "$6" == "name" ]]; then
-  echo "deployment.apps/dep1"
-  exit 0
-fi
-
-if [[ $# -ge 5 && "$1" == "-n" && "$2" == "ns1" && "$3" == "patch" && "$4" == "deployment/dep1" ]]; then
-  echo 'Error from server (NotFound): deployments.apps "dep1" not found' >&2
-  exit 1
-fi
-
-if [[ $# -ge 6 && "$1" == "-n" && "$2" == "ns1" && "$3" == "auth" && "$4" == "can-i" && "$5" == "patch" && "$6" == "deployments" ]]; then
-  echo "yes"
-  exit 0
-fi
-
-if [[ $# -ge 6 && "$1" == "-n" && "$2" == "ns1" && "$3" == "auth" && "$4" == "can-i" && "$5" == "get" && "$6" == "deployments" ]]; then
-  echo "yes"
-  exit 0
-fi
-
-echo "unexpected args: $*" >&2
-exit 1
-""",
-        encoding="utf-8",
-    )
-    kubectl.chmod(0o755)
-
-    cp = _run(mk_path, ["k8s", "verify", "--plan", str(plan), "--out", str(out_dir)], env={"KUBECTL": str(kubectl)})
-    assert cp.returncode == 0
-
-    latest = out_dir / "k8s_verify_latest.json"
-    data = json.loads(latest.read_text(encoding="utf-8"))
-    assert data["ok"] is False
-    assert data["checks"]["items"][0]["dry_run"]["mode"] == "server"
-    assert data["verify_blocker"]["kind"] == "deployment_missing"
-
-
 def test_k8s_verify_mixed_namespaces_collects_auth_can_i_per_namespace(
-    mk_path: Path, tmp_path: Path
+    mk_run, fake_kubectl_factory, tmp_path: Path
 ) -> None:
     out_dir = tmp_path / "out"
     plan = tmp_path / "plan.json"
     calls_path = tmp_path / "auth_calls.txt"
-    plan.write_text(
-        json.dumps(
-            [
-                {"namespace": "ns1", "name": "dep1", "patch": {"spec": {"replicas": 1}}},
-                {"namespace": "ns2", "name": "dep1", "patch": {"spec": {"replicas": 2}}},
-            ]
-        ),
-        encoding="utf-8",
-    )
-
-    kubectl = tmp_path / "kubectl"
-    kubectl.write_text(
-        """#!/usr/bin/env bash
-set -Eeuo pipefail
-
-if [[ "$*" == *" auth can-i "* ]]; then
-  echo "$*" >> "${CALLS_PATH}"
-  if [[ "$*" == *"-n ns1"* && "$*" == *" can-i patch deployments"* ]]; then
-    echo "yes"
-    exit 0
-  fi
-  if [[ "$*" == *"-n ns1"* && "$*" == *" can-i get deployments"* ]]; then
-    echo "yes"
-    exit 0
-  fi
-  if [[ "$*" == *"-n ns2"* && "$*" == *" can-i patch deployments"* ]]; then
-    echo "maybe"
-    exit 0
-  fi
-  if [[ "$*" == *"-n ns2"* && "$*" == *" can-i get deployments"* ]]; then
-    echo "yes"
-    exit 0
-  fi
-  echo "unexpected auth args: $*" >&2
-  exit 1
-fi
-
-if [[ $# -ge 2 && "$1" == "config" && "$2" == "current-context" ]]; then
-  echo "test-context"
-  exit 0
-fi
-
-if [[ $# -ge 4 && "$1" == "version" && "$2" == "--client" && "$3" == "-o" && "$4" == "json" ]]; then
-  echo '{"clientVersion":{"gitVersion":"v1.29.0"}}'
-  exit 0
-fi
-
-if [[ $# -ge 3 && "$1" == "version" && "$2" == "-o" && "$3" == "json" ]]; then
-  echo '{"serverVersion":{"gitVersion":"v1.28.0"}}'
-  exit 0
-fi
-
-if [[ $# -ge 4 && "$1" == "get" && "$2" == "namespace/ns1" && "$3" == "-o" && "$4" == "name" ]]; then
-  echo "namespace/ns1"
-  exit 0
-fi
-
-if [[ $# -ge 4 && "$1" == "get" && "$2" == "namespace/ns2" && "$3" == "-o" && "$4" == "name" ]]; then
-  echo "namespace/ns2"
-  exit 0
-fi
-
-if [[ $# -ge 6 && "$1" == "-n" && "$2" == "ns1" && "$3" == "get" && "$4" == "deployment/dep1" && "$5" == "-o" && "$6" == "name" ]]; then
-  echo "deployment.apps/dep1"
-  exit 0
-fi
-
-if [[ $# -ge 6 && "$1" == "-n" && "$2" == "ns2" && "$3" == "get" && "$4" == "deployment/dep1" && "$5" == "-o" && "$6" == "name" ]]; then
-  echo "deployment.apps/dep1"
-  exit 0
-fi
-
-if [[ $# -ge 5 && "$1" == "-n" && "$2" == "ns1" && "$3" == "patch" && "$4" == "deployment/dep1" ]]; then
-  echo '{"kind":"Deployment","metadata":{"name":"dep1"}}'
-  exit 0
-fi
-
-if [[ $# -ge 5 && "$1" == "-n" && "$2" == "ns2" && "$3" == "patch" && "$4" == "deployment/dep1" ]]; then
-  echo '{"kind":"Deployment","metadata":{"name":"dep1"}}'
-  exit 0
-fi
-
-echo "unexpected args: $*" >&2
-exit 1
-""",
-        encoding="utf-8",
+    plan.write_bytes(_PLAN_MIXED_NAMESPACES)
+
+    env = fake_kubectl_factory(
+        _CONTEXT
+        | _VERSIONS
+        | _healthy_routes("ns1", "dep1")
+        | _healthy_routes("ns2", "dep1")
+        | {"-n ns2 auth can-i patch deployments": (0, "maybe", "")}
     )
-    kubectl.chmod(0o755)
 
     cp = _run(
-        mk_path,
+        mk_run,
         ["k8s", "verify", "--plan", str(plan), "--out", str(out_dir)],
-        env={"KUBECTL": str(kubectl), "CALLS_PATH": str(calls_path)},
+        env=env | {"FAKE_KUBECTL_LOG": str(calls_path)},
     )
     assert cp.returncode == 0
 
-    latest = out_dir / "k8s_verify_latest.json"
-    assert latest.exists()
-    data = json.loads(latest.read_text(encoding="utf-8"))
+    data = _verify_report(out_dir)
     _assert_diagnostics_keys(data)
     assert data["diagnostics"]["auth_can_i_patch_deployments"] is None
     assert data["diagnostics"]["auth_can_i_get_deployments"] is None
@@ -1,59 +1,53 @@
-import json
-import subprocess
+import os
 from pathlib import Path
 
-
-def _run(mk: Path, args: list[str], env: dict | None = None) -> subprocess.CompletedProcess[str]:
-    e = None
-    if env is not None:
-        import os
-        e = os.environ.copy()
-        e.update(env)
-    return subprocess.run([str(mk), *args], text=True, capture_output=True, env=e)
+_PLAN_EMPTY_NAMESPACE = b'[{"namespace": "", "name": "dep1", "patch": {}}]'
+_PLAN_NOT_A_LIST = b'{"not": "a list"}'
 
 
 def _assert_no_verify_artifacts(out_dir: Path) -> None:
-    assert not (out_dir / "k8s_verify_latest.json").exists()
-    assert not any(out_dir.glob("k8s_verify_*.json"))
+    names = {entry.name for entry in os.scandir(out_dir)}
+    assert "k8s_verify_latest.json" not in names
+    assert not any(n.startswith("k8s_verify_") and n.endswith(".json") for n in names)
 
 
-def test_k8s_verify_missing_plan_writes_explain_no_artifacts(mk_path: Path, tmp_path: Path) -> None:
+def test_k8s_verify_missing_plan_writes_explain_no_artifacts(mk_invoke, tmp_path: Path) -> None:
     out_dir = tmp_path / "out"
     plan = tmp_path / "missing.json"
-    cp = _run(mk_path, ["k8s", "verify", "--plan", str(plan), "--out", str(out_dir)])
+    cp = mk_invoke(["k8s", "verify", "--plan", str(plan), "--out", str(out_dir)])
     assert cp.returncode == 2
     assert (out_dir / "explain.jsonl").exists()
     _assert_no_verify_artifacts(out_dir)
 
 
-def test_k8s_verify_invalid_json_writes_explain_no_artifacts(mk_path: Path, tmp_path: Path) -> None:
+def test_k8s_verify_invalid_json_writes_explain_no_artifacts(mk_invoke, tmp_path: Path) -> None:
     out_dir = tmp_path / "out"
     plan = tmp_path / "plan.json"
-    plan.write_text("{", encoding="utf-8")
+    plan.write_bytes(b"{")
 
-    cp = _run(mk_path, ["k8s", "verify", "--plan", str(plan), "--out", str(out_dir)])
+    cp = mk_invoke(["k8s", "verify", "--plan", str(plan), "--out", str(out_dir)])
     assert cp.returncode == 2
     assert (out_dir / "explain.jsonl").exists()
     _assert_no_verify_artifacts(out_dir)
 
 
-def test_k8s_verify_invalid_item_writes_explain_no_artifacts(mk_path: Path, tmp_path: Path) -> None:
+def test_k8s_verify_invalid_item_writes_explain_no_artifacts(mk_invoke, tmp_path: Path) -> None:
     out_dir = tmp_path / "out"
     plan = tmp_path / "plan.json"
-    plan.write_text(json.dumps([{"namespace": "", "name": "dep1", "patch": {}}]), encoding="utf-8")
+    plan.write_bytes(_PLAN_EMPTY_NAMESPACE)
 
-    cp = _run(mk_path, ["k8s", "verify", "--plan", str(plan), "--out", str(out_dir)])
+    cp = mk_invoke(["k8s", "verify", "--plan", str(plan), "--out", str(out_dir)])
     assert cp.returncode == 2
     assert (out_dir / "explain.jsonl").exists()
     _assert_no_verify_artifacts(out_dir)
 
 
-def test_k8s_verify_invalid_shape_writes_explain_no_artifacts(mk_path: Path, tmp_path: Path) -> None:
+def test_k8s_verify_invalid_shape_writes_explain_no_artifacts(mk_invoke, tmp_path: Path) -> None:
     out_dir = tmp_path / "out"
     plan = tmp_path / "plan.json"
-    plan.write_text(json.dumps({"not": "a list"}), encoding="utf-8")
+    plan.write_bytes(_PLAN_NOT_A_LIST)
 
-    cp = _run(mk_path, ["k8s", "verify", "--plan", str(plan), "--out", str(out_dir)])
+    cp = mk_invoke(["k8s", "verify", "--plan", str(plan), "--out", str(out_dir)])
     assert cp.returncode == 2
     assert (out_dir / "explain.jsonl").exists()
     _assert_no_verify_artifacts(out_dir)
@@ -4,12 +4,12 @@ from pathlib import Path
 
 
 def test_closed_loop_memory_pressure_synthetic_produces_non_zero_proof(
-    tmp_path: Path, mk_path: Path
+    tmp_path: Path, mk: str
 ) -> None:
     out_dir = tmp_path / "proof_memory_pressure"
     cp = subprocess.run(
         [
-            str(mk_path),
+            mk,
             "closed-loop",
             "run",
             "--scenario",
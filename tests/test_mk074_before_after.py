@@ -1,44 +1,39 @@
-import json
-import subprocess
 from pathlib import Path
 
+from _jsonl import loads
 
-def test_mk074_before_after_cli_deterministic(tmp_path: Path, mk_path: Path) -> None:
-    observe_path = Path("tests/data/observe/bursty.jsonl")
+_BURSTY_OBSERVE = Path(__file__).resolve().parent / "data" / "observe" / "bursty.jsonl"
+
+
+def test_mk074_before_after_cli_deterministic(tmp_path: Path, mk_invoke) -> None:
     out_dir_a = tmp_path / "out_a"
     out_dir_b = tmp_path / "out_b"
 
-    cp_a = subprocess.run(
+    cp_a = mk_invoke(
         [
-            str(mk_path),
             "roi",
             "mk074",
             "--observe-source",
             "file",
             "--observe-path",
-            str(observe_path),
+            str(_BURSTY_OBSERVE),
             "--out",
             str(out_dir_a),
         ],
-        text=True,
-        capture_output=True,
     )
     assert cp_a.returncode == 0, cp_a.stderr
 
-    cp_b = subprocess.run(
+    cp_b = mk_invoke(
         [
-            str(mk_path),
             "roi",
             "mk074",
             "--observe-source",
             "file",
             "--observe-path",
-            str(observe_path),
+            str(_BURSTY_OBSERVE),
             "--out",
             str(out_dir_b),
         ],
-        text=True,
-        capture_output=True,
     )
     assert cp_b.returncode == 0, cp_b.stderr
 
@@ -56,25 +51,22 @@ def test_mk074_before_after_cli_deterministic(tmp_path: Path, mk_path: Path) ->
     assert after_b.exists()
     assert combined_b.exists()
 
-    combined = json.loads(combined_a.read_text(encoding="utf-8"))
+    combined_bytes = combined_a.read_bytes()
+    combined = loads(combined_bytes)
     assert combined.get("schema_version") == "mk074_before_after.v0"
 
-    before = combined.get("before")
-    after = combined.get("after")
-    assert isinstance(before, dict)
-    assert isinstance(after, dict)
-    assert isinstance(before.get("timeline"), list)
-    assert isinstance(after.get("timeline"), list)
-    assert isinstance(before.get("summary"), dict)
-    assert isinstance(after.get("summary"), dict)
+    for side in ("before", "after"):
+        section = combined.get(side)
+        assert isinstance(section, dict), side
+        assert isinstance(section.get("timeline"), list), side
+        assert isinstance(section.get("summary"), dict), side
 
     diff = combined.get("diff", {})
     assert diff.get("estimated_apply_steps_saved", -1) >= 0
 
-    combined_text = json.dumps(combined, ensure_ascii=False, sort_keys=True)
-    assert "latency_ms" not in combined_text
-    assert "worker_latencies_ms" not in combined_text
-    assert "samples" not in combined_text
+    assert b"latency_ms" not in combined_bytes
+    assert b"worker_latencies_ms" not in combined_bytes
+    assert b"samples" not in combined_bytes
 
-    assert combined_a.read_text(encoding="utf-8") == combined_b.read_text(encoding="utf-8")
+    assert combined_bytes == combined_b.read_bytes()
 
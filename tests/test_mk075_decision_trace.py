@@ -1,15 +1,15 @@
-import json
-import subprocess
 from pathlib import Path
 
+from _jsonl import loads
 
-def test_closed_loop_writes_decision_trace_jsonl(tmp_path: Path, mk_path: Path) -> None:
+_BURSTY_OBSERVE = Path(__file__).resolve().parent / "data" / "observe" / "bursty.jsonl"
+
+
+def test_closed_loop_writes_decision_trace_jsonl(tmp_path: Path, mk_invoke) -> None:
     out_dir = tmp_path / "closed_loop_out"
-    observe_path = Path(__file__).resolve().parent / "data" / "observe" / "bursty.jsonl"
 
-    cp = subprocess.run(
+    cp = mk_invoke(
         [
-            str(mk_path),
             "closed-loop",
             "run",
             "--scenario",
@@ -18,12 +18,10 @@ def test_closed_loop_writes_decision_trace_jsonl(tmp_path: Path, mk_path: Path)
             "--observe-source",
             "file",
             "--observe-path",
-            str(observe_path),
+            str(_BURSTY_OBSERVE),
             "--out",
             str(out_dir),
         ],
-        text=True,
-        capture_output=True,
     )
     assert cp.returncode == 0
 
@@ -39,15 +37,17 @@ def test_closed_loop_writes_decision_trace_jsonl(tmp_path: Path, mk_path: Path)
         "actions",
         "results",
     }
-    lines = trace_path.read_text(encoding="utf-8").splitlines()
-    assert lines
-    for line in lines:
-        event = json.loads(line)
-        assert isinstance(event, dict)
-        assert required_keys.issubset(event.keys())
-        assert event.get("schema_version") == "decision_trace_event.v0"
-
-    latest = json.loads((out_dir / "closed_loop_latest.json").read_text(encoding="utf-8"))
+    event_count = 0
+    with trace_path.open("rb") as trace:
+        for line in trace:
+            event = loads(line)
+            assert isinstance(event, dict)
+            assert required_keys.issubset(event.keys())
+            assert event.get("schema_version") == "decision_trace_event.v0"
+            event_count += 1
+    assert event_count
+
+    latest = loads((out_dir / "closed_loop_latest.json").read_bytes())
     audit_trace = latest.get("audit_trace")
     assert isinstance(audit_trace, dict)
     assert audit_trace.get("path") == "decision_trace_latest.jsonl"
@@ -1,49 +1,49 @@
 import hashlib
 import json
-import os
-import subprocess
+from collections.abc import Mapping
 from pathlib import Path
 
+from _jsonl import loads
 
-def _run(mk: Path, args: list[str], env: dict | None = None) -> subprocess.CompletedProcess[str]:
-    process_env = os.environ.copy()
-    if env:
-        process_env.update(env)
-    return subprocess.run([str(mk), *args], text=True, capture_output=True, env=process_env)
+_DEPLOYMENTS = {
+    "items": [
+        {"metadata": {"namespace": "z-ns", "name": "z-app"}},
+        {
+            "metadata": {
+                "namespace": "default",
+                "name": "trainer",
+                "annotations": {
+                    "modekeeper/policy.ref": "safe",
+                    "modekeeper/policy.version": "old",
+                },
+            }
+        },
+    ]
+}
+_ROUTES = {
+    "config current-context": (0, "ctx-a", ""),
+    "--context ctx-a get deployments -A -o json": (0, json.dumps(_DEPLOYMENTS), ""),
+}
 
 
-def test_mk078_fleet_policy_propagation_with_path_stub(tmp_path: Path, mk_path: Path) -> None:
+def test_mk078_fleet_policy_propagation_with_path_stub(
+    tmp_path: Path,
+    mk_run,
+    fake_kubectl: Path,
+    fake_kubectl_factory,
+    base_env: Mapping[str, str],
+) -> None:
     bin_dir = tmp_path / "bin"
     bin_dir.mkdir(parents=True, exist_ok=True)
-    kubectl = bin_dir / "kubectl"
-    kubectl.write_text(
-        """#!/usr/bin/env bash
-set -Eeuo pipefail
-
-if [[ $# -eq 2 && "$1" == "config" && "$2" == "current-context" ]]; then
-  echo "ctx-a"
-  exit 0
-fi
-
-if [[ $# -eq 7 && "$1" == "--context" && "$2" == "ctx-a" && "$3" == "get" && "$4" == "deployments" && "$5" == "-A" && "$6" == "-o" && "$7" == "json" ]]; then
-  echo '{"items":[{"metadata":{"namespace":"z-ns","name":"z-app"}},{"metadata":{"namespace":"default","name":"trainer","annotations":{"modekeeper/policy.ref":"safe","modekeeper/policy.version":"old"}}}]}'
-  exit 0
-fi
-
-echo "unexpected args: $*" >&2
-exit 1
-""",
-        encoding="utf-8",
-    )
-    kubectl.chmod(0o755)
+    (bin_dir / "kubectl").symlink_to(fake_kubectl)
 
     policy_file = tmp_path / "policy.json"
     policy_file.write_text('{"mode":"safe","limit":2}\n', encoding="utf-8")
 
     out_dir = tmp_path / "out"
-    env = {"PATH": f"{bin_dir}:{os.environ.get('PATH', '')}"}
-    cp = _run(
-        mk_path,
+    path = f"{bin_dir}:{base_env.get('PATH', '')}"
+    env = base_env | fake_kubectl_factory(_ROUTES, exact=True) | {"PATH": path}
+    cp = mk_run(
         ["fleet", "policy", "--policy", str(policy_file), "--out", str(out_dir)],
         env=env,
     )
@@ -51,7 +51,7 @@ exit 1
 
     latest = out_dir / "policy_propagation_latest.json"
     assert latest.exists()
-    data = json.loads(latest.read_text(encoding="utf-8"))
+    data = loads(latest.read_bytes())
 
     expected_sha = hashlib.sha256(policy_file.read_bytes()).hexdigest()
     assert data.get("schema") == "policy_propagation.v0"
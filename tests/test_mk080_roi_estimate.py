@@ -1,25 +1,17 @@
-import json
-import subprocess
 from pathlib import Path
 
+from _jsonl import loads
 
-def test_mk080_roi_estimate_cli_non_actionable(tmp_path: Path, mk_path: Path) -> None:
-    observe_path = tmp_path / "observe.jsonl"
-    rows: list[dict[str, object]] = []
-    for idx in range(200):
-        step_time_ms = 120000 if idx % 7 == 0 else 2000
-        rows.append(
-            {
-                "ts": 1_700_000_000 + idx,
-                "step_time_ms": step_time_ms,
-            }
-        )
-    observe_path.write_text("\n".join(json.dumps(row) for row in rows) + "\n", encoding="utf-8")
+_OBSERVE_DATA = Path(__file__).resolve().parent / "data" / "observe"
+
+
+def test_mk080_roi_estimate_cli_non_actionable(tmp_path: Path, mk_invoke) -> None:
+    # 200 samples at 1s spacing; every 7th step stalls at 120s against a 2s baseline.
+    observe_path = _OBSERVE_DATA / "periodic_stalls.jsonl"
 
     out_dir = tmp_path / "out"
-    cp = subprocess.run(
+    cp = mk_invoke(
         [
-            str(mk_path),
             "roi",
             "estimate",
             "--observe-source",
@@ -29,15 +21,14 @@ def test_mk080_roi_estimate_cli_non_actionable(tmp_path: Path, mk_path: Path) ->
             "--out",
             str(out_dir),
         ],
-        text=True,
-        capture_output=True,
     )
     assert cp.returncode == 0, cp.stderr
 
     latest_path = out_dir / "roi_estimate_latest.json"
     assert latest_path.exists()
 
-    latest = json.loads(latest_path.read_text(encoding="utf-8"))
+    latest_bytes = latest_path.read_bytes()
+    latest = loads(latest_bytes)
     assert latest.get("schema_version") == "roi_estimate.v0"
     assert latest.get("summary", {}).get("samples") == 200
 
@@ -49,8 +40,7 @@ def test_mk080_roi_estimate_cli_non_actionable(tmp_path: Path, mk_path: Path) ->
     assert float(speedup_range[1]) > 0
     assert float(latency_range[1]) > 0
 
-    text = latest_path.read_text(encoding="utf-8")
     forbidden = ["actions", "knob", "target", "chord", "k8s_plan", "decision_trace"]
-    lower_text = text.lower()
+    lower_text = latest_bytes.decode("utf-8").lower()
     for marker in forbidden:
         assert marker not in lower_text
@@ -1,13 +1,13 @@
-import json
-import subprocess
 from pathlib import Path
 
+from _jsonl import dumps, loads
 
-def test_mk084_chords_validate_ok(tmp_path: Path, mk_path: Path) -> None:
+
+def test_mk084_chords_validate_ok(tmp_path: Path, mk_invoke) -> None:
     catalog_path = tmp_path / "catalog_ok.json"
     out_dir = tmp_path / "out"
-    catalog_path.write_text(
-        json.dumps(
+    catalog_path.write_bytes(
+        dumps(
             {
                 "schema_version": "chord_catalog.v1",
                 "chords": [
@@ -21,16 +21,14 @@ def test_mk084_chords_validate_ok(tmp_path: Path, mk_path: Path) -> None:
                     }
                 ],
             },
-            indent=2,
+            indent=True,
             sort_keys=True,
         )
-        + "\n",
-        encoding="utf-8",
+        + b"\n"
     )
 
-    cp = subprocess.run(
+    cp = mk_invoke(
         [
-            str(mk_path),
             "chords",
             "validate",
             "--catalog",
@@ -38,14 +36,12 @@ def test_mk084_chords_validate_ok(tmp_path: Path, mk_path: Path) -> None:
             "--out",
             str(out_dir),
         ],
-        text=True,
-        capture_output=True,
     )
     assert cp.returncode == 0
 
     report_path = out_dir / "chords_validate_latest.json"
     assert report_path.exists()
-    report = json.loads(report_path.read_text(encoding="utf-8"))
+    report = loads(report_path.read_bytes())
     assert report == {
         "schema_version": "chords_validate.v0",
         "ok": True,
@@ -55,11 +51,11 @@ def test_mk084_chords_validate_ok(tmp_path: Path, mk_path: Path) -> None:
     }
 
 
-def test_mk084_chords_validate_bad(tmp_path: Path, mk_path: Path) -> None:
+def test_mk084_chords_validate_bad(tmp_path: Path, mk_invoke) -> None:
     catalog_path = tmp_path / "catalog_bad.json"
     out_dir = tmp_path / "out"
-    catalog_path.write_text(
-        json.dumps(
+    catalog_path.write_bytes(
+        dumps(
             {
                 "schema_version": "chord_catalog.v1",
                 "chords": [
@@ -72,16 +68,14 @@ def test_mk084_chords_validate_bad(tmp_path: Path, mk_path: Path) -> None:
                     }
                 ],
             },
-            indent=2,
+            indent=True,
             sort_keys=True,
         )
-        + "\n",
-        encoding="utf-8",
+        + b"\n"
     )
 
-    cp = subprocess.run(
+    cp = mk_invoke(
         [
-            str(mk_path),
             "chords",
             "validate",
             "--catalog",
@@ -89,12 +83,10 @@ def test_mk084_chords_validate_bad(tmp_path: Path, mk_path: Path) -> None:
             "--out",
             str(out_dir),
         ],
-        text=True,
-        capture_output=True,
     )
     assert cp.returncode == 2
 
-    report = json.loads((out_dir / "chords_validate_latest.json").read_text(encoding="utf-8"))
+    report = loads((out_dir / "chords_validate_latest.json").read_bytes())
     assert report.get("schema_version") == "chords_validate.v0"
     assert report.get("ok") is False
     assert report.get("chord_count") == 1
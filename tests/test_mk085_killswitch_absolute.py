@@ -1,55 +1,47 @@
-import json
-import os
-import subprocess
+from collections.abc import Mapping
 from pathlib import Path
 
+from _jsonl import iter_lines, loads
 
-def _write_plan(path: Path) -> None:
-    path.write_text(
-        json.dumps([{"namespace": "ns1", "name": "dep1", "patch": {"spec": {"replicas": 2}}}]),
-        encoding="utf-8",
-    )
-
+_STABLE_OBSERVE = Path(__file__).resolve().parent / "data" / "observe" / "stable.jsonl"
 
-def _run(mk: Path, args: list[str], env: dict) -> subprocess.CompletedProcess[str]:
-    return subprocess.run([str(mk), *args], text=True, capture_output=True, env=env)
+_KILL_SWITCH_WITH_OVERRIDE = {
+    "MODEKEEPER_KILL_SWITCH": "1",
+    "MODEKEEPER_PAID": "1",
+    "MODEKEEPER_INTERNAL_OVERRIDE": "1",
+}
 
 
 def _read_jsonl(path: Path) -> list[dict]:
-    return [json.loads(line) for line in path.read_text(encoding="utf-8").splitlines() if line.strip()]
+    return [loads(line) for line in iter_lines(path)]
 
 
-def test_k8s_apply_kill_switch_blocks_even_with_override(tmp_path: Path, mk_path: Path) -> None:
-    plan = tmp_path / "plan.json"
-    _write_plan(plan)
+def test_k8s_apply_kill_switch_blocks_even_with_override(
+    tmp_path: Path, mk_run, base_env: Mapping[str, str], tiny_plan: Path
+) -> None:
     out_dir = tmp_path / "out"
 
-    env = {
-        **os.environ,
-        "MODEKEEPER_KILL_SWITCH": "1",
-        "MODEKEEPER_PAID": "1",
-        "MODEKEEPER_INTERNAL_OVERRIDE": "1",
-    }
-    cp = _run(mk_path, ["k8s", "apply", "--plan", str(plan), "--out", str(out_dir)], env)
+    env = base_env | _KILL_SWITCH_WITH_OVERRIDE
+    cp = mk_run(
+        ["k8s", "apply", "--plan", str(tiny_plan), "--out", str(out_dir)],
+        env=env,
+        capture_stdout=False,
+    )
     assert cp.returncode == 2
     assert cp.stderr.strip() == "ERROR: MODEKEEPER_KILL_SWITCH=1 blocks apply/mutate operations"
-    report = json.loads((out_dir / "k8s_apply_latest.json").read_text(encoding="utf-8"))
+    report = loads((out_dir / "k8s_apply_latest.json").read_bytes())
     assert report.get("block_reason") == "kill_switch_active"
     assert report.get("reason") == "kill_switch_active"
     assert report.get("kill_switch_signal") == "env:MODEKEEPER_KILL_SWITCH"
 
 
-def test_closed_loop_apply_kill_switch_blocks_even_with_override(tmp_path: Path, mk_path: Path) -> None:
+def test_closed_loop_apply_kill_switch_blocks_even_with_override(
+    tmp_path: Path, mk_run, base_env: Mapping[str, str]
+) -> None:
     out_dir = tmp_path / "out"
 
-    env = {
-        **os.environ,
-        "MODEKEEPER_KILL_SWITCH": "1",
-        "MODEKEEPER_PAID": "1",
-        "MODEKEEPER_INTERNAL_OVERRIDE": "1",
-    }
-    cp = _run(
-        mk_path,
+    env = base_env | _KILL_SWITCH_WITH_OVERRIDE
+    cp = mk_run(
         [
             "closed-loop",
             "run",
@@ -61,12 +53,13 @@ def test_closed_loop_apply_kill_switch_blocks_even_with_override(tmp_path: Path,
             "--out",
             str(out_dir),
         ],
-        env,
+        env=env,
+        capture_stdout=False,
     )
     assert cp.returncode == 2
     assert cp.stderr.strip() == "ERROR: MODEKEEPER_KILL_SWITCH=1 blocks apply/mutate operations"
 
-    latest = json.loads((out_dir / "closed_loop_latest.json").read_text(encoding="utf-8"))
+    latest = loads((out_dir / "closed_loop_latest.json").read_bytes())
     assert latest.get("apply_blocked_reason") == "kill_switch_active"
     assert latest.get("kill_switch_active") is True
     assert latest.get("kill_switch_signal") == "env:MODEKEEPER_KILL_SWITCH"
@@ -86,28 +79,13 @@ def test_closed_loop_apply_kill_switch_blocks_even_with_override(tmp_path: Path,
     assert payload.get("kill_switch_signal") == "env:MODEKEEPER_KILL_SWITCH"
 
 
-def test_closed_loop_watch_apply_kill_switch_at_entrypoint(tmp_path: Path, mk_path: Path) -> None:
+def test_closed_loop_watch_apply_kill_switch_at_entrypoint(
+    tmp_path: Path, mk_run, base_env: Mapping[str, str]
+) -> None:
     out_dir = tmp_path / "watch_out"
-    observe_path = tmp_path / "observe.jsonl"
-    observe_path.write_text(
-        "\n".join(
-            [
-                '{"ts":"2026-01-01T00:00:00Z","step_time_ms":100,"loss":1.0}',
-                '{"ts":"2026-01-01T00:00:01Z","step_time_ms":100,"loss":1.0}',
-            ]
-        )
-        + "\n",
-        encoding="utf-8",
-    )
 
-    env = {
-        **os.environ,
-        "MODEKEEPER_KILL_SWITCH": "1",
-        "MODEKEEPER_PAID": "1",
-        "MODEKEEPER_INTERNAL_OVERRIDE": "1",
-    }
-    cp = _run(
-        mk_path,
+    env = base_env | _KILL_SWITCH_WITH_OVERRIDE
+    cp = mk_run(
         [
             "closed-loop",
             "watch",
@@ -117,7 +95,7 @@ def test_closed_loop_watch_apply_kill_switch_at_entrypoint(tmp_path: Path, mk_pa
             "--observe-source",
             "file",
             "--observe-path",
-            str(observe_path),
+            str(_STABLE_OBSERVE),
             "--out",
             str(out_dir),
             "--max-iterations",
@@ -125,10 +103,11 @@ def test_closed_loop_watch_apply_kill_switch_at_entrypoint(tmp_path: Path, mk_pa
             "--interval",
             "0s",
         ],
-        env,
+        env=env,
+        capture_stdout=False,
     )
     assert cp.returncode == 2
     assert cp.stderr.strip() == "ERROR: MODEKEEPER_KILL_SWITCH=1 blocks apply/mutate operations"
     assert not (out_dir / "iter_0001").exists()
-    latest = json.loads((out_dir / "watch_latest.json").read_text(encoding="utf-8"))
+    latest = loads((out_dir / "watch_latest.json").read_bytes())
     assert latest.get("apply_blocked_reason") == "kill_switch_active"
@@ -1,25 +1,22 @@
 import base64
-import json
 from pathlib import Path
 
+from _jsonl import dumps
 from cryptography.hazmat.primitives.asymmetric.ed25519 import Ed25519PrivateKey
 
 from modekeeper.license.canonical import canonical_json_bytes
 from modekeeper.license.verify import verify_license
 
+_SEED_A = bytes(range(32))
+_SEED_B = bytes(range(32, 64))
+_KEY_A = Ed25519PrivateKey.from_private_bytes(_SEED_A)
+_KEY_B = Ed25519PrivateKey.from_private_bytes(_SEED_B)
 
-def _sign(payload: dict, seed: bytes) -> str:
-    private_key = Ed25519PrivateKey.from_private_bytes(seed)
-    signature = private_key.sign(canonical_json_bytes(payload))
-    return base64.b64encode(signature).decode("ascii")
 
-
-def _write_license(path: Path, payload: dict, seed: bytes) -> None:
-    license_data = {**payload, "signature": _sign(payload, seed)}
-    path.write_text(
-        json.dumps(license_data, indent=2, sort_keys=True, ensure_ascii=False) + "\n",
-        encoding="utf-8",
-    )
+def _write_license(path: Path, payload: dict, private_key: Ed25519PrivateKey) -> None:
+    signature = base64.b64encode(private_key.sign(canonical_json_bytes(payload))).decode("ascii")
+    license_data = {**payload, "signature": signature}
+    path.write_bytes(dumps(license_data, indent=True, sort_keys=True) + b"\n")
 
 
 def test_license_verify_ok_with_known_kid(tmp_path: Path, monkeypatch) -> None:
@@ -38,7 +35,7 @@ def test_license_verify_ok_with_known_kid(tmp_path: Path, monkeypatch) -> None:
         "kid": "mk-dev-2026-01",
     }
     license_path = tmp_path / "license_known_kid.json"
-    _write_license(license_path, payload, bytes(range(32)))
+    _write_license(license_path, payload, _KEY_A)
 
     report = verify_license(license_path, now_ts=1700000100)
     assert report["license_ok"] is True
@@ -62,7 +59,7 @@ def test_license_verify_blocked_with_unknown_kid(tmp_path: Path, monkeypatch) ->
         "kid": "mk-dev-unknown",
     }
     license_path = tmp_path / "license_unknown_kid.json"
-    _write_license(license_path, payload, bytes(range(32)))
+    _write_license(license_path, payload, _KEY_A)
 
     report = verify_license(license_path, now_ts=1700000100)
     assert report["license_ok"] is False
@@ -87,7 +84,7 @@ def test_license_verify_rotation_uses_kid_selected_key(tmp_path: Path, monkeypat
         "kid": "mk-dev-2026-02",
     }
     license_path = tmp_path / "license_rotated_kid.json"
-    _write_license(license_path, payload, bytes(range(32, 64)))
+    _write_license(license_path, payload, _KEY_B)
 
     report = verify_license(license_path, now_ts=1700000100)
     assert report["license_ok"] is True
@@ -111,7 +108,7 @@ def test_license_verify_rotation_without_kid_falls_back_to_allowlist(tmp_path: P
         "entitlements": ["apply", "observe"],
     }
     license_path = tmp_path / "license_rotated_no_kid.json"
-    _write_license(license_path, payload, bytes(range(32, 64)))
+    _write_license(license_path, payload, _KEY_B)
 
     report = verify_license(license_path, now_ts=1700000100)
     assert report["license_ok"] is True
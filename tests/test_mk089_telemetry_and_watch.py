@@ -1,31 +1,15 @@
-import json
+import selectors
 import subprocess
 import time
+from collections.abc import Mapping
 from pathlib import Path
 
+from _jsonl import loads
 
-def _write_gpu_observe_jsonl(path: Path) -> None:
-    rows = [
-        {
-            "ts": "2026-01-01T00:00:00Z",
-            "step_time_ms": 120,
-            "loss": 1.2,
-            "gpu_util_pct": 88,
-        },
-        {
-            "ts": "2026-01-01T00:00:01Z",
-            "step_time_ms": 125,
-            "loss": 1.1,
-            "gpu_mem_used_mb": 9000,
-            "gpu_mem_total_mb": 10000,
-        },
-        {
-            "ts": "2026-01-01T00:00:02Z",
-            "step_time_ms": 130,
-            "loss": 1.0,
-        },
-    ]
-    path.write_text("\n".join(json.dumps(row) for row in rows) + "\n", encoding="utf-8")
+_OBSERVE_DATA = Path(__file__).resolve().parent / "data" / "observe"
+_GPU_OBSERVE = _OBSERVE_DATA / "gpu_telemetry.jsonl"
+# One row is enough where only iterations_done is checked.
+_GPU_SINGLE_OBSERVE = _OBSERVE_DATA / "gpu_single.jsonl"
 
 
 def _assert_telemetry_points(payload: dict) -> None:
@@ -39,30 +23,26 @@ def _assert_telemetry_points(payload: dict) -> None:
         assert isinstance(point.get("ts_ms"), int)
 
 
-def test_mk089_observe_file_writes_telemetry_with_gpu_fields(tmp_path: Path, mk_path: Path) -> None:
-    observe_path = tmp_path / "observe_gpu.jsonl"
+def test_mk089_observe_file_writes_telemetry_with_gpu_fields(tmp_path: Path, mk_invoke) -> None:
     out_dir = tmp_path / "observe_out"
-    _write_gpu_observe_jsonl(observe_path)
 
-    cp = subprocess.run(
+    cp = mk_invoke(
         [
-            str(mk_path),
             "observe",
             "--duration",
             "1s",
             "--source",
             "file",
             "--path",
-            str(observe_path),
+            str(_GPU_OBSERVE),
             "--out",
             str(out_dir),
         ],
-        text=True,
-        capture_output=True,
+        capture_stdout=False,
     )
     assert cp.returncode == 0, cp.stderr
 
-    report = json.loads((out_dir / "observe_latest.json").read_text(encoding="utf-8"))
+    report = loads((out_dir / "observe_latest.json").read_bytes())
     _assert_telemetry_points(report)
     telemetry = report.get("telemetry") or {}
     assert telemetry.get("sample_count") == 3
@@ -72,14 +52,11 @@ def test_mk089_observe_file_writes_telemetry_with_gpu_fields(tmp_path: Path, mk_
     )
 
 
-def test_mk089_closed_loop_file_writes_telemetry_with_timestamps(tmp_path: Path, mk_path: Path) -> None:
-    observe_path = tmp_path / "observe_gpu.jsonl"
+def test_mk089_closed_loop_file_writes_telemetry_with_timestamps(tmp_path: Path, mk_invoke) -> None:
     out_dir = tmp_path / "closed_loop_out"
-    _write_gpu_observe_jsonl(observe_path)
 
-    cp = subprocess.run(
+    cp = mk_invoke(
         [
-            str(mk_path),
             "closed-loop",
             "run",
             "--scenario",
@@ -88,63 +65,72 @@ def test_mk089_closed_loop_file_writes_telemetry_with_timestamps(tmp_path: Path,
             "--observe-source",
             "file",
             "--observe-path",
-            str(observe_path),
+            str(_GPU_OBSERVE),
             "--out",
             str(out_dir),
         ],
-        text=True,
-        capture_output=True,
+        capture_stdout=False,
     )
     assert cp.returncode == 0, cp.stderr
 
-    report = json.loads((out_dir / "closed_loop_latest.json").read_text(encoding="utf-8"))
+    report = loads((out_dir / "closed_loop_latest.json").read_bytes())
     _assert_telemetry_points(report)
     telemetry = report.get("telemetry") or {}
     assert telemetry.get("sample_count") == 3
 
 
-def test_mk089_closed_loop_watch_sigterm_writes_final_artifacts(tmp_path: Path, mk_path: Path) -> None:
-    observe_path = tmp_path / "observe_gpu.jsonl"
+def test_mk089_closed_loop_watch_sigterm_writes_final_artifacts(
+    tmp_path: Path, mk: str, base_env: Mapping[str, str]
+) -> None:
     out_dir = tmp_path / "watch_out"
-    _write_gpu_observe_jsonl(observe_path)
-
-    proc = subprocess.Popen(
-        [
-            str(mk_path),
-            "closed-loop",
-            "watch",
-            "--scenario",
-            "drift",
-            "--dry-run",
-            "--observe-source",
-            "file",
-            "--observe-path",
-            str(observe_path),
-            "--out",
-            str(out_dir),
-            "--interval",
-            "2s",
-        ],
-        text=True,
-        stdout=subprocess.PIPE,
-        stderr=subprocess.PIPE,
-    )
+    stderr_path = tmp_path / "watch_stderr.log"
+
+    with stderr_path.open("wb") as stderr_file:
+        proc = subprocess.Popen(
+            [
+                mk,
+                "closed-loop",
+                "watch",
+                "--scenario",
+                "drift",
+                "--dry-run",
+                "--observe-source",
+                "file",
+                "--observe-path",
+                str(_GPU_SINGLE_OBSERVE),
+                "--out",
+                str(out_dir),
+                "--interval",
+                "2s",
+            ],
+            stdout=subprocess.PIPE,
+            stderr=stderr_file,
+            bufsize=0,
+            env=base_env | {"PYTHONUNBUFFERED": "1"},
+        )
     try:
-        watch_latest = out_dir / "watch_latest.json"
-        deadline = time.time() + 20.0
+        # Each iteration prints an "iter=N ..." line after writing watch_latest.json. Wait
+        # for the first one under a hard deadline; reads only happen once select reports
+        # data, so a partial line can never block past it.
+        deadline = time.monotonic() + 20.0
+        output = b""
         saw_first_iteration = False
-        while time.time() < deadline:
-            if watch_latest.exists():
-                try:
-                    watch = json.loads(watch_latest.read_text(encoding="utf-8"))
-                except json.JSONDecodeError:
-                    time.sleep(0.1)
-                    continue
-                if isinstance(watch.get("iterations_done"), int) and watch["iterations_done"] >= 1:
-                    saw_first_iteration = True
+        with selectors.DefaultSelector() as selector:
+            selector.register(proc.stdout, selectors.EVENT_READ)
+            while not saw_first_iteration:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0 or not selector.select(timeout=remaining):
+                    break
+                chunk = proc.stdout.read(4096)
+                if not chunk:
                     break
-            time.sleep(0.1)
-        assert saw_first_iteration, "watch_latest.json with iterations_done>=1 not observed in time"
+                output += chunk
+                complete_lines = output.split(b"\n")[:-1]
+                saw_first_iteration = any(line.startswith(b"iter=1 ") for line in complete_lines)
+        assert saw_first_iteration, (
+            "first watch iteration not reported in time; stderr:\n"
+            + stderr_path.read_text(encoding="utf-8", errors="replace")
+        )
 
         proc.terminate()
         proc.wait(timeout=20)
@@ -153,11 +139,12 @@ def test_mk089_closed_loop_watch_sigterm_writes_final_artifacts(tmp_path: Path,
         if proc.poll() is None:
             proc.kill()
             proc.wait(timeout=10)
+        proc.stdout.close()
 
     watch_latest = out_dir / "watch_latest.json"
     watch_summary = out_dir / "watch_summary.md"
     assert watch_latest.exists()
     assert watch_summary.exists()
-    watch = json.loads(watch_latest.read_text(encoding="utf-8"))
+    watch = loads(watch_latest.read_bytes())
     assert isinstance(watch.get("iterations_done"), int)
     assert watch["iterations_done"] >= 1
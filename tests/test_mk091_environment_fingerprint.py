@@ -1,38 +1,8 @@
-import json
-import subprocess
 from pathlib import Path
 
+from _jsonl import loads
 
-def _write_mixed_environment_jsonl(path: Path) -> None:
-    rows = [
-        {
-            "ts": "2026-02-13T00:00:00Z",
-            "step_time_ms": 120,
-            "loss": 1.0,
-            "node": "node-a",
-            "gpu_model": "T4",
-        },
-        {
-            "ts": "2026-02-13T00:00:01Z",
-            "step_time_ms": 121,
-            "loss": 0.99,
-            "node_name": "node-b",
-            "gpu_name": "T4",
-        },
-        {
-            "ts": "2026-02-13T00:00:02Z",
-            "step_time_ms": 122,
-            "loss": 0.98,
-            "node": "node-b",
-            "gpu_model": "A100",
-        },
-        {
-            "ts": "2026-02-13T00:00:03Z",
-            "step_time_ms": 123,
-            "loss": 0.97,
-        },
-    ]
-    path.write_text("\n".join(json.dumps(row) for row in rows) + "\n", encoding="utf-8")
+_MIXED_OBSERVE = Path(__file__).resolve().parent / "data" / "observe" / "mixed_environment.jsonl"
 
 
 def _assert_environment_and_points(report: dict) -> None:
@@ -71,41 +41,34 @@ def _assert_environment_and_points(report: dict) -> None:
     assert saw_missing_optional
 
 
-def test_mk091_observe_file_environment_fingerprint_unstable(tmp_path: Path, mk_path: Path) -> None:
-    observe_path = tmp_path / "mixed_env.jsonl"
-    _write_mixed_environment_jsonl(observe_path)
+def test_mk091_observe_file_environment_fingerprint_unstable(tmp_path: Path, mk_run) -> None:
     out_dir = tmp_path / "observe_out"
 
-    cp = subprocess.run(
+    cp = mk_run(
         [
-            str(mk_path),
             "observe",
             "--duration",
             "1s",
             "--source",
             "file",
             "--path",
-            str(observe_path),
+            str(_MIXED_OBSERVE),
             "--out",
             str(out_dir),
         ],
-        text=True,
-        capture_output=True,
+        capture_stdout=False,
     )
     assert cp.returncode == 0, cp.stderr
 
-    report = json.loads((out_dir / "observe_latest.json").read_text(encoding="utf-8"))
+    report = loads((out_dir / "observe_latest.json").read_bytes())
     _assert_environment_and_points(report)
 
 
-def test_mk091_closed_loop_file_environment_fingerprint_unstable(tmp_path: Path, mk_path: Path) -> None:
-    observe_path = tmp_path / "mixed_env.jsonl"
-    _write_mixed_environment_jsonl(observe_path)
+def test_mk091_closed_loop_file_environment_fingerprint_unstable(tmp_path: Path, mk_run) -> None:
     out_dir = tmp_path / "closed_loop_out"
 
-    cp = subprocess.run(
+    cp = mk_run(
         [
-            str(mk_path),
             "closed-loop",
             "run",
             "--scenario",
@@ -114,14 +77,13 @@ def test_mk091_closed_loop_file_environment_fingerprint_unstable(tmp_path: Path,
             "--observe-source",
             "file",
             "--observe-path",
-            str(observe_path),
+            str(_MIXED_OBSERVE),
             "--out",
             str(out_dir),
         ],
-        text=True,
-        capture_output=True,
+        capture_stdout=False,
     )
     assert cp.returncode == 0, cp.stderr
 
-    report = json.loads((out_dir / "closed_loop_latest.json").read_text(encoding="utf-8"))
+    report = loads((out_dir / "closed_loop_latest.json").read_bytes())
     _assert_environment_and_points(report)
@@ -1,24 +1,22 @@
-import json
-import subprocess
 from pathlib import Path
 
+from _jsonl import loads
 
-def test_mk093_eval_file_outputs_expected_fields(tmp_path: Path, mk_path: Path) -> None:
+
+def test_mk093_eval_file_outputs_expected_fields(
+    tmp_path: Path, mk_run, quickstart_observe: Path
+) -> None:
     out_dir = tmp_path / "eval_out"
-    observe_path = Path("docs/evidence/mk092_quickstart/observe_mixed_env.jsonl")
 
-    cp = subprocess.run(
+    cp = mk_run(
         [
-            str(mk_path),
             "eval",
             "file",
             "--path",
-            str(observe_path),
+            str(quickstart_observe),
             "--out",
             str(out_dir),
         ],
-        text=True,
-        capture_output=True,
     )
     assert cp.returncode == 0, cp.stderr
 
@@ -27,7 +25,7 @@ def test_mk093_eval_file_outputs_expected_fields(tmp_path: Path, mk_path: Path)
     assert latest_path.exists()
     assert summary_path.exists()
 
-    latest = json.loads(latest_path.read_text(encoding="utf-8"))
+    latest = loads(latest_path.read_bytes())
     assert latest.get("schema_version") == "eval.v0"
     assert latest.get("source") == "file"
     assert latest.get("read_only") is True
@@ -51,15 +49,15 @@ def test_mk093_eval_file_outputs_expected_fields(tmp_path: Path, mk_path: Path)
     assert isinstance(artifacts, dict)
     assert artifacts.get("eval_latest_path") == str(out_dir / "eval_latest.json")
     assert artifacts.get("eval_summary_path") == str(out_dir / "eval_summary.md")
-    assert artifacts.get("observe_input_path") == str(observe_path)
+    assert artifacts.get("observe_input_path") == str(quickstart_observe)
 
-    summary_text = summary_path.read_text(encoding="utf-8")
-    assert "verify_ok: n/a" in summary_text
-    assert "top_blocker: n/a" in summary_text
-    assert "environment.unstable: True" in summary_text
-    assert f"sample_count: {sample_count}" in summary_text
-    assert "proposed_actions_count: 1" in summary_text
-    assert f"artifact.eval_latest_path: {out_dir / 'eval_latest.json'}" in summary_text
+    summary_bytes = summary_path.read_bytes()
+    assert b"verify_ok: n/a" in summary_bytes
+    assert b"top_blocker: n/a" in summary_bytes
+    assert b"environment.unstable: True" in summary_bytes
+    assert f"sample_count: {sample_count}".encode() in summary_bytes
+    assert b"proposed_actions_count: 1" in summary_bytes
+    assert f"artifact.eval_latest_path: {out_dir / 'eval_latest.json'}".encode() in summary_bytes
 
     stdout = cp.stdout.strip()
     assert "verify_ok=n/a" in stdout
@@ -1,9 +1,9 @@
-import json
-import subprocess
 from pathlib import Path
 
+from _jsonl import dumps, loads
 
-def test_mk096_roi_report_builds_artifacts_and_summary(tmp_path: Path, mk_path: Path) -> None:
+
+def test_mk096_roi_report_builds_artifacts_and_summary(tmp_path: Path, mk_run) -> None:
     inputs_dir = tmp_path / "inputs"
     out_dir = tmp_path / "roi_out"
     inputs_dir.mkdir(parents=True, exist_ok=True)
@@ -13,8 +13,8 @@ def test_mk096_roi_report_builds_artifacts_and_summary(tmp_path: Path, mk_path:
     watch_path = inputs_dir / "watch_latest.json"
     last_iter_report_path = inputs_dir / "closed_loop_latest.json"
 
-    preflight_path.write_text(
-        json.dumps(
+    preflight_path.write_bytes(
+        dumps(
             {
                 "schema_version": "preflight.v0",
                 "ok": True,
@@ -24,15 +24,13 @@ def test_mk096_roi_report_builds_artifacts_and_summary(tmp_path: Path, mk_path:
                 "deploy_gpu_request": 0,
                 "notes": ["gpu_not_in_cluster", "device_plugin_missing", "deploy_not_requesting_gpu"],
             },
-            ensure_ascii=False,
+            indent=True,
             sort_keys=True,
-            indent=2,
         )
-        + "\n",
-        encoding="utf-8",
+        + b"\n"
     )
-    eval_path.write_text(
-        json.dumps(
+    eval_path.write_bytes(
+        dumps(
             {
                 "schema_version": "eval.v0",
                 "top_blocker": None,
@@ -44,15 +42,13 @@ def test_mk096_roi_report_builds_artifacts_and_summary(tmp_path: Path, mk_path:
                 },
                 "signals": {"notes": ["loss_missing"]},
             },
-            ensure_ascii=False,
+            indent=True,
             sort_keys=True,
-            indent=2,
         )
-        + "\n",
-        encoding="utf-8",
+        + b"\n"
     )
-    watch_path.write_text(
-        json.dumps(
+    watch_path.write_bytes(
+        dumps(
             {
                 "schema_version": "v0",
                 "duration_s": 120,
@@ -66,32 +62,27 @@ def test_mk096_roi_report_builds_artifacts_and_summary(tmp_path: Path, mk_path:
                     "last_iteration_report_path": str(last_iter_report_path),
                 },
             },
-            ensure_ascii=False,
+            indent=True,
             sort_keys=True,
-            indent=2,
         )
-        + "\n",
-        encoding="utf-8",
+        + b"\n"
     )
-    last_iter_report_path.write_text(
-        json.dumps(
+    last_iter_report_path.write_bytes(
+        dumps(
             {
                 "schema_version": "v0",
                 "opportunity_hours_est": 12.5,
                 "proposed_actions_count": 2,
                 "signals": {"notes": ["loss_missing"]},
             },
-            ensure_ascii=False,
+            indent=True,
             sort_keys=True,
-            indent=2,
         )
-        + "\n",
-        encoding="utf-8",
+        + b"\n"
     )
 
-    cp = subprocess.run(
+    cp = mk_run(
         [
-            str(mk_path),
             "roi",
             "report",
             "--preflight",
@@ -103,8 +94,6 @@ def test_mk096_roi_report_builds_artifacts_and_summary(tmp_path: Path, mk_path:
             "--out",
             str(out_dir),
         ],
-        text=True,
-        capture_output=True,
     )
     assert cp.returncode == 0, cp.stderr
 
@@ -115,7 +104,7 @@ def test_mk096_roi_report_builds_artifacts_and_summary(tmp_path: Path, mk_path:
     assert roi_summary.exists()
     assert explain.exists()
 
-    latest = json.loads(roi_latest.read_text(encoding="utf-8"))
+    latest = loads(roi_latest.read_bytes())
     assert latest.get("schema_version") == "roi.v0"
     assert latest.get("ok") is False
     assert latest.get("top_blocker") == "loss_missing"
@@ -127,14 +116,14 @@ def test_mk096_roi_report_builds_artifacts_and_summary(tmp_path: Path, mk_path:
     assert str(roi_summary) in key_artifacts
     assert str(explain) in key_artifacts
 
-    summary_text = roi_summary.read_text(encoding="utf-8")
-    assert "ok: false" in summary_text
-    assert "top_blocker: loss_missing" in summary_text
-    assert "opportunity_hours_est: 12.5" in summary_text
-    assert "watch.iterations_done: 4" in summary_text
-    assert "watch.proposed_total: 0" in summary_text
-    assert "watch.applied_total: 0" in summary_text
-    assert "watch.blocked_total: 0" in summary_text
+    summary_bytes = roi_summary.read_bytes()
+    assert b"ok: false" in summary_bytes
+    assert b"top_blocker: loss_missing" in summary_bytes
+    assert b"opportunity_hours_est: 12.5" in summary_bytes
+    assert b"watch.iterations_done: 4" in summary_bytes
+    assert b"watch.proposed_total: 0" in summary_bytes
+    assert b"watch.applied_total: 0" in summary_bytes
+    assert b"watch.blocked_total: 0" in summary_bytes
 
     stdout = cp.stdout.strip()
     assert "roi_ok=false" in stdout
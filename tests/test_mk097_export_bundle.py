@@ -11,7 +11,7 @@ def _write_json(path: Path, payload: dict) -> None:
     )
 
 
-def test_mk097_export_bundle_builds_manifest_tar_and_summary(tmp_path: Path, mk_path: Path) -> None:
+def test_mk097_export_bundle_builds_manifest_tar_and_summary(tmp_path: Path, mk: str) -> None:
     report_dir = tmp_path / "report"
     out_dir = report_dir / "bundle"
     report_dir.mkdir(parents=True, exist_ok=True)
@@ -61,7 +61,7 @@ def test_mk097_export_bundle_builds_manifest_tar_and_summary(tmp_path: Path, mk_
 
     cp = subprocess.run(
         [
-            str(mk_path),
+            mk,
             "export",
             "bundle",
             "--in",
@@ -114,7 +114,7 @@ def test_mk097_export_bundle_builds_manifest_tar_and_summary(tmp_path: Path, mk_
     assert f"summary={summary_path}" in stdout
 
 
-def test_export_bundle_prefers_latest_iteration_artifacts(tmp_path: Path, mk_path: Path) -> None:
+def test_export_bundle_prefers_latest_iteration_artifacts(tmp_path: Path, mk: str) -> None:
     report_dir = tmp_path / "report"
     out_dir = report_dir / "bundle"
     iter_1 = report_dir / "iter_0001"
@@ -145,7 +145,7 @@ def test_export_bundle_prefers_latest_iteration_artifacts(tmp_path: Path, mk_pat
     )
 
     cp = subprocess.run(
-        [str(mk_path), "export", "bundle", "--in", str(report_dir), "--out", str(out_dir)],
+        [mk, "export", "bundle", "--in", str(report_dir), "--out", str(out_dir)],
         text=True,
         capture_output=True,
         check=False,
@@ -3,7 +3,7 @@ from types import SimpleNamespace
 
 from modekeeper.cli import _build_telemetry_payload
 from modekeeper.core.analysis import analyze_signals
-from modekeeper.telemetry.k8s_log_source import K8sLogSource
+from modekeeper.telemetry.k8s_log_source import K8sLogSource, parse_k8s_stdout_jsonl
 
 
 def test_mk098_k8s_stdout_jsonl_ingests_loss_and_throughput(monkeypatch) -> None:
@@ -24,20 +24,23 @@ def test_mk098_k8s_stdout_jsonl_ingests_loss_and_throughput(monkeypatch) -> None
         {"ts": "2026-02-14T12:00:02Z", "step": 2, "loss": 1.08, "throughput": 123.0},
     ]
 
-    def fake_run(argv, capture_output, text, timeout):
+    def fake_run(argv, capture_output, timeout):
         if argv[1:3] == ["get", "pods"]:
             return SimpleNamespace(
                 returncode=0,
-                stdout=json.dumps(pod_payload),
-                stderr="",
+                stdout=json.dumps(pod_payload).encode("utf-8"),
+                stderr=b"",
             )
         if argv[1] == "logs":
             return SimpleNamespace(
                 returncode=0,
-                stdout="\n".join(json.dumps(row, separators=(",", ":")) for row in log_rows) + "\n",
-                stderr="",
+                stdout=b"".join(
+                    json.dumps(row, separators=(",", ":")).encode("utf-8") + b"\n"
+                    for row in log_rows
+                ),
+                stderr=b"",
             )
-        return SimpleNamespace(returncode=1, stdout="", stderr="unexpected args")
+        return SimpleNamespace(returncode=1, stdout=b"", stderr=b"unexpected args")
 
     import modekeeper.telemetry.k8s_log_source as k8s_mod
 
@@ -59,3 +62,20 @@ def test_mk098_k8s_stdout_jsonl_ingests_loss_and_throughput(monkeypatch) -> None
 
     signals = analyze_signals(samples)
     assert "loss_missing" not in signals.get("notes", [])
+
+
+def test_mk098_stdout_jsonl_parses_bytes_lines_and_aliases() -> None:
+    lines = [
+        b'{"t": 1700000000000, "step": 3, "samples_per_sec": 50.0, "step_time": "25ms"}',
+        b"",
+        b"not json",
+        b'{"timestamp": 1700000001000, "step": "4", "samples_sec": 40.0, "loss": ""}',
+    ]
+
+    samples = parse_k8s_stdout_jsonl(lines)
+
+    assert [s.step for s in samples] == [3, 4]
+    assert [s.throughput for s in samples] == [50.0, 40.0]
+    assert samples[0].latency_ms == 25.0
+    assert samples[1].latency_ms == 25.0
+    assert samples[1].loss is None
@@ -10,14 +10,14 @@ from cryptography.hazmat.primitives.asymmetric.ed25519 import Ed25519PrivateKey
 from modekeeper.license.canonical import canonical_json_bytes
 
 
-def _run(mk: Path, args: list[str], env: dict | None = None) -> subprocess.CompletedProcess[str]:
+def _run(mk: str, args: list[str], env: dict | None = None) -> subprocess.CompletedProcess[str]:
     merged_env = None
     if env is not None:
         import os
 
         merged_env = os.environ.copy()
         merged_env.update(env)
-    return subprocess.run([str(mk), *args], text=True, capture_output=True, env=merged_env)
+    return subprocess.run([mk, *args], text=True, capture_output=True, env=merged_env)
 
 
 def _private_key(fill: int) -> Ed25519PrivateKey:
@@ -66,14 +66,14 @@ def _write_issuer_keyset(
 
 def _verify_with_trust_chain(
     *,
-    mk_path: Path,
+    mk: str,
     out_dir: Path,
     license_path: Path,
     issuer_keyset_path: Path,
     root_keys_path: Path,
 ) -> dict:
     cp = _run(
-        mk_path,
+        mk,
         [
             "license",
             "verify",
@@ -93,7 +93,7 @@ def _verify_with_trust_chain(
     return report
 
 
-def test_mk110_trust_chain_happy_path(tmp_path: Path, mk_path: Path) -> None:
+def test_mk110_trust_chain_happy_path(tmp_path: Path, mk: str) -> None:
     root_private_key = _private_key(11)
     issuer_private_key = _private_key(22)
     issuer_kid = "issuer-2026-02"
@@ -124,7 +124,7 @@ def test_mk110_trust_chain_happy_path(tmp_path: Path, mk_path: Path) -> None:
 
     out_dir = tmp_path / "out_ok"
     report = _verify_with_trust_chain(
-        mk_path=mk_path,
+        mk=mk,
         out_dir=out_dir,
         license_path=license_path,
         issuer_keyset_path=issuer_keyset_path,
@@ -153,7 +153,7 @@ def test_mk110_trust_chain_happy_path(tmp_path: Path, mk_path: Path) -> None:
 )
 def test_mk110_trust_chain_blocks_on_unknown_root_or_bad_signature(
     tmp_path: Path,
-    mk_path: Path,
+    mk: str,
     case_name: str,
     mutate_keyset,
     expected_failure: str,
@@ -194,7 +194,7 @@ def test_mk110_trust_chain_blocks_on_unknown_root_or_bad_signature(
 
     out_dir = tmp_path / f"{case_name}_out"
     report = _verify_with_trust_chain(
-        mk_path=mk_path,
+        mk=mk,
         out_dir=out_dir,
         license_path=license_path,
         issuer_keyset_path=issuer_keyset_path,
@@ -206,7 +206,7 @@ def test_mk110_trust_chain_blocks_on_unknown_root_or_bad_signature(
     assert report["failure_code"] == expected_failure
 
 
-def test_mk110_trust_chain_blocks_when_issuer_kid_missing(tmp_path: Path, mk_path: Path) -> None:
+def test_mk110_trust_chain_blocks_when_issuer_kid_missing(tmp_path: Path, mk: str) -> None:
     root_private_key = _private_key(55)
     issuer_private_key = _private_key(66)
 
@@ -236,7 +236,7 @@ def test_mk110_trust_chain_blocks_when_issuer_kid_missing(tmp_path: Path, mk_pat
 
     out_dir = tmp_path / "out_missing_kid"
     report = _verify_with_trust_chain(
-        mk_path=mk_path,
+        mk=mk,
         out_dir=out_dir,
         license_path=license_path,
         issuer_keyset_path=issuer_keyset_path,
@@ -5,7 +5,7 @@ import subprocess
 from pathlib import Path
 
 
-def test_internal_license_issue_and_verify(tmp_path: Path, mk_path: Path) -> None:
+def test_internal_license_issue_and_verify(tmp_path: Path, mk: str) -> None:
     repo_root = Path(__file__).resolve().parents[1]
     keygen = repo_root / "bin" / "mk-license-keygen"
     issue = repo_root / "bin" / "mk-license-issue"
@@ -55,7 +55,7 @@ def test_internal_license_issue_and_verify(tmp_path: Path, mk_path: Path) -> Non
     verify_env = os.environ.copy()
     verify_env["MODEKEEPER_LICENSE_PUBLIC_KEYS_PATH"] = str(keyring_path)
     cp_verify = subprocess.run(
-        [str(mk_path), "license", "verify", "--license", str(license_path), "--out", str(verify_out)],
+        [mk, "license", "verify", "--license", str(license_path), "--out", str(verify_out)],
         text=True,
         capture_output=True,
         env=verify_env,
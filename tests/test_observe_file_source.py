@@ -4,7 +4,7 @@ from datetime import datetime, timezone
 from pathlib import Path
 
 
-def test_observe_file_source_epoch_jsonl(tmp_path: Path, mk_path: Path) -> None:
+def test_observe_file_source_epoch_jsonl(tmp_path: Path, mk: str) -> None:
     metrics_path = tmp_path / "metrics_epoch.jsonl"
     ts_epoch_s = int(datetime.now(timezone.utc).timestamp())
     ts_epoch_ms = ts_epoch_s * 1000 + 123
@@ -17,9 +17,8 @@ def test_observe_file_source_epoch_jsonl(tmp_path: Path, mk_path: Path) -> None:
     metrics_path.write_text("\n".join(json.dumps(r) for r in rows) + "\n", encoding="utf-8")
 
     out_dir = tmp_path / "epoch_jsonl_out"
-    mk = mk_path
     subprocess.run(
-        [str(mk), "observe", "--duration", "1s", "--source", "file", "--path", str(metrics_path), "--out", str(out_dir)],
+        [mk, "observe", "--duration", "1s", "--source", "file", "--path", str(metrics_path), "--out", str(out_dir)],
         check=True,
         capture_output=True,
         text=True,
@@ -32,7 +31,7 @@ def test_observe_file_source_epoch_jsonl(tmp_path: Path, mk_path: Path) -> None:
     assert latest.get("sample_count") == 3
 
 
-def test_observe_file_source_epoch_csv(tmp_path: Path, mk_path: Path) -> None:
+def test_observe_file_source_epoch_csv(tmp_path: Path, mk: str) -> None:
     metrics_path = tmp_path / "metrics_epoch.csv"
     ts_epoch_s = int(datetime.now(timezone.utc).timestamp())
     ts_epoch_ms = ts_epoch_s * 1000 + 456
@@ -46,9 +45,8 @@ def test_observe_file_source_epoch_csv(tmp_path: Path, mk_path: Path) -> None:
     )
 
     out_dir = tmp_path / "epoch_csv_out"
-    mk = mk_path
     subprocess.run(
-        [str(mk), "observe", "--duration", "1s", "--source", "file", "--path", str(metrics_path), "--out", str(out_dir)],
+        [mk, "observe", "--duration", "1s", "--source", "file", "--path", str(metrics_path), "--out", str(out_dir)],
         check=True,
         capture_output=True,
         text=True,
@@ -22,7 +22,7 @@ exit 1
     path.chmod(0o755)
 
 
-def test_observe_k8s_logs_source(tmp_path: Path, mk_path: Path) -> None:
+def test_observe_k8s_logs_source(tmp_path: Path, mk: str) -> None:
     kubectl = tmp_path / "kubectl"
     log_output = "\n".join(
         [
@@ -36,7 +36,7 @@ def test_observe_k8s_logs_source(tmp_path: Path, mk_path: Path) -> None:
     env = {**os.environ, "KUBECTL": str(kubectl)}
     subprocess.run(
         [
-            str(mk_path),
+            mk,
             "observe",
             "--duration",
             "10s",
@@ -5,13 +5,13 @@ from pathlib import Path
 from modekeeper.passports.v0 import load_passport
 
 
-def test_passport_observe_max_cli_file_source(tmp_path: Path, mk_path: Path) -> None:
+def test_passport_observe_max_cli_file_source(tmp_path: Path, mk: str) -> None:
     out_dir = tmp_path / "out"
     observe_path = Path("tests/data/observe/bursty.jsonl")
 
     cp = subprocess.run(
         [
-            str(mk_path),
+            mk,
             "passport",
             "observe-max",
             "--observe-source",
@@ -52,7 +52,7 @@ def test_passport_observe_max_cli_file_source(tmp_path: Path, mk_path: Path) ->
     out_dir_2 = tmp_path / "out_2"
     cp2 = subprocess.run(
         [
-            str(mk_path),
+            mk,
             "passport",
             "observe-max",
             "--observe-source",
@@ -3,13 +3,13 @@ import subprocess
 from pathlib import Path
 
 
-def test_observe_max_latest_report_redacts_chord_details(tmp_path: Path, mk_path: Path) -> None:
+def test_observe_max_latest_report_redacts_chord_details(tmp_path: Path, mk: str) -> None:
     out_dir = tmp_path / "out"
     observe_path = Path("tests/data/observe/bursty.jsonl")
 
     cp = subprocess.run(
         [
-            str(mk_path),
+            mk,
             "passport",
             "observe-max",
             "--observe-source",
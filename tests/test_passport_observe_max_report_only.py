@@ -2,13 +2,13 @@ import subprocess
 from pathlib import Path
 
 
-def test_observe_max_report_only_cli_file_source(tmp_path: Path, mk_path: Path) -> None:
+def test_observe_max_report_only_cli_file_source(tmp_path: Path, mk: str) -> None:
     out_dir = tmp_path / "out"
     observe_path = Path("tests/data/observe/bursty.jsonl")
 
     cp = subprocess.run(
         [
-            str(mk_path),
+            mk,
             "passport",
             "observe-max-report",
             "--observe-source",
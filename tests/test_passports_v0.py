@@ -13,9 +13,9 @@ def test_all_templates_validate() -> None:
         assert passport.name == name
 
 
-def test_mk_passport_templates_cli(tmp_path: Path, mk_path: Path) -> None:
+def test_mk_passport_templates_cli(tmp_path: Path, mk: str) -> None:
     cp = subprocess.run(
-        [str(mk_path), "passport", "templates"],
+        [mk, "passport", "templates"],
         text=True,
         capture_output=True,
         cwd=tmp_path,
@@ -27,10 +27,10 @@ def test_mk_passport_templates_cli(tmp_path: Path, mk_path: Path) -> None:
     assert expected.issubset(output)
 
 
-def test_mk_passport_validate_valid_template_file(tmp_path: Path, mk_path: Path) -> None:
+def test_mk_passport_validate_valid_template_file(tmp_path: Path, mk: str) -> None:
     valid_file = Path(__file__).resolve().parents[1] / "src" / "modekeeper" / "passports" / "templates" / "safe.json"
     cp = subprocess.run(
-        [str(mk_path), "passport", "validate", "--file", str(valid_file)],
+        [mk, "passport", "validate", "--file", str(valid_file)],
         text=True,
         capture_output=True,
         cwd=tmp_path,
@@ -39,12 +39,12 @@ def test_mk_passport_validate_valid_template_file(tmp_path: Path, mk_path: Path)
     assert cp.stderr.strip() == ""
 
 
-def test_mk_passport_validate_invalid_json(tmp_path: Path, mk_path: Path) -> None:
+def test_mk_passport_validate_invalid_json(tmp_path: Path, mk: str) -> None:
     broken = tmp_path / "broken_passport.json"
     broken.write_text("{not-json", encoding="utf-8")
 
     cp = subprocess.run(
-        [str(mk_path), "passport", "validate", "--file", str(broken)],
+        [mk, "passport", "validate", "--file", str(broken)],
         text=True,
         capture_output=True,
     )
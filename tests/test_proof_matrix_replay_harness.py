@@ -4,7 +4,7 @@ from pathlib import Path
 
 
 def test_proof_matrix_replay_harness_runs_three_proof_scenarios(
-    tmp_path: Path, mk_path: Path
+    tmp_path: Path, mk: str
 ) -> None:
     out_dir = tmp_path / "proof_matrix"
     script_path = Path(__file__).resolve().parents[1] / "scripts" / "proof-matrix-replay.sh"
@@ -18,7 +18,7 @@ def test_proof_matrix_replay_harness_runs_three_proof_scenarios(
         ],
         text=True,
         capture_output=True,
-        env={"MK_BIN": str(mk_path)},
+        env={"MK_BIN": mk},
         check=False,
     )
     assert cp.returncode == 0, cp.stderr
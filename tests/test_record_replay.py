@@ -14,13 +14,13 @@ def _assert_report_basics(report: dict) -> None:
     assert duration >= 0
 
 
-def test_closed_loop_run_replay_stable_trace_noop_plan(tmp_path: Path, mk_path: Path) -> None:
+def test_closed_loop_run_replay_stable_trace_noop_plan(tmp_path: Path, mk: str) -> None:
     out_dir = tmp_path / "closed_loop_out"
     observe_path = _data_path("stable.jsonl")
 
     cp = subprocess.run(
         [
-            str(mk_path),
+            mk,
             "closed-loop",
             "run",
             "--scenario",
@@ -50,13 +50,13 @@ def test_closed_loop_run_replay_stable_trace_noop_plan(tmp_path: Path, mk_path:
     assert "kubectl" not in script_text
 
 
-def test_closed_loop_watch_replay_bursty_trace_rollups(tmp_path: Path, mk_path: Path) -> None:
+def test_closed_loop_watch_replay_bursty_trace_rollups(tmp_path: Path, mk: str) -> None:
     out_dir = tmp_path / "watch_out"
     observe_path = _data_path("bursty.jsonl")
 
     cp = subprocess.run(
         [
-            str(mk_path),
+            mk,
             "closed-loop",
             "watch",
             "--scenario",
@@ -100,13 +100,13 @@ def test_closed_loop_watch_replay_bursty_trace_rollups(tmp_path: Path, mk_path:
     assert watch.get("dry_run_total") == 2
 
 
-def test_closed_loop_run_replay_sparse_trace_reports(tmp_path: Path, mk_path: Path) -> None:
+def test_closed_loop_run_replay_sparse_trace_reports(tmp_path: Path, mk: str) -> None:
     out_dir = tmp_path / "sparse_out"
     observe_path = _data_path("sparse.jsonl")
 
     cp = subprocess.run(
         [
-            str(mk_path),
+            mk,
             "closed-loop",
             "run",
             "--scenario",
@@ -131,13 +131,13 @@ def test_closed_loop_run_replay_sparse_trace_reports(tmp_path: Path, mk_path: Pa
     assert isinstance(latest.get("proposed", []), list)
 
 
-def test_closed_loop_run_replay_out_of_order_trace_reports(tmp_path: Path, mk_path: Path) -> None:
+def test_closed_loop_run_replay_out_of_order_trace_reports(tmp_path: Path, mk: str) -> None:
     out_dir = tmp_path / "out_of_order_out"
     observe_path = _data_path("out_of_order.jsonl")
 
     cp = subprocess.run(
         [
-            str(mk_path),
+            mk,
             "closed-loop",
             "run",
             "--scenario",
@@ -162,13 +162,13 @@ def test_closed_loop_run_replay_out_of_order_trace_reports(tmp_path: Path, mk_pa
     assert isinstance(latest.get("proposed", []), list)
 
 
-def test_closed_loop_watch_replay_out_of_order_trace_reports(tmp_path: Path, mk_path: Path) -> None:
+def test_closed_loop_watch_replay_out_of_order_trace_reports(tmp_path: Path, mk: str) -> None:
     out_dir = tmp_path / "out_of_order_watch_out"
     observe_path = _data_path("out_of_order.jsonl")
 
     cp = subprocess.run(
         [
-            str(mk_path),
+            mk,
             "closed-loop",
             "watch",
             "--scenario",
@@ -197,7 +197,7 @@ def test_closed_loop_watch_replay_out_of_order_trace_reports(tmp_path: Path, mk_
     assert watch.get("iterations_done") == 2
 
 
-def test_closed_loop_run_replay_dirty_traces(tmp_path: Path, mk_path: Path) -> None:
+def test_closed_loop_run_replay_dirty_traces(tmp_path: Path, mk: str) -> None:
     traces = [
         "corrupted.jsonl",
         "duplicates.jsonl",
@@ -208,7 +208,7 @@ def test_closed_loop_run_replay_dirty_traces(tmp_path: Path, mk_path: Path) -> N
         observe_path = _data_path(name)
         cp = subprocess.run(
             [
-                str(mk_path),
+                mk,
                 "closed-loop",
                 "run",
                 "--scenario",
@@ -237,14 +237,14 @@ def test_closed_loop_run_replay_dirty_traces(tmp_path: Path, mk_path: Path) -> N
 
 
 def test_closed_loop_watch_replay_corrupted_trace_observe_ingest_rollup(
-    tmp_path: Path, mk_path: Path
+    tmp_path: Path, mk: str
 ) -> None:
     out_dir = tmp_path / "corrupted_watch_out"
     observe_path = _data_path("corrupted.jsonl")
 
     cp = subprocess.run(
         [
-            str(mk_path),
+            mk,
             "closed-loop",
             "watch",
             "--scenario",
@@ -355,13 +355,13 @@ def test_watch_summary_null_last_iteration_paths(tmp_path: Path) -> None:
     assert f"watch_summary_path: {out_dir / 'watch_summary.md'}" in summary
     assert "last_iteration_report_path: null" in summary
     assert "last_iteration_explain_path: null" in summary
-def test_closed_loop_watch_replay_realistic_dirty_trace_reports(tmp_path: Path, mk_path: Path) -> None:
+def test_closed_loop_watch_replay_realistic_dirty_trace_reports(tmp_path: Path, mk: str) -> None:
     out_dir = tmp_path / "realistic_dirty_watch_out"
     observe_path = _data_path("realistic_dirty.jsonl")
 
     cp = subprocess.run(
         [
-            str(mk_path),
+            mk,
             "closed-loop",
             "watch",
             "--scenario",
@@ -408,14 +408,14 @@ def test_closed_loop_watch_replay_realistic_dirty_trace_reports(tmp_path: Path,
     assert artifact_paths.get("last_iteration_explain_path") == str(iter_3_explain)
 
 
-def test_closed_loop_watch_replay_record_raw(tmp_path: Path, mk_path: Path) -> None:
+def test_closed_loop_watch_replay_record_raw(tmp_path: Path, mk: str) -> None:
     out_dir = tmp_path / "raw_watch_out"
     observe_path = _data_path("realistic_dirty.jsonl")
     record_raw_path = tmp_path / "raw.jsonl"
 
     cp = subprocess.run(
         [
-            str(mk_path),
+            mk,
             "closed-loop",
             "watch",
             "--dry-run",
@@ -11,14 +11,14 @@ EXPECTED_SCHEMA_BY_FILENAME = {
     "chords_validate_latest.json": "chords_validate.v0",
 }
 
-def _run(mk: Path, args: list[str], env: dict | None = None) -> subprocess.CompletedProcess[str]:
+def _run(mk: str, args: list[str], env: dict | None = None) -> subprocess.CompletedProcess[str]:
     e = os.environ.copy()
     if env:
         e.update(env)
-    return subprocess.run([str(mk), *args], text=True, capture_output=True, env=e)
+    return subprocess.run([mk, *args], text=True, capture_output=True, env=e)
 
 
-def test_reports_use_v0_contract(mk_path: Path, tmp_path: Path) -> None:
+def test_reports_use_v0_contract(mk: str, tmp_path: Path) -> None:
     observe_out = tmp_path / "observe"
     demo_out = tmp_path / "demo"
     cl_out = tmp_path / "closed_loop"
@@ -26,14 +26,14 @@ def test_reports_use_v0_contract(mk_path: Path, tmp_path: Path) -> None:
     verify_out = tmp_path / "k8s_verify"
     apply_out = tmp_path / "k8s_apply"
 
-    cp = _run(mk_path, ["observe", "--duration", "250ms", "--out", str(observe_out)])
+    cp = _run(mk, ["observe", "--duration", "250ms", "--out", str(observe_out)])
     assert cp.returncode == 0
 
-    cp = _run(mk_path, ["demo", "run", "--scenario", "drift", "--out", str(demo_out)])
+    cp = _run(mk, ["demo", "run", "--scenario", "drift", "--out", str(demo_out)])
     assert cp.returncode == 0
 
     cp = _run(
-        mk_path,
+        mk,
         ["closed-loop", "run", "--scenario", "drift", "--dry-run", "--out", str(cl_out)],
     )
     assert cp.returncode == 0
@@ -42,13 +42,13 @@ def test_reports_use_v0_contract(mk_path: Path, tmp_path: Path) -> None:
     assert plan_path.exists()
 
     cp = _run(
-        mk_path,
+        mk,
         ["k8s", "render", "--plan", str(plan_path), "--out", str(render_out)],
     )
     assert cp.returncode == 0
 
     cp = _run(
-        mk_path,
+        mk,
         ["k8s", "verify", "--plan", str(plan_path), "--out", str(verify_out)],
     )
     assert cp.returncode == 0
@@ -60,7 +60,7 @@ def test_reports_use_v0_contract(mk_path: Path, tmp_path: Path) -> None:
     )
 
     cp = _run(
-        mk_path,
+        mk,
         ["k8s", "apply", "--plan", str(plan_path), "--out", str(apply_out)],
         env={
             "MODEKEEPER_PAID": "1",
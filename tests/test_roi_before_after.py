@@ -11,7 +11,7 @@ def _write_step_time_jsonl(path: Path, values: list[float]) -> None:
     path.write_text("\n".join(json.dumps(row) for row in rows) + "\n", encoding="utf-8")
 
 
-def test_roi_before_after_savings_positive(tmp_path: Path, mk_path: Path) -> None:
+def test_roi_before_after_savings_positive(tmp_path: Path, mk: str) -> None:
     baseline_path = tmp_path / "baseline.jsonl"
     candidate_path = tmp_path / "candidate.jsonl"
     out_dir = tmp_path / "out"
@@ -20,7 +20,7 @@ def test_roi_before_after_savings_positive(tmp_path: Path, mk_path: Path) -> Non
 
     cp = subprocess.run(
         [
-            str(mk_path),
+            mk,
             "roi",
             "before-after",
             "--baseline-path",
@@ -47,7 +47,7 @@ def test_roi_before_after_savings_positive(tmp_path: Path, mk_path: Path) -> Non
     assert float(summary.get("usd_saved_per_hour")) > 0.0
 
 
-def test_roi_before_after_savings_without_usd(tmp_path: Path, mk_path: Path) -> None:
+def test_roi_before_after_savings_without_usd(tmp_path: Path, mk: str) -> None:
     baseline_path = tmp_path / "baseline.jsonl"
     candidate_path = tmp_path / "candidate.jsonl"
     out_dir = tmp_path / "out"
@@ -56,7 +56,7 @@ def test_roi_before_after_savings_without_usd(tmp_path: Path, mk_path: Path) ->
 
     cp = subprocess.run(
         [
-            str(mk_path),
+            mk,
             "roi",
             "before-after",
             "--baseline-path",
@@ -82,7 +82,7 @@ def test_roi_before_after_savings_without_usd(tmp_path: Path, mk_path: Path) ->
     assert "usd_per_gpu_hour_missing" in payload.get("notes", [])
 
 
-def test_roi_before_after_no_savings_when_no_speedup(tmp_path: Path, mk_path: Path) -> None:
+def test_roi_before_after_no_savings_when_no_speedup(tmp_path: Path, mk: str) -> None:
     baseline_path = tmp_path / "baseline.jsonl"
     candidate_path = tmp_path / "candidate.jsonl"
     out_dir = tmp_path / "out"
@@ -91,7 +91,7 @@ def test_roi_before_after_no_savings_when_no_speedup(tmp_path: Path, mk_path: Pa
 
     cp = subprocess.run(
         [
-            str(mk_path),
+            mk,
             "roi",
             "before-after",
             "--baseline-path",
@@ -114,9 +114,9 @@ def test_roi_before_after_no_savings_when_no_speedup(tmp_path: Path, mk_path: Pa
     assert float(summary.get("usd_saved_per_hour")) == 0.0
 
 
-def test_roi_before_after_help_is_wired(mk_path: Path) -> None:
+def test_roi_before_after_help_is_wired(mk: str) -> None:
     roi_help = subprocess.run(
-        [str(mk_path), "roi", "--help"],
+        [mk, "roi", "--help"],
         text=True,
         capture_output=True,
     )
@@ -124,7 +124,7 @@ def test_roi_before_after_help_is_wired(mk_path: Path) -> None:
     assert "before-after" in roi_help.stdout
 
     before_after_help = subprocess.run(
-        [str(mk_path), "roi", "before-after", "--help"],
+        [mk, "roi", "before-after", "--help"],
         text=True,
         capture_output=True,
     )
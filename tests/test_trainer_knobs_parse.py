@@ -20,3 +20,13 @@ modekeeper/knob.unquoted=value
         "empty": "",
         "note": 'has spaces and "quotes"',
     }
+
+
+def test_parse_downward_annotations_skips_malformed_quotes() -> None:
+    text = '''modekeeper/knob.ok="1"
+modekeeper/knob.lone="
+modekeeper/knob.inner="a"b"
+modekeeper/knob.unicode="caf\\u00e9"
+'''
+
+    assert parse_downward_annotations(text) == {"ok": "1", "unicode": "café"}
@@ -1,4 +1,6 @@
-from modekeeper.trainer.__main__ import _knobs_kv, _to_positive_float
+import os
+
+from modekeeper.trainer.__main__ import _knobs_kv, _load_knobs_snapshot, _to_positive_float
 
 
 def test_knobs_kv_is_sorted_and_compact() -> None:
@@ -17,3 +19,31 @@ def test_to_positive_float_uses_default_for_invalid_values() -> None:
     assert _to_positive_float("-3", default=2.0) == 2.0
     assert _to_positive_float("nope", default=2.0) == 2.0
     assert _to_positive_float(None, default=2.0) == 2.0
+
+
+def test_load_knobs_snapshot_reuses_snapshot_while_stat_is_unchanged(tmp_path) -> None:
+    path = tmp_path / "annotations"
+    path.write_text('modekeeper/knob.concurrency="2"\n', encoding="utf-8")
+    os.utime(path, ns=(1_000_000_000, 1_000_000_000))
+
+    first = _load_knobs_snapshot(str(path))
+    assert first.knobs == {"concurrency": "2"}
+    assert first.knobs_kv == "concurrency=2"
+    assert _load_knobs_snapshot(str(path), first) is first
+
+    path.write_text('modekeeper/knob.concurrency="16"\n', encoding="utf-8")
+    os.utime(path, ns=(1_000_000_000, 1_000_000_000))
+    second = _load_knobs_snapshot(str(path), first)
+    assert second.knobs == {"concurrency": "16"}
+    assert second.knobs_kv == "concurrency=16"
+
+    os.utime(path, ns=(2_000_000_000, 2_000_000_000))
+    third = _load_knobs_snapshot(str(path), second)
+    assert third is not second
+    assert third.knobs == {"concurrency": "16"}
+
+
+def test_load_knobs_snapshot_missing_file_is_empty(tmp_path) -> None:
+    snapshot = _load_knobs_snapshot(str(tmp_path / "missing"))
+    assert snapshot.knobs == {}
+    assert snapshot.knobs_kv == ""